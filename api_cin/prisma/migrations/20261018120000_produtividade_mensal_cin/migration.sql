@@ -0,0 +1,111 @@
+-- CreateTable
+CREATE TABLE "produtividade_mensal_cin" (
+    "cin_amplo_geral_id" INTEGER NOT NULL,
+    "mes" DATE NOT NULL,
+    "quantidade" INTEGER NOT NULL,
+    "dias" INTEGER NOT NULL,
+    "updateAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "produtividade_mensal_cin_pkey" PRIMARY KEY ("cin_amplo_geral_id","mes")
+);
+
+-- CreateIndex
+CREATE INDEX "produtividade_mensal_cin_mes_idx" ON "produtividade_mensal_cin"("mes");
+
+-- AddForeignKey
+ALTER TABLE "produtividade_mensal_cin" ADD CONSTRAINT "produtividade_mensal_cin_cin_amplo_geral_id_fkey" FOREIGN KEY ("cin_amplo_geral_id") REFERENCES "cin_amplo_geral"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Soma deltas (positivos ou negativos) por (município, mês) e remove meses que ficaram sem dias
+CREATE FUNCTION "produtividade_mensal_somar"(ids INTEGER[], meses DATE[], quantidades BIGINT[], dias INTEGER[])
+RETURNS void LANGUAGE sql AS $$
+    INSERT INTO "produtividade_mensal_cin" AS m ("cin_amplo_geral_id", "mes", "quantidade", "dias", "updateAt")
+    SELECT u.id, u.mes, SUM(u.quantidade), SUM(u.dias), CURRENT_TIMESTAMP
+    FROM UNNEST(ids, meses, quantidades, dias) AS u(id, mes, quantidade, dias)
+    GROUP BY u.id, u.mes
+    ON CONFLICT ("cin_amplo_geral_id", "mes") DO UPDATE
+    SET "quantidade" = m."quantidade" + EXCLUDED."quantidade",
+        "dias" = m."dias" + EXCLUDED."dias",
+        "updateAt" = EXCLUDED."updateAt";
+
+    DELETE FROM "produtividade_mensal_cin" m
+    USING UNNEST(ids, meses) AS u(id, mes)
+    WHERE m."cin_amplo_geral_id" = u.id AND m."mes" = u.mes AND m."dias" <= 0;
+$$;
+
+-- Trigger por instrução com tabelas de transição: um lote de milhares de linhas vira um único upsert agregado
+CREATE FUNCTION "produtividade_mensal_aplicar"()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    ids INTEGER[];
+    meses DATE[];
+    quantidades BIGINT[];
+    dias INTEGER[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg("cin_amplo_geral_id"), array_agg(date_trunc('month', "data")::date),
+               array_agg("quantidade"::bigint), array_agg(1)
+        INTO ids, meses, quantidades, dias
+        FROM novas;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg("cin_amplo_geral_id"), array_agg(date_trunc('month', "data")::date),
+               array_agg(-"quantidade"::bigint), array_agg(-1)
+        INTO ids, meses, quantidades, dias
+        FROM antigas;
+    ELSE
+        SELECT array_agg(d."cin_amplo_geral_id"), array_agg(date_trunc('month', d."data")::date),
+               array_agg(d."quantidade"), array_agg(d."dias")
+        INTO ids, meses, quantidades, dias
+        FROM (
+            SELECT "cin_amplo_geral_id", "data", "quantidade"::bigint AS "quantidade", 1 AS "dias" FROM novas
+            UNION ALL
+            SELECT "cin_amplo_geral_id", "data", -"quantidade"::bigint, -1 FROM antigas
+        ) d;
+    END IF;
+
+    IF ids IS NOT NULL THEN
+        PERFORM "produtividade_mensal_somar"(ids, meses, quantidades, dias);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER "produtividade_mensal_insert" AFTER INSERT ON "produtividade_diaria_cin"
+REFERENCING NEW TABLE AS novas FOR EACH STATEMENT EXECUTE FUNCTION "produtividade_mensal_aplicar"();
+
+CREATE TRIGGER "produtividade_mensal_update" AFTER UPDATE ON "produtividade_diaria_cin"
+REFERENCING OLD TABLE AS antigas NEW TABLE AS novas FOR EACH STATEMENT EXECUTE FUNCTION "produtividade_mensal_aplicar"();
+
+CREATE TRIGGER "produtividade_mensal_delete" AFTER DELETE ON "produtividade_diaria_cin"
+REFERENCING OLD TABLE AS antigas FOR EACH STATEMENT EXECUTE FUNCTION "produtividade_mensal_aplicar"();
+
+CREATE FUNCTION "produtividade_mensal_truncar"()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM "produtividade_mensal_cin";
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER "produtividade_mensal_truncate" AFTER TRUNCATE ON "produtividade_diaria_cin"
+FOR EACH STATEMENT EXECUTE FUNCTION "produtividade_mensal_truncar"();
+
+-- Reconstrução completa (backfills, cargas com triggers desabilitados, auditoria)
+CREATE FUNCTION "produtividade_mensal_reconstruir"()
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    total INTEGER;
+BEGIN
+    -- Bloqueia escritas na tabela diária durante a reconstrução; leituras continuam
+    LOCK TABLE "produtividade_diaria_cin" IN SHARE MODE;
+    DELETE FROM "produtividade_mensal_cin";
+    INSERT INTO "produtividade_mensal_cin" ("cin_amplo_geral_id", "mes", "quantidade", "dias", "updateAt")
+    SELECT "cin_amplo_geral_id", date_trunc('month', "data")::date, SUM("quantidade"), COUNT(*), CURRENT_TIMESTAMP
+    FROM "produtividade_diaria_cin"
+    GROUP BY "cin_amplo_geral_id", date_trunc('month', "data")::date;
+    GET DIAGNOSTICS total = ROW_COUNT;
+    RETURN total;
+END;
+$$;
+
+-- Backfill
+SELECT "produtividade_mensal_reconstruir"();
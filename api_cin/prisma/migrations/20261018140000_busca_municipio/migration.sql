@@ -0,0 +1,23 @@
+-- Busca de municípios sem acento e sem diferenciar maiúsculas (lib/municipioSearch.ts)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Forma normalizada do nome: sem acentos, minúscula, pontuação e espaços repetidos viram um espaço
+-- ("Dias d'Ávila" -> "dias d avila"). translate() cobre os acentos do português sem depender da
+-- extensão unaccent (cuja função é STABLE e não pode entrar em índice) nem do locale do banco.
+CREATE FUNCTION "normalizar_nome"(texto TEXT)
+RETURNS TEXT LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT btrim(regexp_replace(
+        lower(translate(
+            texto,
+            'ÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑáàâãäéèêëíìîïóòôõöúùûüçñ',
+            'AAAAAEEEEIIIIOOOOOUUUUCNaaaaaeeeeiiiiooooouuuucn'
+        )),
+        '[^a-z0-9]+', ' ', 'g'
+    ))
+$$;
+
+-- Igualdade e prefixo (LIKE 'termo%')
+CREATE INDEX "cin_amplo_geral_nome_busca_idx" ON "cin_amplo_geral" ("normalizar_nome"("nome_municipio") text_pattern_ops);
+
+-- Trechos (LIKE '%termo%') e semelhança com erros de digitação (operador %)
+CREATE INDEX "cin_amplo_geral_nome_busca_trgm_idx" ON "cin_amplo_geral" USING GIN ("normalizar_nome"("nome_municipio") gin_trgm_ops);
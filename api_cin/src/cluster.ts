@@ -0,0 +1,89 @@
+import cluster, { Worker } from 'cluster';
+import os from 'os';
+import logger, { flushLogs } from './lib/logger';
+import { serveSharedStore } from './lib/sharedStore';
+
+// Modo cluster: um worker (src/server.ts) por núcleo, todos na mesma porta.
+//   WEB_CONCURRENCY             -> número de workers (padrão: núcleos disponíveis)
+//   CLUSTER_SHUTDOWN_TIMEOUT_MS -> espera máxima pelo encerramento gracioso de um worker
+// O primário não atende requisições: guarda o estado compartilhado (rate limit, invalidação do
+// cache de respostas, coleta de métricas) e supervisiona os workers.
+// - SIGHUP: reinício gradual, um worker por vez; o novo precisa estar ouvindo antes do antigo sair.
+// - SIGTERM/SIGINT: encerra todos graciosamente.
+// - Worker que cai é substituído.
+const WORKERS = Number(process.env.WEB_CONCURRENCY) || os.availableParallelism();
+const SHUTDOWN_TIMEOUT_MS = Number(process.env.CLUSTER_SHUTDOWN_TIMEOUT_MS) || 30 * 1000;
+const RESPAWN_DELAY_MS = 1000;
+
+const workers = () => Object.values(cluster.workers ?? {}).filter((w): w is Worker => !!w);
+
+// Workers encerrados de propósito (reinício ou shutdown), que não devem ser substituídos
+const retiring = new Set<Worker>();
+let stopping = false;
+let restarting = false;
+
+const retire = (worker: Worker) =>
+  new Promise<void>((resolve) => {
+    if (worker.isDead()) return resolve();
+    retiring.add(worker);
+    const timer = setTimeout(() => worker.kill('SIGKILL'), SHUTDOWN_TIMEOUT_MS);
+    worker.once('exit', () => {
+      clearTimeout(timer);
+      resolve();
+    });
+    if (worker.isConnected()) worker.send('shutdown');
+  });
+
+const listening = (worker: Worker) =>
+  new Promise<void>((resolve, reject) => {
+    worker.once('listening', () => resolve());
+    worker.once('exit', () => reject(new Error(`Worker ${worker.id} exited during startup`)));
+  });
+
+const rollingRestart = async () => {
+  if (restarting || stopping) return;
+  restarting = true;
+  logger.info('Cluster rolling restart', { workers: workers().length });
+  try {
+    for (const worker of workers()) {
+      if (retiring.has(worker)) continue;
+      await listening(cluster.fork());
+      await retire(worker);
+    }
+    logger.info('Cluster rolling restart finished');
+  } catch (e) {
+    logger.error('Cluster rolling restart aborted', { error: (e as Error).message });
+  } finally {
+    restarting = false;
+  }
+};
+
+const stop = async () => {
+  if (stopping) return;
+  stopping = true;
+  logger.info('Cluster shutting down', { workers: workers().length });
+  await Promise.all(workers().map(retire));
+  await flushLogs();
+  process.exit(0);
+};
+
+if (cluster.isPrimary) {
+  serveSharedStore();
+
+  cluster.on('exit', (worker, code, signal) => {
+    if (retiring.delete(worker) || stopping) return;
+    logger.error('Worker died', { worker: worker.id, code, signal });
+    setTimeout(() => {
+      if (!stopping && workers().length < WORKERS) cluster.fork();
+    }, RESPAWN_DELAY_MS);
+  });
+
+  for (let i = 0; i < WORKERS; i++) cluster.fork();
+  logger.info('Cluster started', { pid: process.pid, workers: WORKERS });
+
+  process.on('SIGHUP', rollingRestart);
+  process.on('SIGTERM', stop);
+  process.on('SIGINT', stop);
+} else {
+  import('./server');
+}
\ No newline at end of file
@@ -1,13 +1,14 @@
-import { Request, Response } from 'express';
+import { Response } from 'express';
+import { AuthRequest } from '../../middlewares/auth';
 import { CreateAmploGeralService } from '../../services/AmploGeral/CreateAmploGeralService';
 import { StatusVisita, StatusPublicacao, StatusInstalacao } from '@prisma/client';
 
 export class CreateAmploGeralController {
-  async handle(req: Request, res: Response) {
+  async handle(req: AuthRequest, res: Response) {
     const registros = req.body;
-    const token = req.headers.authorization?.split(' ')[1];
+    const user = req.user;
 
-    if (!token) {
+    if (!user) {
       return res.status(400).json({ error: 'Token inválido' });
     }
 
@@ -77,7 +78,7 @@ export class CreateAmploGeralController {
             status_instalacao,
             publicacao: new Date(publicacao),
           },
-          token
+          user
         );
         resultados.push(result);
       } catch (error: any) {
@@ -0,0 +1,29 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { AMPLO_GERAL_EXPORT_COLUMNS, ExportAmploGeralService } from '../../services/AmploGeral/ExportAmploGeralService';
+import { streamExport } from '../../lib/exportStream';
+import logger from '../../lib/logger';
+
+export class ExportAmploGeralController {
+  async handle(req: Request, res: Response) {
+    const schema = z.object({
+      formato: z.enum(['ndjson', 'csv']).default('ndjson')
+    });
+
+    const parsed = schema.safeParse(req.query);
+    if (!parsed.success) {
+      logger.error('Validation error', { error: parsed.error.message });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: parsed.error.message }
+      });
+    }
+
+    const service = new ExportAmploGeralService();
+    return streamExport(res, {
+      format: parsed.data.formato,
+      filename: 'cin_amplo_geral',
+      columns: AMPLO_GERAL_EXPORT_COLUMNS,
+      batches: service.execute(),
+    });
+  }
+}
\ No newline at end of file
@@ -1,10 +1,20 @@
 import { Request, Response } from 'express';
 import { ListAllAmploGeralService } from '../../services/AmploGeral/ListAllAmploGeralService';
 import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAllAmploGeralController extends BaseController {
   async handle(req: Request, res: Response): Promise<Response> {
-    const service = new ListAllAmploGeralService();
-    return super.handle(req, res, service.execute.bind(service));
+    try {
+      const query = listQuerySchema.parse(req.query);
+      const service = new ListAllAmploGeralService();
+      return super.handle(req, res, service.execute.bind(service), query);
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
   }
 }
\ No newline at end of file
@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { ListByInstalacaoAmploGeralService } from '../../services/AmploGeral/ListAmploGeralByInstalacaoService';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListByInstalacaoAmploGeralController {
   async handle(req: Request, res: Response) {
@@ -21,13 +22,18 @@ export class ListByInstalacaoAmploGeralController {
     // Log da data parseada
     console.log('Parsed date:', new Date(periodo_instalacao).toISOString());
 
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListByInstalacaoAmploGeralService();
 
     try {
-      const result = await service.execute(periodo_instalacao);
+      const result = await service.execute(periodo_instalacao, query.data);
       // Log do resultado
-      console.log('Returning records:', result.length);
-      return res.status(200).json(result);
+      console.log('Returning records:', result.items.length);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(400).json({ error: error.message });
     }
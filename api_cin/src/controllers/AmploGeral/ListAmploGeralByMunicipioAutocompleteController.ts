@@ -9,7 +9,7 @@ export class ListAmploGeralByMunicipioAutocompleteController extends BaseControl
   async handle(req: Request, res: Response): Promise<Response> {
     const schema = z.object({
       query: z.string().min(1, 'Query é obrigatória'),
-      limit: z.coerce.number().int().positive().optional().default(10)
+      limit: z.coerce.number().int().positive().max(50).optional().default(10)
     });
 
     try {
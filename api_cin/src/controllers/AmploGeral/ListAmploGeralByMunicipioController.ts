@@ -3,18 +3,19 @@ import { z } from 'zod';
 import { ListByNomeMunicipioAmploGeralService } from '../../services/AmploGeral/ListAmploGeralByMunicipioService';
 import { BaseController } from '../BaseController';
 import logger from '../../lib/logger';
+import { ListQuery, listQuerySchema } from '../../lib/listQuery';
 import { MunicipioFilter } from '../../types/serviceArgs';
 
 export class ListByNomeMunicipioAmploGeralController extends BaseController {
   async handle(req: Request, res: Response): Promise<Response> {
     const schema = z.object({
       nome_municipio: z.string().min(1, 'Nome do município é obrigatório')
-    });
+    }).and(listQuerySchema);
 
     try {
-      const { nome_municipio } = schema.parse(req.query) as MunicipioFilter;
+      const { nome_municipio, ...query } = schema.parse(req.query) as MunicipioFilter & ListQuery;
       const service = new ListByNomeMunicipioAmploGeralService();
-      return super.handle(req, res, service.execute.bind(service), nome_municipio);
+      return super.handle(req, res, service.execute.bind(service), nome_municipio, query);
     } catch (e: any) {
       logger.error('Validation error', { error: e.message, stack: e.stack });
       return res.status(400).json({
@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralByPeriodoVisitaService } from '../../services/AmploGeral/ListAmploGeralByPeriodoVisitaService';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAmploGeralByPeriodoVisitaController {
   async handle(req: Request, res: Response) {
@@ -9,11 +10,16 @@ export class ListAmploGeralByPeriodoVisitaController {
       return res.status(400).json({ error: 'É preciso inserir uma data válida.' });
     }
 
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListAmploGeralByPeriodoVisitaService();
 
     try {
-      const result = await service.execute(periodo_visita);
-      return res.status(200).json(result);
+      const result = await service.execute(periodo_visita, query.data);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(400).json({ error: error.message });
     }
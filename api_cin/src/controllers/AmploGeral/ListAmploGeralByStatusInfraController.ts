@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralByStatusInfraService } from '../../services/AmploGeral/ListAmploGeralByStatusInfraService';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAmploGeralByStatusInfraController {
   async handle(req: Request, res: Response) {
@@ -9,11 +10,16 @@ export class ListAmploGeralByStatusInfraController {
       return res.status(400).json({ error: 'É necessario inserir o status da infraestrutura.' });
     }
 
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListAmploGeralByStatusInfraService();
 
     try {
-      const result = await service.execute(status_infra);
-      return res.status(200).json(result);
+      const result = await service.execute(status_infra, query.data);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(400).json({ error: error.message });
     }
@@ -1,10 +1,20 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralByStatusVisitaBreakdown } from '../../services/AmploGeral/ListAmploGeralByStatusVisitaBreakdown';
 import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { parseIncluirCidades } from '../../lib/breakdownQuery';
 
 export class ListAmploGeralByStatusVisitaBreakdownController extends BaseController {
   async handle(req: Request, res: Response): Promise<Response> {
-    const service = new ListAmploGeralByStatusVisitaBreakdown();
-    return super.handle(req, res, service.execute.bind(service));
+    try {
+      const incluirCidades = parseIncluirCidades(req.query);
+      const service = new ListAmploGeralByStatusVisitaBreakdown();
+      return super.handle(req, res, service.execute.bind(service), incluirCidades);
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
   }
 }
\ No newline at end of file
@@ -1,6 +1,7 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralByStatusVisitaService } from '../../services/AmploGeral/ListAmploGeralByStatusVisitaService';
 import { StatusVisita } from '@prisma/client';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAmploGeralByStatusVisitaController {
   async handle(req: Request, res: Response) {
@@ -14,11 +15,16 @@ export class ListAmploGeralByStatusVisitaController {
       return res.status(400).json({ error: 'status_visita deve ser Aprovado ou Reprovado' });
     }
 
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListAmploGeralByStatusVisitaService();
 
     try {
-      const result = await service.execute(status_visita as StatusVisita);
-      return res.status(200).json(result);
+      const result = await service.execute(status_visita as StatusVisita, query.data);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(400).json({ error: error.message });
     }
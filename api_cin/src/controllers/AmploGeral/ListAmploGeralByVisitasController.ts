@@ -1,13 +1,19 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralByVisitas } from '../../services/AmploGeral/ListAmploGeralByVisitasService';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAmploGeralByVisitasController {
   async handle(req: Request, res: Response) {
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListAmploGeralByVisitas();
 
     try {
-      const result = await service.execute();
-      return res.status(200).json(result);
+      const result = await service.execute(query.data);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(500).json({ error: 'Erro ao listar cidades para visita', details: error.message });
     }
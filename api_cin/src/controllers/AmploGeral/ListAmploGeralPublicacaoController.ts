@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { ListAmploGeralPublicacaoService } from '../../services/AmploGeral/ListAmploGeralPublicacaoService';
+import { listQuerySchema } from '../../lib/listQuery';
 
 export class ListAmploGeralPublicacaoController {
   async handle(req: Request, res: Response) {
@@ -9,11 +10,16 @@ export class ListAmploGeralPublicacaoController {
       return res.status(400).json({ error: 'É preciso inserir uma data válida.' });
     }
 
+    const query = listQuerySchema.safeParse(req.query);
+    if (!query.success) {
+      return res.status(400).json({ error: query.error.message });
+    }
+
     const service = new ListAmploGeralPublicacaoService();
 
     try {
-      const result = await service.execute(publicacao);
-      return res.status(200).json(result);
+      const result = await service.execute(publicacao, query.data);
+      return res.status(200).json(result.toResponse());
     } catch (error: any) {
       return res.status(400).json({ error: error.message });
     }
@@ -0,0 +1,32 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { STATUS_DIMENSIONS, StatusBreakdownService, StatusDimension } from '../../services/AmploGeral/StatusBreakdownService';
+import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { incluirCidadesParam } from '../../lib/breakdownQuery';
+
+const dimensionNames = Object.keys(STATUS_DIMENSIONS) as [StatusDimension, ...StatusDimension[]];
+
+export class ListAmploGeralStatusBreakdownController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    const schema = z.object({
+      // ?por=status_visita,status_instalacao cruza os enums (tabela cruzada)
+      por: z.preprocess(
+        (value) => (Array.isArray(value) ? value : String(value ?? '').split(',')).filter((v) => v !== ''),
+        z.array(z.enum(dimensionNames)).min(1, 'Informe ao menos um status em "por"')
+      ).refine((dimensions) => new Set(dimensions).size === dimensions.length, { message: 'Status repetido em "por"' }),
+      incluir_cidades: incluirCidadesParam
+    });
+
+    try {
+      const { por, incluir_cidades } = schema.parse(req.query);
+      const service = new StatusBreakdownService();
+      return super.handle(req, res, service.execute.bind(service), { dimensions: por, includeCities: incluir_cidades });
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
+  }
+}
\ No newline at end of file
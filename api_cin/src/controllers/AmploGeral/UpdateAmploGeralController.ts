@@ -1,12 +1,13 @@
-import { Request, Response } from 'express';
+import { Response } from 'express';
+import { AuthRequest } from '../../middlewares/auth';
 import { UpdateAmploGeralService } from '../../services/AmploGeral/UpdateAmploGeralService';
 import { StatusVisita, StatusPublicacao, StatusInstalacao } from '@prisma/client';
 
 export class UpdateAmploGeralController {
-  async handle(req: Request, res: Response) {
+  async handle(req: AuthRequest, res: Response) {
     const { id } = req.params;
     const { nome_municipio, status_infra, periodo_visita, status_visita, status_publicacao, status_instalacao, publicacao, periodo_instalacao } = req.body;
-    const token = req.headers.authorization?.split(' ')[1];
+    const user = req.user;
 
     if (!id || isNaN(Number(id)) || Number(id) <= 0) {
       return res.status(400).json({ error: 'ID é obrigatório e deve ser um número inteiro positivo.' });
@@ -16,7 +17,7 @@ export class UpdateAmploGeralController {
       return res.status(400).json({ error: 'Pelo menos um campo deve ser fornecido para atualização.' });
     }
 
-    if (!token) {
+    if (!user) {
       return res.status(400).json({ error: 'Token inválido' });
     }
 
@@ -59,7 +60,7 @@ export class UpdateAmploGeralController {
           publicacao: publicacao ? new Date(publicacao) : undefined,
           periodo_instalacao: periodo_instalacao ? new Date(periodo_instalacao) : undefined,
         },
-        token
+        user
       );
       return res.status(200).json(result);
     } catch (error: any) {
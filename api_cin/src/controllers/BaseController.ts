@@ -1,10 +1,14 @@
 import { Request, Response } from 'express';
 import logger from '../lib/logger';
+import { Page } from '../lib/listQuery';
 
 export class BaseController {
   protected async handle<T>(req: Request, res: Response, serviceFn: (...args: any[]) => Promise<T>, ...args: any[]): Promise<Response> {
     try {
       const result = await serviceFn(...args);
+      if (result instanceof Page) {
+        return res.status(200).json({ data: result.items, meta: result.meta });
+      }
       return res.status(200).json({
         data: result,
         meta: result && Array.isArray(result) ? { count: result.length } : {}
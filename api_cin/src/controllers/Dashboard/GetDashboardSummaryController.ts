@@ -0,0 +1,10 @@
+import { Request, Response } from 'express';
+import { GetDashboardSummaryService } from '../../services/Dashboard/GetDashboardSummaryService';
+import { BaseController } from '../BaseController';
+
+export class GetDashboardSummaryController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    const service = new GetDashboardSummaryService();
+    return super.handle(req, res, service.execute.bind(service));
+  }
+}
\ No newline at end of file
@@ -0,0 +1,27 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { GetMapaMetricaService } from '../../services/Dashboard/GetMapaMetricaService';
+import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { MapaMetricaFilter } from '../../types/serviceArgs';
+
+export class GetMapaMetricaController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    const schema = z.object({
+      metrica: z.enum(['status', 'produtividade', 'faixa']).optional().default('status'),
+      ano: z.coerce.number().int().min(2000).max(2030).optional().default(new Date().getUTCFullYear()),
+      mes: z.coerce.number().int().min(1).max(12).optional()
+    });
+
+    try {
+      const filter = schema.parse(req.query) as MapaMetricaFilter;
+      const service = new GetMapaMetricaService();
+      return super.handle(req, res, service.execute.bind(service), filter);
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
+  }
+}
\ No newline at end of file
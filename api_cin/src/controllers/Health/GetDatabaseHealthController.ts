@@ -0,0 +1,15 @@
+import { Request, Response } from 'express';
+import { hasMetricsAccess } from '../../lib/metrics';
+import { getDatabaseStatus, getPoolMetrics } from '../../lib/prisma';
+import { BaseController } from '../BaseController';
+
+export class GetDatabaseHealthController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    // Contagens do pool só com o token de métricas; sem ele, apenas up/down (503 quando fora do ar)
+    if (!hasMetricsAccess(req)) {
+      const status = await getDatabaseStatus();
+      return res.status(status === 'up' ? 200 : 503).json({ data: { status }, meta: {} });
+    }
+    return super.handle(req, res, getPoolMetrics);
+  }
+}
\ No newline at end of file
@@ -1,12 +1,13 @@
-import { Request, Response } from 'express';
+import { Response } from 'express';
+import { AuthRequest } from '../../middlewares/auth';
 import { CreateProdutividadeDiaria } from '../../services/ProdutividadeDiaria/CreateProdutividadeDiariaService'; 
 
 export class CreateProdutividadeDiariaController {
-  async handle(req: Request, res: Response) {
+  async handle(req: AuthRequest, res: Response) {
     const registros = req.body;
-    const token = req.headers.authorization?.split(' ')[1];
+    const user = req.user;
 
-    if (!token) {
+    if (!user) {
       return res.status(400).json({ error: 'Token inválido' });
     }
 
@@ -33,7 +34,7 @@ export class CreateProdutividadeDiariaController {
             data: new Date(data),
             quantidade,
           },
-          token
+          user
         );
         resultados.push(result);
       } catch (error: any) {
@@ -0,0 +1,39 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { ExportProdutividadeDiariaService, PRODUTIVIDADE_EXPORT_COLUMNS } from '../../services/ProdutividadeDiaria/ExportProdutividadeDiariaService';
+import { streamExport } from '../../lib/exportStream';
+import { isoDate } from '../../lib/listQuery';
+import logger from '../../lib/logger';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+export class ExportProdutividadeDiariaController {
+  async handle(req: Request, res: Response) {
+    const schema = z.object({
+      formato: z.enum(['ndjson', 'csv']).default('ndjson'),
+      inicio: isoDate.optional(),
+      fim: isoDate.optional(),
+      cin_amplo_geral_id: z.coerce.number().int().positive().optional()
+    }).refine(({ inicio, fim }) => !inicio || !fim || fim >= inicio, {
+      message: 'fim deve ser >= inicio'
+    });
+
+    const parsed = schema.safeParse(req.query);
+    if (!parsed.success) {
+      logger.error('Validation error', { error: parsed.error.message });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: parsed.error.message }
+      });
+    }
+
+    const { formato, inicio, fim, cin_amplo_geral_id } = parsed.data;
+    const service = new ExportProdutividadeDiariaService();
+    return streamExport(res, {
+      format: formato,
+      filename: 'produtividade_diaria_cin',
+      columns: PRODUTIVIDADE_EXPORT_COLUMNS,
+      // fim é inclusivo na URL; o serviço trabalha com [inicio, fim)
+      batches: service.execute({ inicio, fim: fim && new Date(fim.getTime() + DAY_MS), cin_amplo_geral_id }),
+    });
+  }
+}
\ No newline at end of file
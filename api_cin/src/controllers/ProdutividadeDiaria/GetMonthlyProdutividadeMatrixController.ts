@@ -0,0 +1,42 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { GetMonthlyProductivityMatrixService } from '../../services/ProdutividadeDiaria/GetMonthlyProdutividadeMatrixService';
+import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { MonthlyMatrixFilter } from '../../types/serviceArgs';
+
+const MAX_MUNICIPIOS = 50;
+const MAX_ANOS = 10;
+
+export class GetMonthlyProductivityMatrixController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    const schema = z.object({
+      // Aceita ?cin_amplo_geral_ids=1,2,3 ou o parâmetro repetido
+      cin_amplo_geral_ids: z.preprocess(
+        (value) => (Array.isArray(value) ? value : String(value ?? '').split(',')).filter((v) => v !== ''),
+        z.array(z.coerce.number().int().positive()).min(1, 'Informe ao menos um cin_amplo_geral_id').max(MAX_MUNICIPIOS)
+      ),
+      ano_inicio: z.coerce.number().int().min(2000).max(2030),
+      ano_fim: z.coerce.number().int().min(2000).max(2030)
+    }).refine(({ ano_inicio, ano_fim }) => ano_fim >= ano_inicio && ano_fim - ano_inicio < MAX_ANOS, {
+      message: `ano_fim deve ser >= ano_inicio, com no máximo ${MAX_ANOS} anos`
+    });
+
+    try {
+      const filter = schema.parse(req.query) as MonthlyMatrixFilter;
+      const service = new GetMonthlyProductivityMatrixService();
+      const result = await service.execute(filter);
+      if (!result) {
+        return res.status(404).json({
+          error: { code: 'NOT_FOUND', message: 'Município não encontrado em cin_amplo_geral' }
+        });
+      }
+      return super.handle(req, res, () => Promise.resolve(result));
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
+  }
+}
\ No newline at end of file
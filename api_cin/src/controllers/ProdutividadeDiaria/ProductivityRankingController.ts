@@ -0,0 +1,37 @@
+import { Request, Response } from 'express';
+import { z } from 'zod';
+import { ProductivityRankingService } from '../../services/ProdutividadeDiaria/ProductivityRankingService';
+import { BaseController } from '../BaseController';
+import logger from '../../lib/logger';
+import { isoDate } from '../../lib/listQuery';
+import { RankingFilter } from '../../types/serviceArgs';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+export class ProductivityRankingController extends BaseController {
+  async handle(req: Request, res: Response): Promise<Response> {
+    const schema = z.object({
+      inicio: isoDate,
+      fim: isoDate,
+      limit: z.coerce.number().int().positive().max(100).optional().default(5)
+    }).refine(({ inicio, fim }) => !isNaN(inicio.getTime()) && !isNaN(fim.getTime()) && fim >= inicio, {
+      message: 'fim deve ser uma data válida >= inicio'
+    });
+
+    try {
+      const { inicio, fim, limit } = schema.parse(req.query) as RankingFilter;
+      const service = new ProductivityRankingService();
+      // fim é inclusivo na URL; o serviço trabalha com [inicio, fim)
+      return super.handle(req, res, service.execute.bind(service), {
+        inicio,
+        fim: new Date(fim.getTime() + DAY_MS),
+        limit
+      });
+    } catch (e: any) {
+      logger.error('Validation error', { error: e.message, stack: e.stack });
+      return res.status(400).json({
+        error: { code: 'VALIDATION_ERROR', message: e.message }
+      });
+    }
+  }
+}
\ No newline at end of file
@@ -1,11 +1,12 @@
-import { Request, Response } from 'express';
+import { Response } from 'express';
+import { AuthRequest } from '../../middlewares/auth';
 import { UpdateProdutividadeDiariaService } from '../../services/ProdutividadeDiaria/UpdateProdutividadeDiariaService';
 
 export class UpdateProdutividadeDiariaController {
-  async handle(req: Request, res: Response) {
+  async handle(req: AuthRequest, res: Response) {
     const { id } = req.params;
     const { cin_amplo_geral_id, data, quantidade } = req.body;
-    const token = req.headers.authorization?.split(' ')[1];
+    const user = req.user;
 
     if (!id || isNaN(Number(id)) || Number(id) <= 0) {
       return res.status(400).json({ error: 'ID é obrigatório e deve ser um número inteiro positivo.' });
@@ -15,7 +16,7 @@ export class UpdateProdutividadeDiariaController {
       return res.status(400).json({ error: 'Pelo menos um campo (cin_amplo_geral_id, data, quantidade) deve ser fornecido.' });
     }
 
-    if (!token) {
+    if (!user) {
       return res.status(400).json({ error: 'Token inválido' });
     }
 
@@ -41,7 +42,7 @@ export class UpdateProdutividadeDiariaController {
           data: data ? new Date(data) : undefined,
           quantidade: quantidade !== undefined ? Number(quantidade) : undefined,
         },
-        token
+        user
       );
       return res.status(200).json(result);
     } catch (error: any) {
@@ -0,0 +1,72 @@
+import { Response } from 'express';
+import { AuthRequest } from '../../middlewares/auth';
+import { z } from 'zod';
+import {
+  UpsertProdutividadeDiariaLoteService,
+  ProdutividadeDiariaLoteRow,
+  ProdutividadeDiariaLoteReject,
+} from '../../services/ProdutividadeDiaria/UpsertProdutividadeDiariaLoteService';
+import logger from '../../lib/logger';
+
+const MAX_REGISTROS_POR_LOTE = 5000;
+
+const rowSchema = z.object({
+  cin_amplo_geral_id: z.coerce.number().int().positive(),
+  data: z.string().refine(value => !isNaN(Date.parse(value)), 'Formato de data inválido. Use YYYY-MM-DD.'),
+  quantidade: z.coerce.number().int().nonnegative(),
+});
+
+// Normaliza para meia-noite UTC do dia informado, para que o mesmo dia caia sempre na mesma chave única
+const toUtcDay = (value: string) => {
+  const parsed = new Date(value);
+  return new Date(Date.UTC(parsed.getUTCFullYear(), parsed.getUTCMonth(), parsed.getUTCDate()));
+};
+
+export class UpsertProdutividadeDiariaLoteController {
+  async handle(req: AuthRequest, res: Response) {
+    const registros = req.body;
+    const user = req.user;
+
+    if (!user) {
+      return res.status(400).json({ error: 'Token inválido' });
+    }
+
+    if (!Array.isArray(registros) || registros.length === 0) {
+      return res.status(400).json({ error: 'Nenhum registro enviado.' });
+    }
+
+    if (registros.length > MAX_REGISTROS_POR_LOTE) {
+      return res.status(413).json({ error: `Máximo de ${MAX_REGISTROS_POR_LOTE} registros por lote.` });
+    }
+
+    const rows: ProdutividadeDiariaLoteRow[] = [];
+    const rejected: ProdutividadeDiariaLoteReject[] = [];
+
+    registros.forEach((registro, index) => {
+      const parsed = rowSchema.safeParse(registro);
+      if (!parsed.success) {
+        rejected.push({ index, motivo: parsed.error.issues.map(issue => `${issue.path.join('.')}: ${issue.message}`).join('; ') });
+        return;
+      }
+      rows.push({ index, ...parsed.data, data: toUtcDay(parsed.data.data) });
+    });
+
+    if (rows.length === 0) {
+      return res.status(400).json({ error: 'Nenhum registro válido no lote.', rejected });
+    }
+
+    const service = new UpsertProdutividadeDiariaLoteService();
+
+    try {
+      const result = await service.execute(rows, user);
+      return res.status(200).json({
+        ...result,
+        received: registros.length,
+        rejected: [...rejected, ...result.rejected].sort((a, b) => a.index - b.index),
+      });
+    } catch (error: any) {
+      logger.error('Batch upsert error', { error: error.message, stack: error.stack });
+      return res.status(400).json({ error: error.message });
+    }
+  }
+}
@@ -1,11 +1,10 @@
 import { Request, Response } from 'express';
 import { z } from 'zod';
 import bcrypt from 'bcrypt';
-import { PrismaClient } from '@prisma/client';
+
 import { BaseController } from '../BaseController';
 import logger from '../../lib/logger'; 
-
-const prisma = new PrismaClient();
+import prisma from '../../lib/prisma';
 
 export class CreateUserController {
   async handle(req: Request, res: Response) {
@@ -21,14 +21,22 @@ export * from './AmploGeral/ListAmploGeralByVisitedCitiesController';
 export * from './AmploGeral/ListAmploGeralByStatusVisitaBreakdownController';
 export * from './AmploGeral/ListAmploGeralByStatusPublicacaoBreakdownController';
 export * from './AmploGeral/ListAmploGeralByStatusInstalacaoBreakdownController';
+export * from './AmploGeral/ListAmploGeralStatusBreakdownController';
 export * from './AmploGeral/ListAmploGeralByMunicipioController';
 export * from './AmploGeral/ListAmploGeralByMunicipioAutocompleteController';
+export * from './AmploGeral/ExportAmploGeralController';
 export * from './ProdutividadeDiaria/CreateProdutividadeDiariaController';
 export * from './ProdutividadeDiaria/UpdateProdutividadeDiariaController';
 export * from './ProdutividadeDiaria/DeleteProdutividadeDiariaController';
 export * from './ProdutividadeDiaria/GetMonthlyProdutividadeDiariaController';
+export * from './ProdutividadeDiaria/GetMonthlyProdutividadeMatrixController';
 export * from './ProdutividadeDiaria/ListTopProdutividadeDiariaController';
 export * from './ProdutividadeDiaria/ListLeastProdutividadeDiariaController';
 export * from './ProdutividadeDiaria/ListTopAndLeastProdutividadeDiariaController';
+export * from './ProdutividadeDiaria/ProductivityRankingController';
 export * from './ProdutividadeDiaria/ListProdutividadeByCidadeController';
-export * from './ProdutividadeDiaria/ListProdutividadeGeralMensalController';
\ No newline at end of file
+export * from './ProdutividadeDiaria/ListProdutividadeGeralMensalController';
+export * from './ProdutividadeDiaria/UpsertProdutividadeDiariaLoteController';
+export * from './ProdutividadeDiaria/ExportProdutividadeDiariaController';
+export * from './Dashboard/GetDashboardSummaryController';
+export * from './Health/GetDatabaseHealthController';
\ No newline at end of file
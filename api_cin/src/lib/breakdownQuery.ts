@@ -0,0 +1,12 @@
+import { Request } from 'express';
+import { z } from 'zod';
+
+// ?incluir_cidades=false nas rotas de status devolve só contagens e percentuais (gráficos de pizza)
+export const incluirCidadesParam = z.enum(['true', 'false']).default('true').transform((value) => value === 'true');
+
+const breakdownQuerySchema = z.object({ incluir_cidades: incluirCidadesParam });
+
+// Lança ZodError para valores fora de true/false; os controllers respondem 400
+export function parseIncluirCidades(query: Request['query']): boolean {
+  return breakdownQuerySchema.parse(query).incluir_cidades;
+}
\ No newline at end of file
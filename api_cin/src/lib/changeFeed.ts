@@ -0,0 +1,88 @@
+import { Request, Response } from 'express';
+import logger from './logger';
+import { CacheTag } from './responseCache';
+import { sharedStore } from './sharedStore';
+
+// Feed de mudanças em GET /v1/events (Server-Sent Events) para as dashboards pararem de consultar
+// por tempo. Os services de escrita chamam publishChange depois de gravar; cada cliente recebe
+//   event: change
+//   data: {"entity":"produtividade","ids":[12],"municipios":["Camaçari"],"meses":["2025-03"]}
+// e invalida só as consultas afetadas. A cada EVENTS_HEARTBEAT_MS sai um "event: ping", que o
+// cliente usa para saber que a conexão está viva. Não há replay: quem reconecta invalida tudo.
+// - EVENTS_MAX_CLIENTS: conexões abertas por processo; acima disso, 503 (o cliente tenta de novo).
+// - No cluster, o evento chega aos clientes dos outros workers pelo SharedStore.
+export type ChangeEntity = CacheTag;
+
+export interface ChangeEvent {
+  entity: ChangeEntity;
+  ids: number[];
+  municipios: string[];
+  meses?: string[]; // AAAA-MM das produtividades gravadas
+}
+
+interface ChangeInput {
+  entity: ChangeEntity;
+  ids: number[];
+  municipios: string[];
+  datas?: Date[];
+}
+
+const HEARTBEAT_MS = Number(process.env.EVENTS_HEARTBEAT_MS) || 25 * 1000;
+const MAX_CLIENTS = Number(process.env.EVENTS_MAX_CLIENTS) || 1000;
+const RETRY_MS = 5000;
+// Cliente que não lê (aba congelada, rede parada) e acumula mais que isso no buffer é desconectado
+const MAX_BUFFERED_BYTES = 64 * 1024;
+const CHANNEL = 'changes';
+
+const clients = new Set<Response>();
+
+const send = (frame: string) => {
+  for (const res of clients) {
+    if (res.writableLength > MAX_BUFFERED_BYTES) {
+      clients.delete(res);
+      res.destroy();
+      continue;
+    }
+    res.write(frame);
+  }
+};
+
+const deliver = (event: ChangeEvent) => send(`event: change\ndata: ${JSON.stringify(event)}\n\n`);
+
+sharedStore.subscribe(CHANNEL, (event) => deliver(event as ChangeEvent));
+
+setInterval(() => send('event: ping\ndata: {}\n\n'), HEARTBEAT_MS).unref();
+
+const unique = <T>(values: T[]) => [...new Set(values)];
+
+export function publishChange({ entity, ids, municipios, datas }: ChangeInput) {
+  const event: ChangeEvent = { entity, ids: unique(ids), municipios: unique(municipios) };
+  if (datas) event.meses = unique(datas.map(data => data.toISOString().slice(0, 7))).sort();
+  deliver(event);
+  sharedStore.broadcast(CHANNEL, event);
+}
+
+export function eventsHandler(req: Request, res: Response) {
+  if (clients.size >= MAX_CLIENTS) {
+    logger.warn('Change feed full', { clients: clients.size });
+    return res.status(503).json({ error: { code: 'TOO_MANY_CONNECTIONS', message: 'Muitas conexões abertas, tente novamente mais tarde' } });
+  }
+
+  res.status(200);
+  res.setHeader('Content-Type', 'text/event-stream; charset=utf-8');
+  res.setHeader('Cache-Control', 'no-cache, no-transform');
+  res.setHeader('Connection', 'keep-alive');
+  res.setHeader('X-Accel-Buffering', 'no'); // nginx: não segurar os eventos no buffer do proxy
+  res.flushHeaders();
+  res.write(`retry: ${RETRY_MS}\n\n`);
+
+  clients.add(res);
+  res.on('close', () => clients.delete(res));
+}
+
+// Encerramento do servidor: fecha os streams para o server.close não esperar por eles; o
+// EventSource reconecta em outro worker
+export function closeChangeFeed() {
+  for (const res of clients) res.end();
+  clients.clear();
+}
\ No newline at end of file
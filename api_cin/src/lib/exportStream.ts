@@ -0,0 +1,85 @@
+import { Response } from 'express';
+import logger from './logger';
+
+// Exportação em streaming: os services entregam lotes (cursor por id) e cada lote vira um
+// pedaço NDJSON ou CSV escrito direto na resposta. Quando o buffer do socket enche, o próximo
+// lote só é buscado depois do 'drain', então a memória fica em ~1 lote independente do total.
+export type ExportFormat = 'ndjson' | 'csv';
+
+export const EXPORT_BATCH_SIZE = Number(process.env.EXPORT_BATCH_SIZE) || 5000;
+
+const CONTENT_TYPES: Record<ExportFormat, string> = {
+  ndjson: 'application/x-ndjson; charset=utf-8',
+  csv: 'text/csv; charset=utf-8',
+};
+
+const csvValue = (value: unknown) => {
+  if (value === null || value === undefined) return '';
+  const text = value instanceof Date ? value.toISOString() : String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const encode = (format: ExportFormat, columns: string[], rows: Record<string, unknown>[]) =>
+  format === 'csv'
+    ? rows.map(row => columns.map(column => csvValue(row[column])).join(',') + '\r\n').join('')
+    : rows.map(row => JSON.stringify(row) + '\n').join('');
+
+// Resolve no 'drain' ou quando o cliente desconecta (nesse caso o laço para no próximo lote)
+const drained = (res: Response) =>
+  new Promise<void>((resolve) => {
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.on('drain', done);
+    res.on('close', done);
+  });
+
+interface ExportOptions<T> {
+  format: ExportFormat;
+  filename: string;
+  columns: string[];
+  batches: AsyncIterable<T[]>;
+}
+
+export async function streamExport<T extends Record<string, unknown>>(res: Response, options: ExportOptions<T>) {
+  const { format, filename, columns, batches } = options;
+  const started = Date.now();
+  let rows = 0;
+  // O cabeçalho CSV sai junto com o primeiro lote: se a primeira consulta falhar ainda dá para responder 500
+  let pending = format === 'csv' ? columns.join(',') + '\r\n' : '';
+
+  // Status e cabeçalhos de download só junto do primeiro pedaço: se a primeira consulta falhar, o 500
+  // em JSON sai sem Content-Disposition nem Content-Type de CSV
+  const start = () => {
+    res.status(200);
+    res.setHeader('Content-Type', CONTENT_TYPES[format]);
+    res.setHeader('Content-Disposition', `attachment; filename="${filename}.${format}"`);
+    res.setHeader('Cache-Control', 'no-store');
+  };
+
+  try {
+    for await (const batch of batches) {
+      if (res.destroyed) break;
+      rows += batch.length;
+      const chunk = pending + encode(format, columns, batch);
+      pending = '';
+      if (!res.headersSent) start();
+      if (!res.write(chunk)) await drained(res);
+    }
+  } catch (e: any) {
+    logger.error('Export error', { filename, rows, error: e.message, stack: e.stack });
+    // Cabeçalhos já enviados: cortar a conexão sinaliza o arquivo incompleto ao cliente
+    if (res.headersSent) return res.destroy(e);
+    return res.status(500).json({ error: { code: 'INTERNAL_SERVER_ERROR', message: e.message } });
+  }
+
+  if (res.destroyed) {
+    logger.info('Export aborted by client', { filename, rows, ms: Date.now() - started });
+    return;
+  }
+  if (!res.headersSent) start(); // exportação vazia
+  res.end(pending);
+  logger.info('Export finished', { filename, format, rows, ms: Date.now() - started });
+}
\ No newline at end of file
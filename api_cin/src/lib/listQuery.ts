@@ -0,0 +1,105 @@
+import { Prisma } from '@prisma/client';
+import { z } from 'zod';
+
+// Parâmetros comuns das listagens de cin_amplo_geral:
+//   ?limit=50&cursor=<id>        paginação por chave (id > cursor, ordenado por id); meta.nextCursor aponta a próxima página
+//   ?fields=id,nome_municipio    projeção de colunas; "produtividades_diarias" inclui a relação
+//   ?produtividade_inicio=AAAA-MM-DD&produtividade_fim=AAAA-MM-DD&produtividade_limit=30
+//                                recorte da produtividade diária aninhada (fim inclusivo; limit = dias mais recentes)
+// Sem limit/cursor a resposta mantém o formato antigo (lista completa).
+export const MAX_PAGE_SIZE = 500;
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const RELATION = 'produtividades_diarias';
+
+const scalarFields = Object.values(Prisma.Cin_amplo_geralScalarFieldEnum);
+export type AmploGeralField = Prisma.Cin_amplo_geralScalarFieldEnum | typeof RELATION;
+const fieldNames = [...scalarFields, RELATION] as [AmploGeralField, ...AmploGeralField[]];
+
+export const isoDate = z.string().regex(/^\d{4}-\d{2}-\d{2}$/, 'Use o formato AAAA-MM-DD').transform((value) => new Date(`${value}T00:00:00.000Z`));
+
+export const listQuerySchema = z.object({
+  cursor: z.coerce.number().int().positive().optional(),
+  limit: z.coerce.number().int().positive().max(MAX_PAGE_SIZE).optional(),
+  fields: z.preprocess(
+    (value) => (value === undefined ? undefined : String(value).split(',').filter((v) => v !== '')),
+    z.array(z.enum(fieldNames)).min(1, 'Informe ao menos um campo em "fields"').optional()
+  ),
+  produtividade_inicio: isoDate.optional(),
+  produtividade_fim: isoDate.optional(),
+  produtividade_limit: z.coerce.number().int().positive().max(MAX_PAGE_SIZE).optional()
+}).refine(({ produtividade_inicio, produtividade_fim }) => !produtividade_inicio || !produtividade_fim || produtividade_fim >= produtividade_inicio, {
+  message: 'produtividade_fim deve ser >= produtividade_inicio'
+});
+
+export type ListQuery = z.infer<typeof listQuerySchema>;
+
+export class Page<T> {
+  // nextCursor: undefined = requisição sem paginação; null = última página
+  constructor(readonly items: T[], readonly nextCursor?: number | null) {}
+
+  get meta() {
+    return this.nextCursor === undefined
+      ? { count: this.items.length }
+      : { count: this.items.length, nextCursor: this.nextCursor };
+  }
+
+  // Formato dos controllers que respondem a lista pura: só ganha envelope quando paginado
+  toResponse() {
+    return this.nextCursor === undefined ? this.items : { data: this.items, meta: this.meta };
+  }
+}
+
+const produtividadeArgs = (query: ListQuery) => {
+  const data: Prisma.DateTimeFilter = {};
+  if (query.produtividade_inicio) data.gte = query.produtividade_inicio;
+  if (query.produtividade_fim) data.lt = new Date(query.produtividade_fim.getTime() + DAY_MS);
+
+  return {
+    where: { data },
+    // Com limite pega os dias mais recentes; toPage devolve em ordem cronológica
+    orderBy: { data: query.produtividade_limit ? 'desc' : 'asc' } as const,
+    take: query.produtividade_limit,
+  };
+};
+
+// Argumentos do findMany: filtro do service + cursor, ordenação estável, projeção e recorte da relação
+export function listArgs(
+  query: ListQuery,
+  where: Prisma.cin_amplo_geralWhereInput = {},
+  withProdutividade = false
+): Prisma.cin_amplo_geralFindManyArgs {
+  const args: Prisma.cin_amplo_geralFindManyArgs = {
+    where: query.cursor ? { AND: [where, { id: { gt: query.cursor } }] } : where,
+    orderBy: { id: 'asc' },
+    // Uma linha a mais indica se existe próxima página
+    take: query.limit ? query.limit + 1 : undefined,
+  };
+
+  if (query.fields) {
+    // id sempre acompanha a projeção: é a chave do cursor
+    args.select = {
+      ...Object.fromEntries(query.fields.map((field) => [field, field === RELATION ? produtividadeArgs(query) : true])),
+      id: true,
+    } as Prisma.cin_amplo_geralSelect;
+  } else if (withProdutividade) {
+    args.include = { produtividades_diarias: produtividadeArgs(query) };
+  }
+
+  return args;
+}
+
+type ListedRow = { id?: number; produtividades_diarias?: unknown[] };
+
+export function toPage<T>(rows: T[], query: ListQuery): Page<T> {
+  if (query.produtividade_limit) {
+    for (const row of rows) (row as ListedRow).produtividades_diarias?.reverse();
+  }
+  if (query.limit === undefined && query.cursor === undefined) {
+    return new Page(rows);
+  }
+
+  const items = query.limit ? rows.slice(0, query.limit) : rows;
+  const hasMore = query.limit !== undefined && rows.length > query.limit;
+  return new Page(items, hasMore ? (items[items.length - 1] as ListedRow).id ?? null : null);
+}
\ No newline at end of file
@@ -1,16 +1,144 @@
+import fs from 'fs';
+import path from 'path';
 import winston from 'winston';
 
+// Logs fora do caminho da requisição:
+// - cada destino (console, logs/error.log, logs/combined.log) tem uma fila limitada a LOG_QUEUE_MAX linhas,
+//   gravada em lote a cada LOG_FLUSH_MS. Com a fila cheia (disco ou stdout lentos) a linha é descartada
+//   e contada em vez de segurar a requisição.
+// - LOG_SAMPLE_RATES amostra por nível, ex.: "info=0.1,debug=0" (níveis não listados passam sempre).
+// As contagens de descartes aparecem em GET /metrics (lib/metrics.ts).
+// O timer do lote não segura o processo (unref); o que ficou na fila é gravado em beforeExit,
+// uncaughtException e SIGTERM (ver o fim do arquivo). server.ts e cluster.ts chamam flushLogs no encerramento.
+const QUEUE_MAX = Number(process.env.LOG_QUEUE_MAX) || 10000;
+const FLUSH_MS = Number(process.env.LOG_FLUSH_MS) || 200;
+const MESSAGE = Symbol.for('message');
+
+const parseRates = (spec = '') =>
+  new Map(
+    spec
+      .split(',')
+      .map(part => part.split('=').map(item => item.trim()))
+      .filter(([level, rate]) => level && rate !== undefined && !Number.isNaN(Number(rate)))
+      .map(([level, rate]) => [level, Number(rate)] as const)
+  );
+
+const sampleRates = parseRates(process.env.LOG_SAMPLE_RATES);
+const sampledOut = new Map<string, number>();
+
+const sample = winston.format((info) => {
+  const rate = sampleRates.get(info.level) ?? 1;
+  if (rate >= 1 || Math.random() < rate) return info;
+  sampledOut.set(info.level, (sampledOut.get(info.level) ?? 0) + 1);
+  return false;
+});
+
+class BatchedTransport extends winston.Transport {
+  private queue: string[] = [];
+  private timer?: NodeJS.Timeout;
+  private blocked = false;
+  dropped = 0;
+
+  constructor(readonly target: string, private readonly stream: NodeJS.WritableStream, level?: string) {
+    super({ level });
+  }
+
+  log(info: Record<string | symbol, unknown>, callback: () => void) {
+    if (this.queue.length >= QUEUE_MAX) {
+      this.dropped++;
+    } else {
+      this.queue.push(String(info[MESSAGE]));
+      if (!this.timer) {
+        this.timer = setTimeout(this.flush, FLUSH_MS);
+        this.timer.unref();
+      }
+    }
+    callback();
+  }
+
+  get pending() {
+    return this.queue.length > 0;
+  }
+
+  private take() {
+    const batch = this.queue.length ? `${this.queue.join('\n')}\n` : '';
+    this.queue = [];
+    return batch;
+  }
+
+  private flush = () => {
+    this.timer = undefined;
+    if (this.blocked) return; // o 'drain' retoma a gravação
+    const batch = this.take();
+    if (batch && !this.stream.write(batch)) {
+      this.blocked = true;
+      this.stream.once('drain', () => {
+        this.blocked = false;
+        this.flush();
+      });
+    }
+  };
+
+  // Grava o que restou na fila e espera o destino aceitar (encerramento do processo)
+  flushNow() {
+    clearTimeout(this.timer);
+    this.timer = undefined;
+    const batch = this.take();
+    return new Promise<void>(resolve => (batch ? this.stream.write(batch, () => resolve()) : resolve()));
+  }
+}
+
+const logFile = (name: string) => {
+  fs.mkdirSync('logs', { recursive: true });
+  return fs.createWriteStream(path.join('logs', name), { flags: 'a' });
+};
+
+const transports = [
+  new BatchedTransport('console', process.stdout),
+  new BatchedTransport('error.log', logFile('error.log'), 'error'),
+  new BatchedTransport('combined.log', logFile('combined.log')),
+];
+
 const logger = winston.createLogger({
-  level: 'info',
+  level: process.env.LOG_LEVEL || 'info',
   format: winston.format.combine(
+    sample(),
     winston.format.timestamp(),
     winston.format.json()
   ),
-  transports: [
-    new winston.transports.Console(),
-    new winston.transports.File({ filename: 'logs/error.log', level: 'error' }),
-    new winston.transports.File({ filename: 'logs/combined.log' })
-  ]
+  transports
+});
+
+export function getLogStats() {
+  return {
+    dropped: transports.map(t => ({ target: t.target, count: t.dropped })),
+    sampledOut: [...sampledOut].map(([level, count]) => ({ level, count })),
+  };
+}
+
+export async function flushLogs() {
+  await new Promise(resolve => setImmediate(resolve)); // linhas logadas logo antes ainda chegando aos transports
+  await Promise.all(transports.map(t => t.flushNow()));
+}
+
+// Loop vazio com linhas na fila (scripts que terminam sozinhos). Só agenda trabalho quando há o que
+// gravar, senão o beforeExit dispararia de novo indefinidamente.
+process.on('beforeExit', () => {
+  if (transports.some(t => t.pending)) flushLogs();
+});
+
+// Com este listener o Node não derruba mais o processo sozinho: loga, grava e sai com erro
+process.on('uncaughtException', (e) => {
+  logger.error('Uncaught exception', { error: e.message, stack: e.stack });
+  flushLogs().finally(() => process.exit(1));
+});
+
+// server.ts e cluster.ts têm o próprio SIGTERM (encerramento gracioso, que também chama flushLogs).
+// Sem outro listener, o sinal encerraria o processo: grava os logs e sai como o padrão faria.
+process.on('SIGTERM', () => {
+  flushLogs().finally(() => {
+    if (process.listenerCount('SIGTERM') === 1) process.exit(143);
+  });
 });
 
 export default logger;
\ No newline at end of file
@@ -0,0 +1,143 @@
+import cluster from 'cluster';
+import { Request, RequestHandler, Response } from 'express';
+import logger, { getLogStats } from './logger';
+import { getPrismaPrometheus } from './prisma';
+import { sharedStore } from './sharedStore';
+
+// Métricas HTTP em memória do processo, expostas em texto do Prometheus em GET /metrics:
+// - http_request_duration_seconds{method,route,status}: histograma por padrão de rota do Express
+//   (/v1/amplo-geral/:id, não a URL, para não abrir uma série por id/município);
+// - http_requests_in_flight: requisições em andamento;
+// - log_messages_dropped_total / log_messages_sampled_out_total: filas cheias e amostragem do logger;
+// - métricas do pool do Prisma (primário e réplica).
+// Requisições acima de SLOW_REQUEST_MS são logadas como warn, fora da amostragem de info.
+// Com METRICS_TOKEN definido, /metrics (e o detalhe do pool em /v1/health/db) exige Authorization: Bearer <token>.
+// No cluster, o worker que recebe o scrape junta as métricas de todos pelo SharedStore (rótulo worker).
+const BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+const SLOW_REQUEST_MS = Number(process.env.SLOW_REQUEST_MS) || 1000;
+
+interface Series {
+  labels: string;
+  buckets: number[];
+  sum: number;
+  count: number;
+}
+
+const durations = new Map<string, Series>();
+let inFlight = 0;
+
+const escapeLabel = (value: string) => value.replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+
+const labelsOf = (labels: Record<string, string>) =>
+  Object.entries(labels).map(([key, value]) => `${key}="${escapeLabel(value)}"`).join(',');
+
+const routeOf = (req: Request) => (req.route ? `${req.baseUrl}${req.route.path}` : 'unmatched');
+
+const observe = (labels: string, seconds: number) => {
+  let series = durations.get(labels);
+  if (!series) {
+    series = { labels, buckets: BUCKETS.map(() => 0), sum: 0, count: 0 };
+    durations.set(labels, series);
+  }
+  for (let i = 0; i < BUCKETS.length; i++) {
+    if (seconds <= BUCKETS[i]) series.buckets[i]++;
+  }
+  series.sum += seconds;
+  series.count++;
+};
+
+export const requestMetrics: RequestHandler = (req, res, next) => {
+  const started = process.hrtime.bigint();
+  let recorded = false;
+  inFlight++;
+
+  // 'finish' quando a resposta termina; 'close' sozinho quando o cliente desiste antes
+  const record = () => {
+    if (recorded) return;
+    recorded = true;
+    inFlight--;
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+    const route = routeOf(req);
+    const status = res.writableFinished ? String(res.statusCode) : 'aborted';
+    observe(labelsOf({ method: req.method, route, status }), seconds);
+
+    const durationMs = Math.round(seconds * 1000);
+    const fields = { method: req.method, route, url: req.originalUrl, status, durationMs };
+    if (durationMs >= SLOW_REQUEST_MS) logger.warn('Slow request', fields);
+    else logger.info('Request completed', fields);
+  };
+  res.once('finish', record);
+  res.once('close', record);
+  next();
+};
+
+const histogramLines = () =>
+  [...durations.values()].flatMap(({ labels, buckets, sum, count }) => [
+    ...BUCKETS.map((le, i) => `http_request_duration_seconds_bucket{${labels},le="${le}"} ${buckets[i]}`),
+    `http_request_duration_seconds_bucket{${labels},le="+Inf"} ${count}`,
+    `http_request_duration_seconds_sum{${labels}} ${sum}`,
+    `http_request_duration_seconds_count{${labels}} ${count}`,
+  ]);
+
+// Junta textos do Prometheus que repetem famílias (primário e réplica do Prisma): as amostras de uma
+// família precisam ficar contíguas e com um só # HELP / # TYPE
+const mergeFamilies = (texts: string[]) => {
+  const families = new Map<string, string[]>();
+  for (const text of texts) {
+    let lines: string[] = [];
+    for (const line of text.split('\n')) {
+      const family = line.match(/^# (?:HELP|TYPE) (\S+)/)?.[1];
+      if (family) {
+        if (!families.has(family)) families.set(family, []);
+        lines = families.get(family)!;
+        if (lines.includes(line)) continue;
+      }
+      if (line) lines.push(line);
+    }
+  }
+  return [...families.values()].flat();
+};
+
+export async function renderMetrics() {
+  const logs = getLogStats();
+  const lines = [
+    '# HELP http_request_duration_seconds Duração das requisições HTTP por rota.',
+    '# TYPE http_request_duration_seconds histogram',
+    ...histogramLines(),
+    '# HELP http_requests_in_flight Requisições HTTP em andamento.',
+    '# TYPE http_requests_in_flight gauge',
+    `http_requests_in_flight ${inFlight}`,
+    '# HELP log_messages_dropped_total Linhas de log descartadas com a fila do destino cheia.',
+    '# TYPE log_messages_dropped_total counter',
+    ...logs.dropped.map(({ target, count }) => `log_messages_dropped_total{${labelsOf({ target })}} ${count}`),
+    '# HELP log_messages_sampled_out_total Linhas de log descartadas pela amostragem por nível.',
+    '# TYPE log_messages_sampled_out_total counter',
+    ...logs.sampledOut.map(({ level, count }) => `log_messages_sampled_out_total{${labelsOf({ level })}} ${count}`),
+    ...mergeFamilies(await getPrismaPrometheus()),
+  ];
+  return `${lines.join('\n')}\n`;
+}
+
+// Acrescenta worker="<id>" a cada amostra
+const withWorkerLabel = (text: string, worker: number) =>
+  text.replace(/^([a-zA-Z_:][\w:]*)(?:\{(.*)\})? /gm, (_, name: string, labels?: string) =>
+    `${name}{worker="${worker}"${labels ? `,${labels}` : ''}} `);
+
+sharedStore.respond('metrics', async () => {
+  const text = await renderMetrics();
+  return cluster.worker ? withWorkerLabel(text, cluster.worker.id) : text;
+});
+
+// Mesma regra para /metrics e para as métricas do pool em /v1/health/db
+export function hasMetricsAccess(req: Request) {
+  const token = process.env.METRICS_TOKEN;
+  return !token || req.headers.authorization === `Bearer ${token}`;
+}
+
+export async function metricsHandler(req: Request, res: Response) {
+  if (!hasMetricsAccess(req)) {
+    return res.status(401).json({ error: { code: 'UNAUTHORIZED', message: 'Token inválido' } });
+  }
+  const texts = (await sharedStore.collect('metrics')) as string[];
+  return res.type('text/plain; version=0.0.4').send(`${mergeFamilies(texts).join('\n')}\n`);
+}
\ No newline at end of file
@@ -0,0 +1,75 @@
+import { Prisma } from '@prisma/client';
+import { prismaRead as prisma } from './prisma';
+
+// Caminho único das buscas por nome de município (autocomplete, nome-municipio, by-cidade).
+// Compara normalizar_nome(nome_municipio) com normalizar_nome(termo) — sem acento, minúsculo,
+// pontuação como espaço; ver migração busca_municipio — usando os índices de expressão:
+//   exact    -> igualdade (btree)
+//   contains -> trecho do nome (GIN trigram)
+//   fuzzy    -> trecho ou nome parecido, tolerando erros de digitação (operador % do pg_trgm);
+//               termos com menos de 3 letras buscam só pelo início do nome
+// O resultado vem ordenado: nome igual, depois começando pelo termo, depois contendo, e por
+// semelhança dentro de cada grupo.
+export type MunicipioSearchMode = 'exact' | 'contains' | 'fuzzy';
+
+export interface MunicipioMatch {
+  id: number;
+  nome_municipio: string;
+  score: number;
+}
+
+interface SearchOptions {
+  mode?: MunicipioSearchMode;
+  limit?: number;
+}
+
+const NOME = Prisma.sql`"normalizar_nome"("nome_municipio")`;
+
+const ACENTOS = 'ÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑáàâãäéèêëíìîïóòôõöúùûüçñ';
+const SEM_ACENTO = 'AAAAAEEEEIIIIOOOOOUUUUCNaaaaaeeeeiiiiooooouuuucn';
+
+// Mesma regra de normalizar_nome no banco, para decidir antes da consulta: um termo só com
+// pontuação ("!!!") normaliza para '' e, com LIKE '%' || '' || '%', casaria com todos os municípios
+export const normalizarNome = (texto: string) =>
+  [...texto]
+    .map((char) => {
+      const index = ACENTOS.indexOf(char);
+      return index < 0 ? char : SEM_ACENTO[index];
+    })
+    .join('')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim();
+
+const matchCondition = (termo: Prisma.Sql, mode: MunicipioSearchMode, short: boolean) => {
+  if (mode === 'exact') return Prisma.sql`${NOME} = ${termo}`;
+  if (mode === 'fuzzy' && short) return Prisma.sql`${NOME} LIKE ${termo} || '%'`;
+  const contains = Prisma.sql`${NOME} LIKE '%' || ${termo} || '%'`;
+  return mode === 'fuzzy' ? Prisma.sql`(${contains} OR ${NOME} % ${termo})` : contains;
+};
+
+export async function searchMunicipios(termo: string, { mode = 'fuzzy', limit }: SearchOptions = {}) {
+  const chave = normalizarNome(termo);
+  if (!chave) return [];
+  const normalizado = Prisma.sql`"normalizar_nome"(${termo})`;
+
+  return prisma.$queryRaw<MunicipioMatch[]>`
+    SELECT "id", "nome_municipio",
+           (CASE WHEN nome = termo THEN 3
+                 WHEN nome LIKE termo || '%' THEN 2
+                 WHEN nome LIKE '%' || termo || '%' THEN 1
+                 ELSE 0 END + similarity(nome, termo))::float8 AS score
+    FROM (
+      SELECT "id", "nome_municipio", ${NOME} AS nome, ${normalizado} AS termo
+      FROM "cin_amplo_geral"
+      WHERE ${matchCondition(normalizado, mode, chave.length < 3)}
+    ) m
+    ORDER BY score DESC, "nome_municipio" ASC
+    ${limit ? Prisma.sql`LIMIT ${limit}` : Prisma.empty}`;
+}
+
+// Município de um nome vindo da URL/tela ("camacari" -> Camaçari); null se nenhum bater exatamente
+export async function findMunicipio(nome: string) {
+  const [match] = await searchMunicipios(nome, { mode: 'exact', limit: 1 });
+  return match ?? null;
+}
\ No newline at end of file
@@ -1,5 +1,88 @@
+import 'dotenv/config';
 import { PrismaClient } from '@prisma/client';
+import logger from './logger';
 
-const prisma = new PrismaClient();
+// Um único PrismaClient (e pool) por processo para o primário e, opcionalmente, outro para a réplica.
+// Pool e timeout vêm do ambiente e só preenchem o que a URL ainda não define:
+//   DATABASE_POOL_SIZE            -> connection_limit
+//   DATABASE_POOL_TIMEOUT_S       -> pool_timeout (espera máxima por uma conexão livre)
+//   DATABASE_STATEMENT_TIMEOUT_MS -> statement_timeout da sessão no Postgres
+//   DATABASE_REPLICA_URL          -> réplica de leitura para as rotas de listagem/breakdown
+const withPoolSettings = (url: string) => {
+  const parsed = new URL(url);
+  const settings: Record<string, string | undefined> = {
+    connection_limit: process.env.DATABASE_POOL_SIZE,
+    pool_timeout: process.env.DATABASE_POOL_TIMEOUT_S,
+    options: process.env.DATABASE_STATEMENT_TIMEOUT_MS
+      ? `-c statement_timeout=${Number(process.env.DATABASE_STATEMENT_TIMEOUT_MS)}`
+      : undefined,
+  };
+  for (const [key, value] of Object.entries(settings)) {
+    if (value && !parsed.searchParams.has(key)) parsed.searchParams.set(key, value);
+  }
+  return parsed.toString();
+};
+
+const createClient = (url: string | undefined) =>
+  new PrismaClient(url ? { datasourceUrl: withPoolSettings(url) } : undefined);
+
+const prisma = createClient(process.env.DATABASE_URL);
+
+// Sem réplica configurada as leituras usam o próprio primário
+export const prismaRead = process.env.DATABASE_REPLICA_URL
+  ? createClient(process.env.DATABASE_REPLICA_URL)
+  : prisma;
+
+interface Histogram {
+  buckets: [number, number][];
+  sum: number;
+  count: number;
+}
+
+// Gauges e histograma de espera do pool (preview feature "metrics" do Prisma)
+const poolMetrics = async (client: PrismaClient) => {
+  const { gauges, histograms } = await client.$metrics.json();
+  const gauge = (key: string) => gauges.find(g => g.key === key)?.value ?? 0;
+  const wait = histograms.find(h => h.key === 'prisma_client_queries_wait_histogram_ms')?.value as Histogram | undefined;
+
+  return {
+    inUse: gauge('prisma_pool_connections_busy'),
+    idle: gauge('prisma_pool_connections_idle'),
+    open: gauge('prisma_pool_connections_open'),
+    waiting: gauge('prisma_client_queries_wait'),
+    acquireLatencyMs: {
+      count: wait?.count ?? 0,
+      avg: wait && wait.count > 0 ? Number((wait.sum / wait.count).toFixed(2)) : 0,
+      buckets: wait?.buckets ?? [],
+    },
+  };
+};
+
+export async function getPoolMetrics() {
+  return {
+    primary: await poolMetrics(prisma),
+    replica: prismaRead === prisma ? null : await poolMetrics(prismaRead),
+  };
+}
+
+// Up/down do banco (SELECT 1 no primário e na réplica), o que GET /health/db mostra sem token
+export async function getDatabaseStatus(): Promise<'up' | 'down'> {
+  const ping = (client: PrismaClient) => client.$queryRaw`SELECT 1`.then(() => true, () => false);
+  const results = await Promise.all([ping(prisma), ...(prismaRead === prisma ? [] : [ping(prismaRead)])]);
+  return results.every(Boolean) ? 'up' : 'down';
+}
+
+// Métricas do Prisma em texto do Prometheus (GET /metrics), uma por pool, com o rótulo pool="primary" | "replica"
+export async function getPrismaPrometheus() {
+  return Promise.all([
+    prisma.$metrics.prometheus({ globalLabels: { pool: 'primary' } }),
+    ...(prismaRead === prisma ? [] : [prismaRead.$metrics.prometheus({ globalLabels: { pool: 'replica' } })]),
+  ]);
+}
+
+export async function disconnectPrisma() {
+  await Promise.all([prisma.$disconnect(), prismaRead === prisma ? undefined : prismaRead.$disconnect()]);
+  logger.info('Prisma disconnected');
+}
 
 export default prisma;
\ No newline at end of file
@@ -0,0 +1,28 @@
+import { IncrementResponse, Options, Store } from 'express-rate-limit';
+import { SharedStore, sharedStore } from './sharedStore';
+
+// Contadores do express-rate-limit no SharedStore: com vários workers o limite vale para o
+// conjunto, não para cada processo
+export class SharedRateLimitStore implements Store {
+  private windowMs = 60 * 1000;
+  localKeys = false;
+
+  constructor(readonly prefix = 'rl:', private readonly store: SharedStore = sharedStore) {}
+
+  init(options: Options) {
+    this.windowMs = options.windowMs;
+  }
+
+  async increment(key: string): Promise<IncrementResponse> {
+    const { hits, resetAt } = await this.store.increment(this.prefix + key, this.windowMs);
+    return { totalHits: hits, resetTime: new Date(resetAt) };
+  }
+
+  async decrement(key: string) {
+    await this.store.decrement(this.prefix + key);
+  }
+
+  async resetKey(key: string) {
+    await this.store.reset(this.prefix + key);
+  }
+}
\ No newline at end of file
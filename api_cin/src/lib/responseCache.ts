@@ -0,0 +1,190 @@
+import crypto from 'crypto';
+import { Request, RequestHandler, Response } from 'express';
+import logger from './logger';
+import { sharedStore } from './sharedStore';
+import { buildVariant, negotiate, Variant } from './wireFormat';
+
+// Cache de respostas GET por rota, em memória do processo.
+// - LRU com no máximo RESPONSE_CACHE_MAX_ENTRIES respostas; cada uma fica fresca por ttlMs e,
+//   depois disso, ainda é servida por staleMs enquanto uma única revalidação roda em segundo plano.
+// - ETag forte (sha1 do corpo) com 304 para If-None-Match.
+// - Negociação de representação (JSON colunar, br/gzip) em wireFormat.ts; cada variante é
+//   gerada uma vez e guardada junto da entrada.
+// - Requisições idênticas simultâneas compartilham a mesma execução do controller (singleflight).
+// - Invalidação por tags: os services de escrita chamam invalidateCacheTags('amplo-geral' | 'produtividade'),
+//   que também chega aos outros workers do cluster pelo SharedStore (cada worker tem seu próprio cache).
+export type CacheTag = 'amplo-geral' | 'produtividade';
+
+interface CacheOptions {
+  tags: CacheTag[];
+  ttlMs?: number;
+  staleMs?: number;
+}
+
+interface CachedResponse {
+  status: number;
+  body: string;
+  etag: string;
+  variants: Map<string, Promise<Variant>>;
+}
+
+interface Entry extends CachedResponse {
+  tags: CacheTag[];
+  freshUntil: number;
+  staleUntil: number;
+}
+
+const MAX_ENTRIES = Number(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 500;
+const DEFAULT_TTL_MS = Number(process.env.RESPONSE_CACHE_TTL_MS) || 60 * 1000;
+const DEFAULT_STALE_MS = Number(process.env.RESPONSE_CACHE_STALE_MS) || 5 * 60 * 1000;
+
+const entries = new Map<string, Entry>();
+const inflight = new Map<string, { promise: Promise<CachedResponse | null>; tags: CacheTag[] }>();
+// Versão por tag: uma carga iniciada antes de uma invalidação não grava o resultado antigo
+const tagVersions = new Map<CacheTag, number>();
+
+const versionOf = (tags: CacheTag[]) => tags.map(tag => tagVersions.get(tag) ?? 0).join('.');
+
+const remember = (key: string, entry: Entry) => {
+  entries.delete(key);
+  entries.set(key, entry);
+  while (entries.size > MAX_ENTRIES) {
+    entries.delete(entries.keys().next().value as string);
+  }
+};
+
+const INVALIDATION_CHANNEL = 'cache:invalidate';
+
+const invalidateLocal = (tags: CacheTag[]) => {
+  for (const tag of tags) tagVersions.set(tag, (tagVersions.get(tag) ?? 0) + 1);
+  for (const [key, entry] of entries) {
+    if (entry.tags.some(tag => tags.includes(tag))) entries.delete(key);
+  }
+  // Cargas em andamento continuam para quem já espera por elas, mas não recebem novos pedidos
+  for (const [key, running] of inflight) {
+    if (running.tags.some(tag => tags.includes(tag))) inflight.delete(key);
+  }
+};
+
+sharedStore.subscribe(INVALIDATION_CHANNEL, (tags) => invalidateLocal(tags as CacheTag[]));
+
+export function invalidateCacheTags(...tags: CacheTag[]) {
+  invalidateLocal(tags);
+  sharedStore.broadcast(INVALIDATION_CHANNEL, tags);
+}
+
+// Executa o controller contra uma resposta de captura, sem tocar na resposta real.
+// A captura só implementa status(), json(), send(), setHeader() e set() (cabeçalhos são descartados);
+// controllers que usam end(), type(), redirect() ou streaming não devem passar por cacheResponse.
+// Um next() sem erro (o controller recusou a requisição) resolve null: nada é guardado e a
+// requisição segue para o controller com a resposta real.
+const capture = (handler: RequestHandler, req: Request) =>
+  new Promise<CachedResponse | null>((resolve, reject) => {
+    let status = 200;
+    const finish = (payload: unknown) => {
+      const body = typeof payload === 'string' ? payload : JSON.stringify(payload);
+      const etag = `"${crypto.createHash('sha1').update(body).digest('base64url')}"`;
+      resolve({ status, body, etag, variants: new Map() });
+      return sink;
+    };
+    const sink = {
+      status(code: number) {
+        status = code;
+        return sink;
+      },
+      json: finish,
+      send: finish,
+      setHeader: () => sink,
+      set: () => sink,
+    } as unknown as Response;
+    const next = (err?: unknown) => (err === undefined || err === 'route' || err === 'router' ? resolve(null) : reject(err));
+    Promise.resolve(handler(req, sink, next)).catch(reject);
+  });
+
+const load = (key: string, handler: RequestHandler, req: Request, options: Required<CacheOptions>) => {
+  const running = inflight.get(key);
+  if (running) return running.promise;
+
+  const version = versionOf(options.tags);
+  const promise = capture(handler, req)
+    .then((result) => {
+      // Só respostas 200 entram no cache; erros e 404 sempre chegam ao banco
+      if (result?.status === 200 && versionOf(options.tags) === version) {
+        const now = Date.now();
+        remember(key, {
+          ...result,
+          tags: options.tags,
+          freshUntil: now + options.ttlMs,
+          staleUntil: now + options.ttlMs + options.staleMs,
+        });
+      }
+      return result;
+    })
+    .finally(() => {
+      if (inflight.get(key)?.promise === promise) inflight.delete(key);
+    });
+  inflight.set(key, { promise, tags: options.tags });
+  return promise;
+};
+
+const variantOf = (req: Request, result: CachedResponse) => {
+  const { columnar, encoding } = negotiate(req);
+  const key = `${columnar ? 'columnar' : 'json'}:${encoding ?? 'identity'}`;
+  let variant = result.variants.get(key);
+  if (!variant) {
+    variant = buildVariant(result.body, result.etag, columnar, encoding);
+    variant.catch(() => result.variants.delete(key));
+    result.variants.set(key, variant);
+  }
+  return variant;
+};
+
+const send = async (req: Request, res: Response, result: CachedResponse, cacheStatus: string) => {
+  res.setHeader('X-Cache', cacheStatus);
+  if (result.status !== 200) {
+    return res.status(result.status).type('application/json').send(result.body);
+  }
+  const variant = await variantOf(req, result);
+  res.setHeader('Vary', 'Accept, Accept-Encoding');
+  res.setHeader('ETag', variant.etag);
+  res.setHeader('Cache-Control', 'no-cache');
+  if (req.headers['if-none-match'] === variant.etag) {
+    return res.status(304).end();
+  }
+  res.setHeader('Content-Type', variant.contentType);
+  if (variant.encoding) res.setHeader('Content-Encoding', variant.encoding);
+  return res.status(200).send(variant.body);
+};
+
+export function cacheResponse(options: CacheOptions, handler: RequestHandler): RequestHandler {
+  const settings = { ttlMs: DEFAULT_TTL_MS, staleMs: DEFAULT_STALE_MS, ...options };
+
+  return async (req, res, next) => {
+    const key = req.originalUrl;
+    const entry = entries.get(key);
+    const now = Date.now();
+
+    try {
+      if (entry && entry.freshUntil > now) {
+        remember(key, entry);
+        return await send(req, res, entry, 'HIT');
+      }
+      if (entry && entry.staleUntil > now) {
+        load(key, handler, req, settings).catch((e) => {
+          logger.error('Cache revalidation error', { url: key, error: e instanceof Error ? e.message : String(e) });
+        });
+        return await send(req, res, entry, 'STALE');
+      }
+
+      const coalesced = inflight.has(key);
+      const result = await load(key, handler, req, settings);
+      if (!result) {
+        res.setHeader('X-Cache', 'BYPASS');
+        return await handler(req, res, next);
+      }
+      return await send(req, res, result, coalesced ? 'COALESCED' : 'MISS');
+    } catch (e) {
+      next(e);
+    }
+  };
+}
\ No newline at end of file
@@ -0,0 +1,218 @@
+import cluster, { Worker } from 'cluster';
+
+// Estado compartilhado entre os processos da API (ver src/cluster.ts):
+// - contadores com janela (rate limit): increment / decrement / reset;
+// - broadcast: avisa os outros processos (invalidação do cache de respostas);
+// - collect: pergunta algo a todos os processos e junta as respostas (GET /metrics).
+// Em um processo só, MemoryStore guarda tudo localmente. Nos workers do cluster, ClusterStore
+// repassa as operações por IPC ao processo primário, que mantém um MemoryStore único
+// (serveSharedStore) e faz o papel de um Redis local.
+export interface Counter {
+  hits: number;
+  resetAt: number;
+}
+
+export interface SharedStore {
+  increment(key: string, windowMs: number): Promise<Counter>;
+  decrement(key: string): Promise<void>;
+  reset(key: string): Promise<void>;
+  // Entrega só aos outros processos; quem publica já aplicou a mudança localmente
+  broadcast(channel: string, payload: unknown): void;
+  subscribe(channel: string, handler: (payload: unknown) => void): void;
+  respond(channel: string, responder: () => Promise<unknown>): void;
+  collect(channel: string): Promise<unknown[]>;
+}
+
+const TIMEOUT_MS = Number(process.env.SHARED_STORE_TIMEOUT_MS) || 1000;
+const SWEEP_MS = 60 * 1000;
+
+type Message =
+  | { $store: 'call'; id: number; op: 'increment' | 'decrement' | 'reset'; key: string; windowMs?: number }
+  | { $store: 'collect'; id: number; channel: string }
+  | { $store: 'reply'; id: number; result?: unknown; error?: string }
+  | { $store: 'broadcast'; channel: string; payload: unknown };
+
+const isMessage = (message: unknown): message is Message =>
+  typeof message === 'object' && message !== null && '$store' in message;
+
+export class MemoryStore implements SharedStore {
+  private counters = new Map<string, Counter>();
+  private handlers = new Map<string, ((payload: unknown) => void)[]>();
+  private responders = new Map<string, () => Promise<unknown>>();
+
+  constructor() {
+    setInterval(() => {
+      const now = Date.now();
+      for (const [key, counter] of this.counters) {
+        if (counter.resetAt <= now) this.counters.delete(key);
+      }
+    }, SWEEP_MS).unref();
+  }
+
+  async increment(key: string, windowMs: number) {
+    const now = Date.now();
+    const current = this.counters.get(key);
+    const counter = current && current.resetAt > now
+      ? { hits: current.hits + 1, resetAt: current.resetAt }
+      : { hits: 1, resetAt: now + windowMs };
+    this.counters.set(key, counter);
+    return counter;
+  }
+
+  async decrement(key: string) {
+    const counter = this.counters.get(key);
+    if (counter && counter.hits > 0) counter.hits--;
+  }
+
+  async reset(key: string) {
+    this.counters.delete(key);
+  }
+
+  broadcast() {
+    // Sem outros processos para avisar
+  }
+
+  // Chamado pelo primário com mensagens vindas dos workers
+  deliver(channel: string, payload: unknown) {
+    for (const handler of this.handlers.get(channel) ?? []) handler(payload);
+  }
+
+  subscribe(channel: string, handler: (payload: unknown) => void) {
+    this.handlers.set(channel, [...(this.handlers.get(channel) ?? []), handler]);
+  }
+
+  respond(channel: string, responder: () => Promise<unknown>) {
+    this.responders.set(channel, responder);
+  }
+
+  async collect(channel: string) {
+    const responder = this.responders.get(channel);
+    return responder ? [await responder()] : [];
+  }
+}
+
+export class ClusterStore implements SharedStore {
+  private nextId = 0;
+  private pending = new Map<number, { resolve: (value: any) => void; reject: (error: Error) => void }>();
+  private local = new MemoryStore();
+
+  constructor() {
+    process.on('message', async (message: unknown) => {
+      if (!isMessage(message)) return;
+      if (message.$store === 'reply') {
+        const waiting = this.pending.get(message.id);
+        this.pending.delete(message.id);
+        if (message.error) waiting?.reject(new Error(message.error));
+        else waiting?.resolve(message.result);
+      } else if (message.$store === 'broadcast') {
+        this.local.deliver(message.channel, message.payload);
+      } else if (message.$store === 'collect') {
+        // Pedido do primário em nome de outro worker
+        const [result] = await this.local.collect(message.channel).catch(() => [undefined]);
+        process.send?.({ $store: 'reply', id: message.id, result });
+      }
+    });
+  }
+
+  private request<T>(message: Omit<Extract<Message, { id: number }>, 'id'>, timeoutMs = TIMEOUT_MS) {
+    const id = this.nextId++;
+    return new Promise<T>((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id);
+        reject(new Error(`Shared store timeout (${message.$store})`));
+      }, timeoutMs);
+      this.pending.set(id, {
+        resolve: (value) => { clearTimeout(timer); resolve(value); },
+        reject: (error) => { clearTimeout(timer); reject(error); },
+      });
+      process.send?.({ ...message, id });
+    });
+  }
+
+  increment(key: string, windowMs: number) {
+    return this.request<Counter>({ $store: 'call', op: 'increment', key, windowMs });
+  }
+
+  async decrement(key: string) {
+    await this.request({ $store: 'call', op: 'decrement', key });
+  }
+
+  async reset(key: string) {
+    await this.request({ $store: 'call', op: 'reset', key });
+  }
+
+  broadcast(channel: string, payload: unknown) {
+    process.send?.({ $store: 'broadcast', channel, payload });
+  }
+
+  subscribe(channel: string, handler: (payload: unknown) => void) {
+    this.local.subscribe(channel, handler);
+  }
+
+  respond(channel: string, responder: () => Promise<unknown>) {
+    this.local.respond(channel, responder);
+  }
+
+  collect(channel: string) {
+    return this.request<unknown[]>({ $store: 'collect', channel }, TIMEOUT_MS * 2);
+  }
+}
+
+// Lado do primário: um MemoryStore para todos os workers
+export function serveSharedStore() {
+  const store = new MemoryStore();
+  let nextId = 0;
+  const collecting = new Map<number, (result: unknown) => void>();
+
+  const collectFrom = (worker: Worker, channel: string) =>
+    new Promise<unknown>((resolve) => {
+      const id = nextId++;
+      // Worker que não responde a tempo (reiniciando) fica de fora
+      const timer = setTimeout(() => {
+        collecting.delete(id);
+        resolve(undefined);
+      }, TIMEOUT_MS);
+      collecting.set(id, (result) => {
+        clearTimeout(timer);
+        resolve(result);
+      });
+      worker.send({ $store: 'collect', id, channel });
+    });
+
+  cluster.on('message', async (worker, message: unknown) => {
+    if (!isMessage(message)) return;
+    const reply = (result?: unknown, error?: string) => {
+      if (worker.isConnected()) worker.send({ $store: 'reply', id: (message as { id: number }).id, result, error });
+    };
+
+    switch (message.$store) {
+      case 'call':
+        try {
+          if (message.op === 'increment') reply(await store.increment(message.key, message.windowMs ?? 0));
+          else if (message.op === 'decrement') reply(await store.decrement(message.key));
+          else reply(await store.reset(message.key));
+        } catch (e) {
+          reply(undefined, (e as Error).message);
+        }
+        break;
+      case 'broadcast':
+        for (const other of Object.values(cluster.workers ?? {})) {
+          if (other && other !== worker && other.isConnected()) other.send(message);
+        }
+        break;
+      case 'collect': {
+        const workers = Object.values(cluster.workers ?? {}).filter((w): w is Worker => !!w && w.isConnected());
+        const results = await Promise.all(workers.map(w => collectFrom(w, message.channel)));
+        reply(results.filter(result => result !== undefined));
+        break;
+      }
+      case 'reply':
+        collecting.get(message.id)?.(message.result);
+        collecting.delete(message.id);
+        break;
+    }
+  });
+  return store;
+}
+
+export const sharedStore: SharedStore = cluster.isWorker ? new ClusterStore() : new MemoryStore();
\ No newline at end of file
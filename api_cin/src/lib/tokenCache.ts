@@ -0,0 +1,70 @@
+import crypto from 'crypto';
+import jwt, { JwtPayload } from 'jsonwebtoken';
+import { Cargo } from '@prisma/client';
+import prisma from './prisma';
+import { sharedStore } from './sharedStore';
+
+// Tokens já verificados, para que cada requisição autenticada faça no máximo uma verificação de
+// assinatura e uma leitura do usuário — e nenhuma quando o token está no cache.
+//   TOKEN_CACHE_MAX_ENTRIES -> LRU (padrão 10000)
+//   TOKEN_CACHE_TTL_MS      -> tempo máximo de uma entrada (padrão 5 min); nunca passa do exp do token
+// A chave é o sha256 do token, não o token. UpdateUserService/UpdatePasswordService chamam
+// evictUser, que descarta as entradas do usuário aqui e nos outros workers do cluster.
+export interface AuthUser {
+  id: number;
+  cargo: Cargo;
+}
+
+interface Entry {
+  user: AuthUser;
+  expiresAt: number;
+}
+
+const MAX_ENTRIES = Number(process.env.TOKEN_CACHE_MAX_ENTRIES) || 10000;
+const TTL_MS = Number(process.env.TOKEN_CACHE_TTL_MS) || 5 * 60 * 1000;
+
+const entries = new Map<string, Entry>();
+// Incrementado a cada evictUser: leitura do usuário que começou antes não entra no cache
+let generation = 0;
+
+const hash = (token: string) => crypto.createHash('sha256').update(token).digest('base64url');
+
+const evictLocal = (userId: number) => {
+  generation++;
+  for (const [key, entry] of entries) {
+    if (entry.user.id === userId) entries.delete(key);
+  }
+};
+
+sharedStore.subscribe('auth:evict', (userId) => evictLocal(userId as number));
+
+export function evictUser(userId: number) {
+  evictLocal(userId);
+  sharedStore.broadcast('auth:evict', userId);
+}
+
+// Usuário do token, ou null se o usuário não existe mais; lança se a assinatura/exp não conferem
+export async function verifyToken(token: string): Promise<AuthUser | null> {
+  const key = hash(token);
+  const now = Date.now();
+  const cached = entries.get(key);
+  if (cached) {
+    entries.delete(key);
+    if (cached.expiresAt > now) {
+      entries.set(key, cached);
+      return cached.user;
+    }
+  }
+
+  const started = generation;
+  const decoded = jwt.verify(token, process.env.JWT_SECRET as string) as JwtPayload & { id: number };
+  const user = await prisma.user.findUnique({ where: { id: decoded.id }, select: { id: true, cargo: true } });
+  if (!user) return null;
+
+  if (started === generation) {
+    const expiresAt = Math.min(now + TTL_MS, decoded.exp ? decoded.exp * 1000 : Infinity);
+    if (entries.size >= MAX_ENTRIES) entries.delete(entries.keys().next().value!);
+    entries.set(key, { user, expiresAt });
+  }
+  return user;
+}
\ No newline at end of file
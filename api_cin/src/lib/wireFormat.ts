@@ -0,0 +1,106 @@
+import { promisify } from 'util';
+import zlib from 'zlib';
+import { Request } from 'express';
+
+// Representações negociadas das respostas em cache (ver responseCache.ts):
+// - Accept: application/vnd.dashdos.columnar+json -> JSON colunar: toda lista de objetos com as
+//   mesmas chaves vira { "$rows": n, "columns": { campo: [...] } }, e colunas de texto com poucos
+//   valores distintos (enums/status) viram { "$dict": [...], "codes": [...] }. Chaves iniciadas
+//   por "$" são reservadas para o formato.
+// - Accept-Encoding: br ou gzip acima de COMPRESSION_MIN_BYTES.
+// Cada variante é calculada uma vez por entrada do cache e tem seu próprio ETag.
+export const COLUMNAR_MEDIA_TYPE = 'application/vnd.dashdos.columnar+json';
+
+const COMPRESSION_MIN_BYTES = Number(process.env.RESPONSE_COMPRESSION_MIN_BYTES) || 1024;
+const MAX_DICTIONARY = 256;
+
+type Json = null | boolean | number | string | Json[] | { [key: string]: Json };
+type Encoding = 'br' | 'gzip';
+
+export interface Variant {
+  body: Buffer;
+  etag: string;
+  contentType: string;
+  encoding?: Encoding;
+}
+
+const brotli = promisify(zlib.brotliCompress);
+const gzip = promisify(zlib.gzip);
+
+const isRecord = (value: Json): value is { [key: string]: Json } =>
+  value !== null && typeof value === 'object' && !Array.isArray(value);
+
+// Chaves comuns a todas as linhas, na mesma ordem; null se a lista não for uma tabela
+const tableKeys = (rows: Json[]) => {
+  if (rows.length < 2 || !rows.every(isRecord)) return null;
+  const keys = Object.keys(rows[0] as object);
+  const uniform = rows.every((row) => {
+    const rowKeys = Object.keys(row as object);
+    return rowKeys.length === keys.length && rowKeys.every((key, i) => key === keys[i]);
+  });
+  return uniform ? keys : null;
+};
+
+const encodeColumn = (values: Json[]): Json => {
+  const encoded = values.map(encodeColumnar);
+  if (!encoded.every((value) => value === null || typeof value === 'string')) return encoded;
+
+  const dictionary = new Map<string, number>();
+  for (const value of encoded as (string | null)[]) {
+    if (value !== null && !dictionary.has(value)) dictionary.set(value, dictionary.size);
+    if (dictionary.size > MAX_DICTIONARY) return encoded;
+  }
+  // Só compensa quando os valores se repetem (status, enums, nomes em listas aninhadas)
+  if (dictionary.size * 2 > encoded.length) return encoded;
+  return {
+    $dict: [...dictionary.keys()],
+    codes: (encoded as (string | null)[]).map((value) => (value === null ? null : dictionary.get(value)!)),
+  };
+};
+
+export function encodeColumnar(value: Json): Json {
+  if (Array.isArray(value)) {
+    const keys = tableKeys(value);
+    if (!keys) return value.map(encodeColumnar);
+    const rows = value as { [key: string]: Json }[];
+    return {
+      $rows: rows.length,
+      columns: Object.fromEntries(keys.map((key) => [key, encodeColumn(rows.map((row) => row[key]))])),
+    };
+  }
+  if (isRecord(value)) {
+    return Object.fromEntries(Object.entries(value).map(([key, item]) => [key, encodeColumnar(item)]));
+  }
+  return value;
+}
+
+export function negotiate(req: Request) {
+  const columnar = (req.headers.accept ?? '').includes(COLUMNAR_MEDIA_TYPE);
+  const accepted = req.acceptsEncodings('br', 'gzip');
+  return { columnar, encoding: accepted === 'br' || accepted === 'gzip' ? (accepted as Encoding) : undefined };
+}
+
+export async function buildVariant(json: string, etag: string, columnar: boolean, encoding?: Encoding): Promise<Variant> {
+  let text = json;
+  if (columnar) {
+    try {
+      text = JSON.stringify(encodeColumnar(JSON.parse(json)));
+    } catch {
+      columnar = false; // corpo que não é JSON segue como veio
+    }
+  }
+  const raw = Buffer.from(text);
+  const contentType = `${columnar ? COLUMNAR_MEDIA_TYPE : 'application/json'}; charset=utf-8`;
+  const compress = encoding !== undefined && raw.length >= COMPRESSION_MIN_BYTES;
+  const body = !compress ? raw : encoding === 'br'
+    ? await brotli(raw, { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 5, [zlib.constants.BROTLI_PARAM_SIZE_HINT]: raw.length } })
+    : await gzip(raw);
+  // ETag distinto por representação (o mesmo conteúdo em outra codificação não pode gerar 304)
+  const suffix = `${columnar ? '-c' : ''}${compress ? `-${encoding}` : ''}`;
+  return {
+    body,
+    etag: suffix ? etag.replace(/"$/, `${suffix}"`) : etag,
+    contentType,
+    encoding: compress ? encoding : undefined,
+  };
+}
\ No newline at end of file
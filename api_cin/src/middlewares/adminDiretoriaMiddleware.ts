@@ -1,21 +1,16 @@
-import { Request, Response, NextFunction } from 'express';
-import jwt from 'jsonwebtoken';
+import { Response, NextFunction } from 'express';
 import { Cargo } from '@prisma/client';
+import { AuthRequest } from './auth';
 
-export const adminDiretoriaMiddleware = (req: Request, res: Response, next: NextFunction) => {
-  const token = req.headers.authorization?.split(' ')[1];
-  if (!token) {
+// Roda depois do authMiddleware, que já verificou o token e carregou o cargo do usuário
+export const adminDiretoriaMiddleware = (req: AuthRequest, res: Response, next: NextFunction) => {
+  if (!req.user) {
     return res.status(400).json({ error: 'Token inválido' });
   }
 
-  try {
-    const decoded: any = jwt.verify(token, process.env.JWT_SECRET as string);
-    const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!decoded.cargo || !allowedRoles.includes(decoded.cargo)) {
-      return res.status(403).json({ error: 'Access denied' });
-    }
-    next();
-  } catch (error) {
-    return res.status(401).json({ error: 'Token inválido' });
+  const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
+  if (!allowedRoles.includes(req.user.cargo)) {
+    return res.status(403).json({ error: 'Access denied' });
   }
+  next();
 };
\ No newline at end of file
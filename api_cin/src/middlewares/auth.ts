@@ -1,11 +1,8 @@
 import { Request, Response, NextFunction } from 'express';
-import jwt from 'jsonwebtoken';
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { AuthUser, verifyToken } from '../lib/tokenCache';
 
 export interface AuthRequest extends Request {
-  user?: { id: number; cargo: string };
+  user?: AuthUser;
 }
 
 export const authMiddleware = async (req: AuthRequest, res: Response, next: NextFunction) => {
@@ -15,12 +12,11 @@ export const authMiddleware = async (req: AuthRequest, res: Response, next: Next
   }
 
   try {
-    const decoded = jwt.verify(token, process.env.JWT_SECRET as string) as { id: number };
-    const user = await prisma.user.findUnique({ where: { id: decoded.id } });
+    const user = await verifyToken(token);
     if (!user) {
       return res.status(401).json({ error: 'Invalid token' });
     }
-    req.user = { id: user.id, cargo: user.cargo };
+    req.user = user;
     next();
   } catch (err) {
     return res.status(401).json({ error: 'Invalid token' });
@@ -1,6 +1,7 @@
 import { Router } from 'express';
 import { authMiddleware } from '../middlewares/auth';
 import { adminDiretoriaMiddleware } from '../middlewares/adminDiretoriaMiddleware';
+import { cacheResponse } from '../lib/responseCache';
 import { CreateAmploGeralController } from '../controllers/AmploGeral/CreateAmploGeralController';
 import { UpdateAmploGeralController } from '../controllers/AmploGeral/UpdateAmploGeralController';
 import { DeleteAmploGeralController } from '../controllers/AmploGeral/DeleteAmploGeralController';
@@ -18,29 +19,38 @@ import { ListAmploGeralByVisitedCitiesController } from '../controllers/AmploGer
 import { ListAmploGeralByStatusVisitaBreakdownController } from '../controllers/AmploGeral/ListAmploGeralByStatusVisitaBreakdownController';
 import { ListAmploGeralByStatusPublicacaoBreakdownController } from '../controllers/AmploGeral/ListAmploGeralByStatusPublicacaoBreakdownController';
 import { ListAmploGeralByStatusInstalacaoBreakdownController } from '../controllers/AmploGeral/ListAmploGeralByStatusInstalacaoBreakdownController';
+import { ListAmploGeralStatusBreakdownController } from '../controllers/AmploGeral/ListAmploGeralStatusBreakdownController';
 import { ListByNomeMunicipioAmploGeralController } from '../controllers/AmploGeral/ListAmploGeralByMunicipioController';
 import { ListAmploGeralByMunicipioAutocompleteController } from '../controllers/AmploGeral/ListAmploGeralByMunicipioAutocompleteController'; 
+import { ExportAmploGeralController } from '../controllers/AmploGeral/ExportAmploGeralController';
+
+// Leituras públicas em cache; os services de escrita invalidam pelas tags
+const AMPLO_GERAL = { tags: ['amplo-geral' as const] };
+const AMPLO_GERAL_COM_PRODUTIVIDADE = { tags: ['amplo-geral' as const, 'produtividade' as const] };
 
 const router = Router();
 
 router.post('/amplo-geral', authMiddleware, adminDiretoriaMiddleware, new CreateAmploGeralController().handle);
 router.put('/amplo-geral/:id', authMiddleware, adminDiretoriaMiddleware, new UpdateAmploGeralController().handle);
 router.delete('/amplo-geral/:id', authMiddleware, adminDiretoriaMiddleware, new DeleteAmploGeralController().handle);
-router.get('/amplo-geral', new ListAllAmploGeralController().handle);
-router.get('/amplo-geral/nome-municipio', new ListByNomeMunicipioAmploGeralController().handle);
-router.get('/amplo-geral/status-visita', new ListAmploGeralByStatusVisitaController().handle);
-router.get('/amplo-geral/periodo-visita', new ListAmploGeralByPeriodoVisitaController().handle);
-router.get('/amplo-geral/status-infra', new ListAmploGeralByStatusInfraController().handle);
-router.get('/amplo-geral/publicacao', new ListAmploGeralPublicacaoController().handle);
-router.get('/amplo-geral/instalacao', new ListByInstalacaoAmploGeralController().handle);
-router.get('/amplo-geral/status-publicacao', new ListAmploGeralByStatusPublicacaoController().handle);
-router.get('/amplo-geral/status-instalacao', new ListAmploGeralByStatusInstalacaoController().handle);
-router.get('/amplo-geral/visitas-proximas', new ListAmploGeralByVisitasController().handle);
-router.get('/amplo-geral/instalacoes-recentes', new ListAmploGeralByDataInstalacaoController().handle);
-router.get('/amplo-geral/visited-cities', new ListAmploGeralByVisitedCitiesController().handle);
-router.get('/amplo-geral/status-visita-breakdown', new ListAmploGeralByStatusVisitaBreakdownController().handle);
-router.get('/amplo-geral/status-publicacao-breakdown', new ListAmploGeralByStatusPublicacaoBreakdownController().handle);
-router.get('/amplo-geral/status-instalacao-breakdown', new ListAmploGeralByStatusInstalacaoBreakdownController().handle);
-router.get('/amplo-geral/autocomplete', new ListAmploGeralByMunicipioAutocompleteController().handle);
+router.get('/amplo-geral', cacheResponse(AMPLO_GERAL, new ListAllAmploGeralController().handle));
+router.get('/amplo-geral/nome-municipio', cacheResponse(AMPLO_GERAL_COM_PRODUTIVIDADE, new ListByNomeMunicipioAmploGeralController().handle));
+router.get('/amplo-geral/status-visita', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusVisitaController().handle));
+router.get('/amplo-geral/periodo-visita', cacheResponse(AMPLO_GERAL, new ListAmploGeralByPeriodoVisitaController().handle));
+router.get('/amplo-geral/status-infra', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusInfraController().handle));
+router.get('/amplo-geral/publicacao', cacheResponse(AMPLO_GERAL, new ListAmploGeralPublicacaoController().handle));
+router.get('/amplo-geral/instalacao', cacheResponse(AMPLO_GERAL, new ListByInstalacaoAmploGeralController().handle));
+router.get('/amplo-geral/status-publicacao', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusPublicacaoController().handle));
+router.get('/amplo-geral/status-instalacao', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusInstalacaoController().handle));
+router.get('/amplo-geral/visitas-proximas', cacheResponse(AMPLO_GERAL, new ListAmploGeralByVisitasController().handle));
+router.get('/amplo-geral/instalacoes-recentes', cacheResponse(AMPLO_GERAL, new ListAmploGeralByDataInstalacaoController().handle));
+router.get('/amplo-geral/visited-cities', cacheResponse(AMPLO_GERAL, new ListAmploGeralByVisitedCitiesController().handle));
+router.get('/amplo-geral/status-visita-breakdown', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusVisitaBreakdownController().handle));
+router.get('/amplo-geral/status-publicacao-breakdown', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusPublicacaoBreakdownController().handle));
+router.get('/amplo-geral/status-instalacao-breakdown', cacheResponse(AMPLO_GERAL, new ListAmploGeralByStatusInstalacaoBreakdownController().handle));
+router.get('/amplo-geral/status-breakdown', cacheResponse(AMPLO_GERAL, new ListAmploGeralStatusBreakdownController().handle));
+router.get('/amplo-geral/autocomplete', cacheResponse(AMPLO_GERAL, new ListAmploGeralByMunicipioAutocompleteController().handle));
+// Streaming (NDJSON/CSV): fora do cacheResponse, que guardaria o corpo inteiro em memória
+router.get('/amplo-geral/export', new ExportAmploGeralController().handle);
 
 export default router;
\ No newline at end of file
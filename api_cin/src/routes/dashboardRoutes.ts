@@ -0,0 +1,14 @@
+import { Router } from 'express';
+import { CacheTag, cacheResponse } from '../lib/responseCache';
+import { GetDashboardSummaryController } from '../controllers/Dashboard/GetDashboardSummaryController';
+import { GetMapaMetricaController } from '../controllers/Dashboard/GetMapaMetricaController';
+
+const router = Router();
+
+// Invalidados por qualquer escrita de AmploGeral/ProdutividadeDiaria; o TTL só cobre escritas feitas por fora da API
+const dashboardCache = { tags: ['amplo-geral', 'produtividade'] as CacheTag[], ttlMs: Number(process.env.DASHBOARD_CACHE_TTL_MS) || 5 * 60 * 1000 };
+
+router.get('/dashboard/summary', cacheResponse(dashboardCache, new GetDashboardSummaryController().handle));
+router.get('/dashboard/mapa', cacheResponse(dashboardCache, new GetMapaMetricaController().handle));
+
+export default router;
\ No newline at end of file
@@ -0,0 +1,8 @@
+import { Router } from 'express';
+import { GetDatabaseHealthController } from '../controllers/Health/GetDatabaseHealthController';
+
+const router = Router();
+
+router.get('/health/db', new GetDatabaseHealthController().handle);
+
+export default router;
\ No newline at end of file
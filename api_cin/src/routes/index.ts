@@ -1,3 +1,5 @@
 export { default as userRoutes } from './userRoutes';
 export { default as amploGeralRoutes } from './amploGeralRoutes';
-export { default as produtividadeRoutes } from './produtividadeRoutes';
\ No newline at end of file
+export { default as produtividadeRoutes } from './produtividadeRoutes';
+export { default as dashboardRoutes } from './dashboardRoutes';
+export { default as healthRoutes } from './healthRoutes';
\ No newline at end of file
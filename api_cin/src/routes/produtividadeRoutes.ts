@@ -1,26 +1,39 @@
 import { Router } from 'express';
 import { authMiddleware } from '../middlewares/auth';
 import { adminDiretoriaMiddleware } from '../middlewares/adminDiretoriaMiddleware';
+import { cacheResponse } from '../lib/responseCache';
 import { CreateProdutividadeDiariaController } from '../controllers/ProdutividadeDiaria/CreateProdutividadeDiariaController';
 import { UpdateProdutividadeDiariaController } from '../controllers/ProdutividadeDiaria/UpdateProdutividadeDiariaController';
 import { DeleteProdutividadeDiariaController } from '../controllers/ProdutividadeDiaria/DeleteProdutividadeDiariaController';
 import { GetMonthlyProductivityController } from '../controllers/ProdutividadeDiaria/GetMonthlyProdutividadeDiariaController';
+import { GetMonthlyProductivityMatrixController } from '../controllers/ProdutividadeDiaria/GetMonthlyProdutividadeMatrixController';
 import { ListTopProductiveCitiesController } from '../controllers/ProdutividadeDiaria/ListTopProdutividadeDiariaController';
 import { ListLeastProductiveCitiesController } from '../controllers/ProdutividadeDiaria/ListLeastProdutividadeDiariaController';
 import { ListTopAndLeastProductiveCitiesController } from '../controllers/ProdutividadeDiaria/ListTopAndLeastProdutividadeDiariaController';
+import { ProductivityRankingController } from '../controllers/ProdutividadeDiaria/ProductivityRankingController';
 import { ListProdutividadeByCidadeController } from '../controllers/ProdutividadeDiaria/ListProdutividadeByCidadeController';
 import { ListProdutividadeGeralMensalController } from '../controllers/ProdutividadeDiaria/ListProdutividadeGeralMensalController';
+import { UpsertProdutividadeDiariaLoteController } from '../controllers/ProdutividadeDiaria/UpsertProdutividadeDiariaLoteController';
+import { ExportProdutividadeDiariaController } from '../controllers/ProdutividadeDiaria/ExportProdutividadeDiariaController';
+
+// Leituras públicas em cache; nomes e rankings também dependem de cin_amplo_geral
+const PRODUTIVIDADE = { tags: ['produtividade' as const, 'amplo-geral' as const] };
 
 const router = Router();
 
 router.post('/produtividade-diaria', authMiddleware, adminDiretoriaMiddleware, new CreateProdutividadeDiariaController().handle);
+router.post('/produtividade-diaria/lote', authMiddleware, adminDiretoriaMiddleware, new UpsertProdutividadeDiariaLoteController().handle);
 router.put('/produtividade-diaria/:id', authMiddleware, adminDiretoriaMiddleware, new UpdateProdutividadeDiariaController().handle);
 router.delete('/produtividade-diaria/:id', authMiddleware, adminDiretoriaMiddleware, new DeleteProdutividadeDiariaController().handle);
-router.get('/produtividade/mensal', new GetMonthlyProductivityController().handle);
-router.get('/produtividade/top-cities', new ListTopProductiveCitiesController().handle);
-router.get('/produtividade/least-cities', new ListLeastProductiveCitiesController().handle);
-router.get('/produtividade/top-and-least-cities', new ListTopAndLeastProductiveCitiesController().handle);
-router.get('/produtividade/by-cidade/:nome_municipio', new ListProdutividadeByCidadeController().handle);
-router.get('/produtividade/geral-mensal', new ListProdutividadeGeralMensalController().handle);
+// Streaming (NDJSON/CSV): fora do cacheResponse, que guardaria o corpo inteiro em memória
+router.get('/produtividade-diaria/export', new ExportProdutividadeDiariaController().handle);
+router.get('/produtividade/mensal', cacheResponse(PRODUTIVIDADE, new GetMonthlyProductivityController().handle));
+router.get('/produtividade/mensal/matriz', cacheResponse(PRODUTIVIDADE, new GetMonthlyProductivityMatrixController().handle));
+router.get('/produtividade/top-cities', cacheResponse(PRODUTIVIDADE, new ListTopProductiveCitiesController().handle));
+router.get('/produtividade/least-cities', cacheResponse(PRODUTIVIDADE, new ListLeastProductiveCitiesController().handle));
+router.get('/produtividade/top-and-least-cities', cacheResponse(PRODUTIVIDADE, new ListTopAndLeastProductiveCitiesController().handle));
+router.get('/produtividade/ranking', cacheResponse(PRODUTIVIDADE, new ProductivityRankingController().handle));
+router.get('/produtividade/by-cidade/:nome_municipio', cacheResponse(PRODUTIVIDADE, new ListProdutividadeByCidadeController().handle));
+router.get('/produtividade/geral-mensal', cacheResponse(PRODUTIVIDADE, new ListProdutividadeGeralMensalController().handle));
 
 export default router;
\ No newline at end of file
@@ -0,0 +1,26 @@
+import fs from 'fs';
+import path from 'path';
+
+// Regenera src/data/municipiosMapa.ts a partir do GeoJSON do dashboard: código IBGE e nome de cada
+// município, na ordem das features. GET /v1/dashboard/mapa devolve os valores nessa mesma ordem,
+// então o mapa pinta a feature i com valores[i]. Rodar sempre que o GeoJSON mudar.
+// Uso: npm run mapa:municipios [-- caminho/do/geojson]
+const GEOJSON = process.argv[2] ?? path.resolve(__dirname, '../../../dashboard_cin/geo/bahia_municipios.json');
+const OUTPUT = path.resolve(__dirname, '../data/municipiosMapa.ts');
+
+interface Feature {
+  properties: { GEOCODIGO: string; NOME: string };
+}
+
+const { features } = JSON.parse(fs.readFileSync(GEOJSON, 'utf8')) as { features: Feature[] };
+const linhas = features.map(({ properties }) => `  [${JSON.stringify(String(properties.GEOCODIGO))}, ${JSON.stringify(properties.NOME)}],`);
+
+fs.writeFileSync(OUTPUT, [
+  '// Gerado por npm run mapa:municipios a partir de dashboard_cin/geo/bahia_municipios.json; não editar.',
+  '// [código IBGE, nome] na ordem das features do GeoJSON.',
+  'export const MUNICIPIOS_MAPA: ReadonlyArray<readonly [codigo: string, nome: string]> = [',
+  ...linhas,
+  '];',
+].join('\n'));
+
+console.log(`${features.length} municípios -> ${path.relative(process.cwd(), OUTPUT)}`);
\ No newline at end of file
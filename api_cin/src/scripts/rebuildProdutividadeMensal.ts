@@ -0,0 +1,23 @@
+import dotenv from 'dotenv';
+import logger, { flushLogs } from '../lib/logger';
+import prisma, { disconnectPrisma } from '../lib/prisma';
+
+dotenv.config();
+
+// Recalcula produtividade_mensal_cin a partir de produtividade_diaria_cin.
+// Necessário após backfills feitos com os triggers desabilitados ou restaurações parciais.
+async function main() {
+  const started = Date.now();
+  const [{ total }] = await prisma.$queryRaw<{ total: number }[]>`SELECT "produtividade_mensal_reconstruir"() AS total`;
+  logger.info('Rollup mensal reconstruído', { meses: total, ms: Date.now() - started });
+}
+
+main()
+  .catch((e) => {
+    logger.error('Falha ao reconstruir o rollup mensal', { error: e.message, stack: e.stack });
+    process.exitCode = 1;
+  })
+  .finally(async () => {
+    await disconnectPrisma();
+    await flushLogs();
+  });
\ No newline at end of file
@@ -1,38 +1,53 @@
+import cluster from 'cluster';
 import express from 'express';
 import cors from 'cors';
 import dotenv from 'dotenv';
 import 'express-async-errors';
-import { PrismaClient } from '@prisma/client';
 import rateLimit from 'express-rate-limit';
-import logger from './lib/logger';
-import { userRoutes, amploGeralRoutes, produtividadeRoutes } from './routes'
+import { closeChangeFeed, eventsHandler } from './lib/changeFeed';
+import logger, { flushLogs } from './lib/logger';
+import { metricsHandler, requestMetrics } from './lib/metrics';
+import { disconnectPrisma } from './lib/prisma';
+import { SharedRateLimitStore } from './lib/rateLimitStore';
+import { userRoutes, amploGeralRoutes, produtividadeRoutes, dashboardRoutes, healthRoutes } from './routes'
 
 dotenv.config();
 
 const app = express();
-const prisma = new PrismaClient();
 
 app.use(cors());
-app.use(express.json());
+
+// Prometheus (fora do rate limit e das próprias métricas)
+app.get('/metrics', metricsHandler);
+
+// Feed de mudanças (SSE): conexões longas ficam fora do histograma de duração e do rate limit,
+// limitadas por EVENTS_MAX_CLIENTS
+app.get('/v1/events', eventsHandler);
+
+// Duração, status e requisições em andamento por rota; loga cada requisição ao terminar
+app.use(requestMetrics);
+
+app.use(express.json({ limit: process.env.JSON_BODY_LIMIT || '5mb' })); // Lotes de produtividade passam dos 100kb padrão
 
 // Rate limiting for public endpoints
+// Contadores no SharedStore: no cluster o limite vale para todos os workers juntos.
+// RATE_LIMIT_MAX=0 desliga o limite (instâncias de teste de carga, ver streamlit-docs/teste_carga.py)
+const RATE_LIMIT_MAX = Number(process.env.RATE_LIMIT_MAX ?? 100);
 const limiter = rateLimit({
-  windowMs: 15 * 60 * 1000, // 15 minutes
-  max: 100, // Limit each IP to 100 requests per window
+  windowMs: Number(process.env.RATE_LIMIT_WINDOW_MS) || 15 * 60 * 1000, // 15 minutes
+  max: RATE_LIMIT_MAX, // Limit each IP to 100 requests per window
+  store: new SharedRateLimitStore(),
+  passOnStoreError: true, // se o primário não responder, a requisição passa em vez de falhar
   message: { error: { code: 'RATE_LIMIT_EXCEEDED', message: 'Muitas requisições, tente novamente mais tarde' } }
 });
-app.use('/v1', limiter);
-
-// Middleware global para log de requests
-app.use((req, res, next) => {
-  logger.info('Request received', { method: req.method, url: req.url });
-  next();
-});
+if (RATE_LIMIT_MAX > 0) app.use('/v1', limiter);
 
 // Conecta as rotas com prefixo /v1
 app.use('/v1', userRoutes);
 app.use('/v1', amploGeralRoutes);
 app.use('/v1', produtividadeRoutes);
+app.use('/v1', dashboardRoutes);
+app.use('/v1', healthRoutes);
 
 // Tratamento de erros global
 app.use((err: Error, req: express.Request, res: express.Response, next: express.NextFunction) => {
@@ -40,14 +55,37 @@ app.use((err: Error, req: express.Request, res: express.Response, next: express.
   res.status(500).json({ error: { code: 'INTERNAL_SERVER_ERROR', message: 'Internal Server Error' } });
 });
 
-// Desconecta Prisma ao encerrar o app
-process.on('SIGINT', async () => {
-  await prisma.$disconnect();
-  logger.info('Prisma disconnected, server shutting down');
-  process.exit(0);
+const PORT = process.env.PORT || 3000;
+const server = app.listen(PORT, () => {
+  logger.info(`Server running on port ${PORT}`, { pid: process.pid, worker: cluster.worker?.id });
 });
 
-const PORT = process.env.PORT || 3000;
-app.listen(PORT, () => {
-  logger.info(`Server running on port ${PORT}`);
-});
\ No newline at end of file
+// Encerramento gracioso: para de aceitar conexões, espera as requisições em andamento (no máximo
+// SHUTDOWN_TIMEOUT_MS), desconecta o pool compartilhado do Prisma e grava os logs pendentes.
+// No cluster (src/cluster.ts) o primário pede o encerramento com a mensagem 'shutdown'.
+const SHUTDOWN_TIMEOUT_MS = Number(process.env.SHUTDOWN_TIMEOUT_MS) || 25 * 1000;
+let shuttingDown = false;
+
+const shutdown = async () => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  logger.info('Server shutting down', { pid: process.pid, worker: cluster.worker?.id });
+  const closed = new Promise<void>(resolve => server.close(() => resolve()));
+  closeChangeFeed();
+  server.closeIdleConnections();
+  await Promise.race([
+    closed,
+    new Promise<void>(resolve => setTimeout(resolve, SHUTDOWN_TIMEOUT_MS).unref()),
+  ]);
+  server.closeAllConnections();
+  await disconnectPrisma();
+  await flushLogs();
+  process.exit(0);
+};
+process.on('SIGINT', shutdown);
+process.on('SIGTERM', shutdown);
+process.on('message', message => {
+  if (message === 'shutdown') shutdown();
+});
+// Canal com o primário perdido (primário morreu): encerra em vez de ficar órfão
+cluster.worker?.on('disconnect', shutdown);
\ No newline at end of file
@@ -1,7 +1,8 @@
-import { PrismaClient, Cargo, StatusVisita, StatusPublicacao, StatusInstalacao } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { Cargo, StatusVisita, StatusPublicacao, StatusInstalacao } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 interface CreateAmploGeralData {
   nome_municipio: string;
@@ -18,20 +19,9 @@ interface CreateAmploGeralData {
 }
 
 export class CreateAmploGeralService {
-  async execute(data: CreateAmploGeralData, token: string) {
-    if (!process.env.JWT_SECRET) {
-      throw new Error('JWT_SECRET não foi configurada');
-    }
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute(data: CreateAmploGeralData, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para criar dados em Amplo Geral');
     }
 
@@ -59,6 +49,9 @@ export class CreateAmploGeralService {
       },
     });
 
+    invalidateCacheTags('amplo-geral');
+    publishChange({ entity: 'amplo-geral', ids: [amploGeral.id], municipios: [amploGeral.nome_municipio] });
+
     return { message: 'Amplo Geral criado', amploGeralId: amploGeral.id };
   }
 }
\ No newline at end of file
@@ -1,23 +1,13 @@
-import { PrismaClient, Cargo } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { Cargo } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 export class DeleteAmploGeralService {
-  async execute(id: number, token: string) {
-    if (!process.env.JWT_SECRET) {
-      throw new Error('JWT_SECRET não configurada');
-    }
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute(id: number, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para deletar dados em Amplo Geral');
     }
 
@@ -30,6 +20,9 @@ export class DeleteAmploGeralService {
       where: { id },
     });
 
+    invalidateCacheTags('amplo-geral');
+    publishChange({ entity: 'amplo-geral', ids: [id], municipios: [existingRecord.nome_municipio] });
+
     return { message: 'Amplo Geral deletado com sucesso' };
   }
 }
\ No newline at end of file
@@ -0,0 +1,23 @@
+import { Prisma } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+import { EXPORT_BATCH_SIZE } from '../../lib/exportStream';
+
+export const AMPLO_GERAL_EXPORT_COLUMNS: string[] = Object.values(Prisma.Cin_amplo_geralScalarFieldEnum);
+
+export class ExportAmploGeralService {
+  // Lotes por cursor de id; o próximo só é lido quando o consumidor pede
+  async *execute(batchSize = EXPORT_BATCH_SIZE) {
+    let cursor = 0;
+    while (true) {
+      const rows = await prisma.cin_amplo_geral.findMany({
+        where: { id: { gt: cursor } },
+        orderBy: { id: 'asc' },
+        take: batchSize,
+      });
+      if (rows.length === 0) return;
+      yield rows;
+      if (rows.length < batchSize) return;
+      cursor = rows[rows.length - 1].id;
+    }
+  }
+}
\ No newline at end of file
@@ -1,10 +1,9 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAllAmploGeralService {
-  async execute() {
-    const amploGeral = await prisma.cin_amplo_geral.findMany();
-    return amploGeral;
+  async execute(query: ListQuery = {}) {
+    const amploGeral = await prisma.cin_amplo_geral.findMany(listArgs(query));
+    return toPage(amploGeral, query);
   }
 }
\ No newline at end of file
@@ -1,22 +1,19 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralByDataInstalacao {
-  async execute() {
+  async execute(query: ListQuery = {}) {
     const hoje = new Date();
     const seteDiasAntes = new Date();
     seteDiasAntes.setDate(hoje.getDate() - 7);
 
-    const cidadesInstaladas = await prisma.cin_amplo_geral.findMany({
-      where: {
-        periodo_instalacao: {
-          gte: seteDiasAntes,
-          lte: hoje,
-        },
+    const cidadesInstaladas = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+      periodo_instalacao: {
+        gte: seteDiasAntes,
+        lte: hoje,
       },
-    });
+    }));
 
-    return cidadesInstaladas;
+    return toPage(cidadesInstaladas, query);
   }
 }
\ No newline at end of file
@@ -1,6 +1,4 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
 
 export class ListByIdAmploGeralService {
   async execute(id: number) {
@@ -1,9 +1,8 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListByInstalacaoAmploGeralService {
-  async execute(instalacao: string) {
+  async execute(instalacao: string, query: ListQuery = {}) {
  
     console.log('Service instalacao:', instalacao);
 
@@ -40,17 +39,15 @@ export class ListByInstalacaoAmploGeralService {
       endOfDay: endOfDay.toISOString(),
     });
 
-    const amploGeral = await prisma.cin_amplo_geral.findMany({
-      where: {
-        periodo_instalacao: {
-          gte: startOfDay,
-          lte: endOfDay,
-        },
+    const amploGeral = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+      periodo_instalacao: {
+        gte: startOfDay,
+        lte: endOfDay,
       },
-    });
+    }));
 
     console.log('Found records:', amploGeral.length, 'Records:', amploGeral);
 
-    return amploGeral;
+    return toPage(amploGeral, query);
   }
 }
\ No newline at end of file
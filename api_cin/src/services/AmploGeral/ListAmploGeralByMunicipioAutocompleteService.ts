@@ -1,24 +1,10 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { searchMunicipios } from '../../lib/municipioSearch';
 
 export class ListAmploGeralByMunicipioAutocompleteService {
   async execute(query: string, limit: number = 10) {
-    const cities = await prisma.cin_amplo_geral.findMany({
-      where: {
-        nome_municipio: {
-          contains: query,
-          mode: 'insensitive'
-        }
-      },
-      select: {
-        id: true,
-        nome_municipio: true
-      },
-      take: limit,
-      orderBy: { nome_municipio: 'asc' }
-    });
+    // Sem acento e tolerante a erros de digitação, melhores resultados primeiro
+    const cities = await searchMunicipios(query, { mode: 'fuzzy', limit });
 
-    return cities;
+    return cities.map(({ id, nome_municipio }) => ({ id, nome_municipio }));
   }
 }
\ No newline at end of file
@@ -1,21 +1,21 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
+import { searchMunicipios } from '../../lib/municipioSearch';
 
 export class ListByNomeMunicipioAmploGeralService {
-  async execute(nome_municipio: string) {
-    const amploGeral = await prisma.cin_amplo_geral.findMany({
-      where: {
-        nome_municipio: {
-          contains: nome_municipio,
-          mode: 'insensitive',
-        },
-      },
-      include: {
-        produtividades_diarias: true,
-      },
-    });
+  async execute(nome_municipio: string, query: ListQuery = {}) {
+    // Trecho do nome, sem acento; a busca devolve os ids já ordenados por relevância
+    const matches = await searchMunicipios(nome_municipio, { mode: 'contains' });
+    const ids = matches.map(match => match.id);
+
+    const amploGeral = await prisma.cin_amplo_geral.findMany(listArgs(query, { id: { in: ids } }, true));
+
+    // Sem paginação a lista sai na ordem da busca (melhor correspondência primeiro); páginas seguem o cursor por id
+    if (query.limit === undefined && query.cursor === undefined) {
+      const rank = new Map(ids.map((id, i) => [id, i]));
+      amploGeral.sort((a, b) => rank.get(a.id)! - rank.get(b.id)!);
+    }
 
-    return amploGeral;
+    return toPage(amploGeral, query);
   }
 }
\ No newline at end of file
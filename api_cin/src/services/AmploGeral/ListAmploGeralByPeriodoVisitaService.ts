@@ -1,21 +1,18 @@
-import { PrismaClient } from "@prisma/client";
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralByPeriodoVisitaService{
-    async execute(periodo_visita: string){
+    async execute(periodo_visita: string, query: ListQuery = {}){
         if(!periodo_visita || isNaN(Date.parse(periodo_visita))){
             throw new Error('Data do periodo da visita inválida')
         }
 
-        const amploGeralVisita = await prisma.cin_amplo_geral.findMany({
-            where:{
-                periodo_visita:{
-                    equals: new Date(periodo_visita),
-                },
+        const amploGeralVisita = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+            periodo_visita:{
+                equals: new Date(periodo_visita),
             },
-        });
+        }));
 
-        return amploGeralVisita;
+        return toPage(amploGeralVisita, query);
     };
 };
\ No newline at end of file
@@ -1,20 +1,17 @@
-import { PrismaClient } from "@prisma/client";
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralByStatusInfraService {
-    async execute(status_infra: string) {
+    async execute(status_infra: string, query: ListQuery = {}) {
         if (!status_infra) "É necessario digitar o status da infraestrutura"
 
-        const amploGeralInfra = await prisma.cin_amplo_geral.findMany({
-            where: {
-                status_infra: {
-                    contains: status_infra,
-                    mode: 'insensitive',
-                },
+        const amploGeralInfra = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+            status_infra: {
+                contains: status_infra,
+                mode: 'insensitive',
             },
-        });
+        }));
 
-        return amploGeralInfra;
+        return toPage(amploGeralInfra, query);
     };
 };
\ No newline at end of file
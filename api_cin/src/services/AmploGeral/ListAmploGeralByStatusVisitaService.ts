@@ -1,21 +1,19 @@
-import { PrismaClient, StatusVisita } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { StatusVisita } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralByStatusVisitaService {
-  async execute(status_visita: StatusVisita) {
+  async execute(status_visita: StatusVisita, query: ListQuery = {}) {
     if (!status_visita) {
       throw new Error('É necessário informar o status da visita');
     }
 
-    const amploGeralVisita = await prisma.cin_amplo_geral.findMany({
-      where: {
-        status_visita: {
-          equals: status_visita,
-        },
+    const amploGeralVisita = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+      status_visita: {
+        equals: status_visita,
       },
-    });
+    }));
 
-    return amploGeralVisita;
+    return toPage(amploGeralVisita, query);
   }
 }
\ No newline at end of file
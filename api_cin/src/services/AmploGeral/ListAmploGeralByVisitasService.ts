@@ -1,34 +1,31 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralByVisitas {
-  async execute() {
+  async execute(query: ListQuery = {}) {
     const hoje = new Date();
     const seteDiasDepois = new Date();
     seteDiasDepois.setDate(hoje.getDate() + 7);
 
-    const cidadesParaVisita = await prisma.cin_amplo_geral.findMany({
-      where: {
-        OR: [
-          {
-            cidade_visita: true,
-            periodo_visita: {
-              gte: hoje,
-              lte: seteDiasDepois,
-            },
+    const cidadesParaVisita = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+      OR: [
+        {
+          cidade_visita: true,
+          periodo_visita: {
+            gte: hoje,
+            lte: seteDiasDepois,
           },
-          {
-            cidade_visita: false,
-            data_visita: {
-              gte: hoje,
-              lte: seteDiasDepois,
-            },
+        },
+        {
+          cidade_visita: false,
+          data_visita: {
+            gte: hoje,
+            lte: seteDiasDepois,
           },
-        ],
-      },
-    });
+        },
+      ],
+    }));
 
-    return cidadesParaVisita;
+    return toPage(cidadesParaVisita, query);
   }
 }
\ No newline at end of file
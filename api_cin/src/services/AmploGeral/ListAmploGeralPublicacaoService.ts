@@ -1,19 +1,16 @@
-import { PrismaClient } from "@prisma/client";
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
+import { ListQuery, listArgs, toPage } from '../../lib/listQuery';
 
 export class ListAmploGeralPublicacaoService{
-    async execute(publicacao:string){
+    async execute(publicacao:string, query: ListQuery = {}){
         if(!publicacao || isNaN(Date.parse(publicacao))) "Data da publicação inválida."
 
-        const amploGeralPublicacao = await prisma.cin_amplo_geral.findMany({
-            where:{
-                publicacao:{
-                    equals: new Date(publicacao),
-                },
+        const amploGeralPublicacao = await prisma.cin_amplo_geral.findMany(listArgs(query, {
+            publicacao:{
+                equals: new Date(publicacao),
             },
-        });
+        }));
   
-        return amploGeralPublicacao;
+        return toPage(amploGeralPublicacao, query);
     };
 };
\ No newline at end of file
@@ -0,0 +1,159 @@
+import { StatusInstalacao, StatusPublicacao, StatusVisita } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+
+// Colunas de status que podem ser agrupadas, com os valores possíveis de cada enum
+export const STATUS_DIMENSIONS = {
+  status_visita: Object.values(StatusVisita),
+  status_publicacao: Object.values(StatusPublicacao),
+  status_instalacao: Object.values(StatusInstalacao),
+} as const;
+
+export type StatusDimension = keyof typeof STATUS_DIMENSIONS;
+
+export interface StatusBreakdownFilter {
+  dimensions: StatusDimension[];
+  includeCities?: boolean;
+}
+
+export interface StatusBreakdownRow {
+  id: number;
+  nome_municipio: string;
+  status_visita: string;
+  status_publicacao: string;
+  status_instalacao: string;
+}
+
+export interface StatusBreakdownGroup {
+  values: Partial<Record<StatusDimension, string>>;
+  count: number;
+  percentage: number;
+  cities?: Array<Record<string, string | number>>;
+}
+
+export interface StatusBreakdown {
+  dimensions: StatusDimension[];
+  total: number;
+  groups: StatusBreakdownGroup[];
+}
+
+const percentage = (count: number, total: number) => (total > 0 ? Number(((count / total) * 100).toFixed(2)) : 0);
+
+const groupKey = (values: Partial<Record<StatusDimension, string>>, dimensions: StatusDimension[]) =>
+  dimensions.map(dimension => values[dimension]).join('|');
+
+// Todas as combinações dos enums, para que grupos sem cidades apareçam com contagem zero
+const combinations = (dimensions: StatusDimension[]) =>
+  dimensions.reduce<Array<Partial<Record<StatusDimension, string>>>>(
+    (acc, dimension) => acc.flatMap(values => (STATUS_DIMENSIONS[dimension] as readonly string[]).map(value => ({ ...values, [dimension]: value }))),
+    [{}]
+  );
+
+const emptyGroups = (dimensions: StatusDimension[], includeCities: boolean) => {
+  const groups = new Map<string, StatusBreakdownGroup>();
+  for (const values of combinations(dimensions)) {
+    groups.set(groupKey(values, dimensions), { values, count: 0, percentage: 0, ...(includeCities ? { cities: [] } : {}) });
+  }
+  return groups;
+};
+
+const finish = (dimensions: StatusDimension[], groups: Map<string, StatusBreakdownGroup>): StatusBreakdown => {
+  const total = [...groups.values()].reduce((sum, group) => sum + group.count, 0);
+  for (const group of groups.values()) group.percentage = percentage(group.count, total);
+  return { dimensions, total, groups: [...groups.values()] };
+};
+
+// Agrupa linhas já carregadas (usado também pelo resumo do dashboard, que lê a tabela inteira uma vez)
+export function buildStatusBreakdown(
+  rows: StatusBreakdownRow[],
+  dimensions: StatusDimension[],
+  includeCities = true
+): StatusBreakdown {
+  const groups = emptyGroups(dimensions, includeCities);
+  for (const row of rows) {
+    const group = groups.get(groupKey(row, dimensions));
+    if (!group) continue;
+    group.count += 1;
+    if (group.cities) {
+      const city: Record<string, string | number> = { id: row.id, nome_municipio: row.nome_municipio };
+      for (const dimension of dimensions) city[dimension] = row[dimension];
+      group.cities.push(city);
+    }
+  }
+  return finish(dimensions, groups);
+}
+
+export function findStatusGroup(breakdown: StatusBreakdown, values: Partial<Record<StatusDimension, string>>) {
+  const key = groupKey(values, breakdown.dimensions);
+  return breakdown.groups.find(group => groupKey(group.values, breakdown.dimensions) === key)!;
+}
+
+// Formatos das rotas *-breakdown, mantidos para os clientes existentes
+const withCities = (group: StatusBreakdownGroup, key: string) => (group.cities ? { [key]: group.cities } : {});
+
+export function toStatusVisitaBreakdown(breakdown: StatusBreakdown) {
+  const approved = findStatusGroup(breakdown, { status_visita: 'Aprovado' });
+  const rejected = findStatusGroup(breakdown, { status_visita: 'Reprovado' });
+  return {
+    approvedCount: approved.count,
+    rejectedCount: rejected.count,
+    totalCitiesWithStatus: breakdown.total,
+    approvedPercentage: approved.percentage,
+    rejectedPercentage: rejected.percentage,
+    ...withCities(approved, 'approvedCities'),
+    ...withCities(rejected, 'rejectedCities'),
+  };
+}
+
+export function toStatusPublicacaoBreakdown(breakdown: StatusBreakdown) {
+  const published = findStatusGroup(breakdown, { status_publicacao: 'publicado' });
+  const awaiting = findStatusGroup(breakdown, { status_publicacao: 'aguardando_publicacao' });
+  return {
+    publishedCount: published.count,
+    awaitingCount: awaiting.count,
+    totalCitiesWithStatus: breakdown.total,
+    publishedPercentage: published.percentage,
+    awaitingPercentage: awaiting.percentage,
+    ...withCities(published, 'publishedCities'),
+    ...withCities(awaiting, 'awaitingPublicationCities'),
+  };
+}
+
+export function toStatusInstalacaoBreakdown(breakdown: StatusBreakdown) {
+  const installed = findStatusGroup(breakdown, { status_instalacao: 'instalado' });
+  const awaiting = findStatusGroup(breakdown, { status_instalacao: 'aguardando_instalacao' });
+  return {
+    installedCount: installed.count,
+    awaitingCount: awaiting.count,
+    totalCitiesWithStatus: breakdown.total,
+    installedPercentage: installed.percentage,
+    awaitingPercentage: awaiting.percentage,
+    ...withCities(installed, 'installedCities'),
+    ...withCities(awaiting, 'awaitingInstallationCities'),
+  };
+}
+
+export class StatusBreakdownService {
+  // Uma única consulta: groupBy quando só os números interessam, findMany enxuto quando as listas são pedidas
+  async execute({ dimensions, includeCities = true }: StatusBreakdownFilter): Promise<StatusBreakdown> {
+    if (includeCities) {
+      // As três colunas de status são enums curtos: selecioná-las sempre mantém o retorno tipado
+      const rows = await prisma.cin_amplo_geral.findMany({
+        select: { id: true, nome_municipio: true, status_visita: true, status_publicacao: true, status_instalacao: true },
+        orderBy: { id: 'asc' },
+      });
+      return buildStatusBreakdown(rows, dimensions, true);
+    }
+
+    const counts = await prisma.cin_amplo_geral.groupBy({
+      by: dimensions,
+      _count: { _all: true },
+    });
+
+    const groups = emptyGroups(dimensions, false);
+    for (const row of counts) {
+      const group = groups.get(groupKey(row, dimensions));
+      if (group) group.count = row._count._all;
+    }
+    return finish(dimensions, groups);
+  }
+}
\ No newline at end of file
@@ -1,7 +1,8 @@
-import { PrismaClient, StatusVisita, Cargo, StatusPublicacao, StatusInstalacao } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { StatusVisita, Cargo, StatusPublicacao, StatusInstalacao } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 interface UpdateAmploGeralData {
   id: number;
@@ -16,20 +17,9 @@ interface UpdateAmploGeralData {
 }
 
 export class UpdateAmploGeralService {
-  async execute({ id, nome_municipio, status_infra, periodo_visita, status_visita, status_publicacao, status_instalacao, publicacao, periodo_instalacao }: UpdateAmploGeralData, token: string) {
-    if (!process.env.JWT_SECRET) {
-      throw new Error('JWT_SECRET não configurada');
-    }
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute({ id, nome_municipio, status_infra, periodo_visita, status_visita, status_publicacao, status_instalacao, publicacao, periodo_instalacao }: UpdateAmploGeralData, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para atualizar Amplo Geral');
     }
 
@@ -59,6 +49,14 @@ export class UpdateAmploGeralService {
       },
     });
 
+    invalidateCacheTags('amplo-geral');
+    // Renomear afeta as consultas pelo nome antigo e pelo novo
+    publishChange({
+      entity: 'amplo-geral',
+      ids: [id],
+      municipios: [existingRecord.nome_municipio, updateAmploGeral.nome_municipio],
+    });
+
     return { message: 'Amplo Geral atualizado', amploGeral: updateAmploGeral };
   }
 }
\ No newline at end of file
@@ -0,0 +1,50 @@
+import {
+  buildStatusBreakdown,
+  toStatusInstalacaoBreakdown,
+  toStatusPublicacaoBreakdown,
+  toStatusVisitaBreakdown,
+} from '../AmploGeral/StatusBreakdownService';
+import { prismaRead as prisma } from '../../lib/prisma';
+
+const percentage = (count: number, total: number) => (total > 0 ? Number(((count / total) * 100).toFixed(2)) : 0);
+
+const toMonthYear = (mes: Date) => `${mes.getUTCFullYear()}-${(mes.getUTCMonth() + 1).toString().padStart(2, '0')}`;
+
+export class GetDashboardSummaryService {
+  // Todos os cartões a partir de uma leitura de cin_amplo_geral + totais mensais do rollup
+  async execute() {
+    const [cities, monthlyTotals] = await Promise.all([
+      prisma.cin_amplo_geral.findMany({ orderBy: { id: 'asc' } }),
+      prisma.produtividade_mensal_cin.groupBy({
+        by: ['mes'],
+        _sum: { quantidade: true },
+        orderBy: { mes: 'asc' },
+      }),
+    ]);
+
+    const visitedCities = cities
+      .filter(city => city.periodo_visita !== null)
+      .map(({ id, nome_municipio, periodo_visita }) => ({ id, nome_municipio, periodo_visita }));
+    const totalCities = cities.length;
+
+    // Mesmos formatos das rotas individuais (visited-cities e *-breakdown)
+    return {
+      generatedAt: new Date().toISOString(),
+      totalCities,
+      visited: {
+        visitedCount: visitedCities.length,
+        totalCities,
+        percentage: percentage(visitedCities.length, totalCities),
+        visitedCities,
+      },
+      statusVisita: toStatusVisitaBreakdown(buildStatusBreakdown(cities, ['status_visita'])),
+      statusPublicacao: toStatusPublicacaoBreakdown(buildStatusBreakdown(cities, ['status_publicacao'])),
+      statusInstalacao: toStatusInstalacaoBreakdown(buildStatusBreakdown(cities, ['status_instalacao'])),
+      monthly: monthlyTotals.map(month => ({
+        monthYear: toMonthYear(month.mes),
+        quantidade: month._sum.quantidade || 0,
+      })),
+      cities,
+    };
+  }
+}
\ No newline at end of file
@@ -0,0 +1,89 @@
+import { Prisma, StatusInstalacao, StatusPublicacao, StatusVisita } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+import { MUNICIPIOS_MAPA } from '../../data/municipiosMapa';
+import { MapaMetricaFilter } from '../../types/serviceArgs';
+import { yearRange } from '../ProdutividadeDiaria/ProductivityRankingService';
+
+// Vetor de uma métrica por município, já na ordem das features do GeoJSON do dashboard
+// (src/data/municipiosMapa.ts): o mapa pinta a feature i com valores[i], sem baixar a lista de
+// municípios nem cruzar nomes no navegador. Municípios do mapa sem cadastro ficam com 0 em status
+// e null nas demais métricas.
+//   status        -> índice em legenda, status mais avançado (mesma prioridade do mapa de calor)
+//   produtividade -> total do período (ano ou mês), pelo rollup mensal; max para a escala
+//   faixa         -> quintil de produtividade no período entre os municípios que produziram
+//                    (1 = 20% mais produtivos), 0 sem produção
+export const STATUS_LEGENDA = ['Não Informado', 'Instalado', 'Publicado', 'Ag. Instalação', 'Ag. Publicação', 'Aprovado', 'Reprovado'];
+export const FAIXA_LEGENDA = ['Sem produção', 'Top 20%', '20-40%', '40-60%', '60-80%', '80-100%'];
+
+interface MapaRow {
+  cadastrado: boolean;
+  status_visita: StatusVisita | null;
+  status_publicacao: StatusPublicacao | null;
+  status_instalacao: StatusInstalacao | null;
+  total: number | null;
+  faixa: number | null;
+}
+
+const NOMES = MUNICIPIOS_MAPA.map(([, nome]) => nome);
+
+const statusCode = (row: MapaRow) =>
+  !row.cadastrado ? 0 :
+  row.status_instalacao === StatusInstalacao.instalado ? 1 :
+  row.status_publicacao === StatusPublicacao.publicado ? 2 :
+  row.status_instalacao === StatusInstalacao.aguardando_instalacao ? 3 :
+  row.status_publicacao === StatusPublicacao.aguardando_publicacao ? 4 :
+  row.status_visita === StatusVisita.Aprovado ? 5 :
+  row.status_visita === StatusVisita.Reprovado ? 6 :
+  0;
+
+const periodRange = (ano: number, mes?: number) =>
+  mes
+    ? { inicio: new Date(Date.UTC(ano, mes - 1, 1)), fim: new Date(Date.UTC(ano, mes, 1)) }
+    : yearRange(ano);
+
+export class GetMapaMetricaService {
+  async execute({ metrica, ano, mes }: MapaMetricaFilter) {
+    const { inicio, fim } = periodRange(ano, mes);
+    // status não depende do período: dispensa a soma do rollup
+    const totais = metrica === 'status'
+      ? Prisma.sql`SELECT NULL::int AS "cin_amplo_geral_id", NULL::bigint AS total WHERE false`
+      : Prisma.sql`
+          SELECT "cin_amplo_geral_id", SUM("quantidade") AS total
+          FROM "produtividade_mensal_cin"
+          WHERE "mes" >= ${inicio.toISOString()}::date AND "mes" < ${fim.toISOString()}::date
+          GROUP BY "cin_amplo_geral_id"`;
+
+    // Nomes do mapa casados por normalizar_nome (mesma regra da busca por município), na ordem do GeoJSON
+    const rows = await prisma.$queryRaw<MapaRow[]>`
+      WITH totais AS (${totais}),
+      municipios AS (
+        SELECT
+          "normalizar_nome"(c."nome_municipio") AS chave,
+          c."status_visita", c."status_publicacao", c."status_instalacao",
+          COALESCE(t.total, 0)::int AS total,
+          CASE WHEN COALESCE(t.total, 0) > 0
+               THEN NTILE(5) OVER (PARTITION BY COALESCE(t.total, 0) > 0 ORDER BY t.total DESC, c."nome_municipio")
+               ELSE 0 END::int AS faixa
+        FROM "cin_amplo_geral" c
+        LEFT JOIN totais t ON t."cin_amplo_geral_id" = c."id"
+      )
+      SELECT DISTINCT ON (m.ordem)
+        mu.chave IS NOT NULL AS cadastrado,
+        mu."status_visita", mu."status_publicacao", mu."status_instalacao", mu.total, mu.faixa
+      FROM unnest(${NOMES}::text[]) WITH ORDINALITY AS m(nome, ordem)
+      LEFT JOIN municipios mu ON mu.chave = "normalizar_nome"(m.nome)
+      ORDER BY m.ordem
+    `;
+
+    const periodo = metrica === 'status' ? {} : { ano, mes: mes ?? null };
+
+    if (metrica === 'status') {
+      return { metrica, ...periodo, legenda: STATUS_LEGENDA, valores: rows.map(statusCode) };
+    }
+    if (metrica === 'faixa') {
+      return { metrica, ...periodo, legenda: FAIXA_LEGENDA, valores: rows.map(row => (row.cadastrado ? row.faixa : null)) };
+    }
+    const valores = rows.map(row => (row.cadastrado ? row.total : null));
+    return { metrica, ...periodo, max: Math.max(0, ...valores.map(valor => valor ?? 0)), valores };
+  }
+}
\ No newline at end of file
@@ -1,7 +1,8 @@
-import { Cargo, PrismaClient } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { Cargo } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 interface CreateProdutividadeDiariaData {
   cin_amplo_geral_id: number;
@@ -10,18 +11,9 @@ interface CreateProdutividadeDiariaData {
 }
 
 export class CreateProdutividadeDiaria {
-  async execute({ cin_amplo_geral_id, data, quantidade }: CreateProdutividadeDiariaData, token: string) {
-    if (!process.env.JWT_SECRET) throw new Error('JWT_SECRET não foi configurada');
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute({ cin_amplo_geral_id, data, quantidade }: CreateProdutividadeDiariaData, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para criar estes dados.');
     }
 
@@ -55,6 +47,14 @@ export class CreateProdutividadeDiaria {
       },
     });
 
+    invalidateCacheTags('produtividade');
+    publishChange({
+      entity: 'produtividade',
+      ids: [cin_amplo_geral_id],
+      municipios: [municipioExists.nome_municipio],
+      datas: [produtividadeDiaria.data],
+    });
+
     return { message: 'Produtividade Criada', produtividadeId: produtividadeDiaria.id };
   }
 }
\ No newline at end of file
@@ -1,33 +1,34 @@
-import { Cargo, PrismaClient } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { Cargo } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 export class DeleteProdutividadeDiariaService {
-  async execute(id: number, token: string) {
-    if (!process.env.JWT_SECRET) {
-      throw new Error('JWT_SECRET não configurada');
-    }
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute(id: number, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para deletar produtividade diária');
     }
 
-    const existingRecord = await prisma.produtividade_diaria_cin.findUnique({ where: { id } });
+    const existingRecord = await prisma.produtividade_diaria_cin.findUnique({
+      where: { id },
+      include: { cin_amplo_geral: { select: { nome_municipio: true } } },
+    });
     if (!existingRecord) {
       throw new Error('Registro não encontrado');
     }
 
     await prisma.produtividade_diaria_cin.delete({ where: { id } });
 
+    invalidateCacheTags('produtividade');
+    publishChange({
+      entity: 'produtividade',
+      ids: [existingRecord.cin_amplo_geral_id],
+      municipios: [existingRecord.cin_amplo_geral.nome_municipio],
+      datas: [existingRecord.data],
+    });
+
     return { message: 'Produtividade diária deletada com sucesso' };
   }
 }
\ No newline at end of file
@@ -0,0 +1,35 @@
+import { Prisma } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+import { EXPORT_BATCH_SIZE } from '../../lib/exportStream';
+import { ProdutividadeExportFilter } from '../../types/serviceArgs';
+
+export const PRODUTIVIDADE_EXPORT_COLUMNS = ['id', 'cin_amplo_geral_id', 'nome_municipio', 'data', 'quantidade'];
+
+export class ExportProdutividadeDiariaService {
+  // Lotes por cursor de id; o próximo só é lido quando o consumidor pede
+  async *execute({ inicio, fim, cin_amplo_geral_id }: ProdutividadeExportFilter, batchSize = EXPORT_BATCH_SIZE) {
+    const where: Prisma.produtividade_diaria_cinWhereInput = {};
+    if (cin_amplo_geral_id) where.cin_amplo_geral_id = cin_amplo_geral_id;
+    if (inicio || fim) where.data = { gte: inicio, lt: fim };
+
+    let cursor = 0;
+    while (true) {
+      const rows = await prisma.produtividade_diaria_cin.findMany({
+        where: { ...where, id: { gt: cursor } },
+        orderBy: { id: 'asc' },
+        take: batchSize,
+        select: {
+          id: true,
+          cin_amplo_geral_id: true,
+          data: true,
+          quantidade: true,
+          cin_amplo_geral: { select: { nome_municipio: true } },
+        },
+      });
+      if (rows.length === 0) return;
+      yield rows.map(({ cin_amplo_geral, ...row }) => ({ ...row, nome_municipio: cin_amplo_geral.nome_municipio }));
+      if (rows.length < batchSize) return;
+      cursor = rows[rows.length - 1].id;
+    }
+  }
+}
\ No newline at end of file
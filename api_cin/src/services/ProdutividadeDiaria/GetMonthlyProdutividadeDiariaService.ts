@@ -1,6 +1,4 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prismaRead as prisma } from '../../lib/prisma';
 
 interface MonthlyProductivityFilter {
   cin_amplo_geral_id: number;
@@ -9,9 +7,21 @@ interface MonthlyProductivityFilter {
 
 export class GetMonthlyProductivityService {
   async execute({ cin_amplo_geral_id, ano }: MonthlyProductivityFilter) {
+    // Uma única chamada sobre o rollup mensal, no lugar de 12 aggregates em sequência
     const municipio = await prisma.cin_amplo_geral.findUnique({
       where: { id: cin_amplo_geral_id },
-      select: { nome_municipio: true },
+      select: {
+        nome_municipio: true,
+        produtividades_mensais: {
+          where: {
+            mes: {
+              gte: new Date(Date.UTC(ano, 0, 1)),
+              lt: new Date(Date.UTC(ano + 1, 0, 1)),
+            },
+          },
+          select: { mes: true, quantidade: true },
+        },
+      },
     });
     if (!municipio) {
       throw new Error('Município não encontrado em cin_amplo_geral');
@@ -21,26 +31,10 @@ export class GetMonthlyProductivityService {
       'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
       'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro',
     ];
-    const result: { [key: string]: number } = {};
-
-    for (let i = 0; i < 12; i++) {
-      const monthStart = new Date(`${ano}-${String(i + 1).padStart(2, '0')}-01`);
-      const monthEnd = new Date(ano, i + 1, 0, 23, 59, 59, 999);
-
-      const total = await prisma.produtividade_diaria_cin.aggregate({
-        where: {
-          cin_amplo_geral_id,
-          data: {
-            gte: monthStart,
-            lte: monthEnd,
-          },
-        },
-        _sum: {
-          quantidade: true,
-        },
-      });
+    const result: { [key: string]: number } = Object.fromEntries(months.map(month => [month, 0]));
 
-      result[months[i]] = total._sum.quantidade || 0;
+    for (const { mes, quantidade } of municipio.produtividades_mensais) {
+      result[months[mes.getUTCMonth()]] = quantidade;
     }
 
     return { nome_municipio: municipio.nome_municipio, ano, ...result };
@@ -0,0 +1,63 @@
+import { prismaRead as prisma } from '../../lib/prisma';
+import { MonthlyMatrixFilter } from '../../types/serviceArgs';
+
+const toMonthYear = (ano: number, month: number) => `${ano}-${(month + 1).toString().padStart(2, '0')}`;
+
+export class GetMonthlyProductivityMatrixService {
+  async execute({ cin_amplo_geral_ids, ano_inicio, ano_fim }: MonthlyMatrixFilter) {
+    const ids = [...new Set(cin_amplo_geral_ids)];
+
+    // Nomes e valores em paralelo; os valores vêm do rollup mensal em uma única consulta
+    const [municipios, mensais] = await Promise.all([
+      prisma.cin_amplo_geral.findMany({
+        where: { id: { in: ids } },
+        select: { id: true, nome_municipio: true },
+      }),
+      prisma.produtividade_mensal_cin.findMany({
+        where: {
+          cin_amplo_geral_id: { in: ids },
+          mes: {
+            gte: new Date(Date.UTC(ano_inicio, 0, 1)),
+            lt: new Date(Date.UTC(ano_fim + 1, 0, 1)),
+          },
+        },
+        select: { cin_amplo_geral_id: true, mes: true, quantidade: true },
+      }),
+    ]);
+
+    if (municipios.length !== ids.length) {
+      return null; // Algum id não existe em cin_amplo_geral
+    }
+
+    const nomeById = new Map(municipios.map(m => [m.id, m.nome_municipio]));
+
+    const meses: string[] = [];
+    for (let ano = ano_inicio; ano <= ano_fim; ano++) {
+      for (let month = 0; month < 12; month++) {
+        meses.push(toMonthYear(ano, month));
+      }
+    }
+
+    // Matriz densa: meses sem produção ficam com 0
+    const rowById = new Map(ids.map(id => [id, new Array<number>(meses.length).fill(0)]));
+    for (const { cin_amplo_geral_id, mes, quantidade } of mensais) {
+      const column = (mes.getUTCFullYear() - ano_inicio) * 12 + mes.getUTCMonth();
+      rowById.get(cin_amplo_geral_id)![column] = quantidade;
+    }
+
+    return {
+      ano_inicio,
+      ano_fim,
+      meses,
+      municipios: ids.map(id => {
+        const valores = rowById.get(id)!;
+        return {
+          cin_amplo_geral_id: id,
+          nome_municipio: nomeById.get(id)!,
+          total: valores.reduce((sum, value) => sum + value, 0),
+          valores,
+        };
+      }),
+    };
+  }
+}
\ No newline at end of file
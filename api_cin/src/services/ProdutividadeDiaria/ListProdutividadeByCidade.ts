@@ -1,24 +1,29 @@
-import { PrismaClient } from '@prisma/client';
+import { findMunicipio } from '../../lib/municipioSearch';
+import { prismaRead as prisma } from '../../lib/prisma';
 
-const prisma = new PrismaClient();
+const toMonthYear = (mes: Date) => `${mes.getUTCFullYear()}-${(mes.getUTCMonth() + 1).toString().padStart(2, '0')}`;
 
 export class ListProdutividadeByCidade {
   async execute(nome_municipio: string) {
-    const city = await prisma.cin_amplo_geral.findFirst({
-      where: {
-        nome_municipio: {
-          equals: nome_municipio,
-          mode: 'insensitive', // Case-insensitive search
-        },
-      },
+    // Nome igual ignorando acentos e maiúsculas ("camacari" encontra Camaçari)
+    const match = await findMunicipio(nome_municipio);
+    if (!match) {
+      return null; // Return null if city not found
+    }
+
+    const city = await prisma.cin_amplo_geral.findUnique({
+      where: { id: match.id },
       select: {
         id: true,
         nome_municipio: true,
-        produtividades_diarias: {
+        produtividades_mensais: {
           select: {
-            data: true,
+            mes: true,
             quantidade: true,
           },
+          orderBy: {
+            mes: 'asc',
+          },
         },
       },
     });
@@ -27,26 +32,15 @@ export class ListProdutividadeByCidade {
       return null; // Return null if city not found
     }
 
-    const totalProdutividade = city.produtividades_diarias.reduce((sum, prod) => sum + prod.quantidade, 0);
-
-    const monthlyProdutividade = city.produtividades_diarias.reduce((acc, prod) => {
-      const monthYear = `${prod.data.getFullYear()}-${(prod.data.getMonth() + 1).toString().padStart(2, '0')}`;
-      if (!acc[monthYear]) {
-        acc[monthYear] = 0;
-      }
-      acc[monthYear] += prod.quantidade;
-      return acc;
-    }, {} as Record<string, number>);
-
-    const monthlyBreakdown = Object.entries(monthlyProdutividade).map(([monthYear, quantidade]) => ({
-      monthYear,
-      quantidade,
-    }));
+    const totalProdutividade = city.produtividades_mensais.reduce((sum, month) => sum + month.quantidade, 0);
 
     return {
       nome_municipio: city.nome_municipio,
       totalProdutividade,
-      monthlyProdutividade: monthlyBreakdown.sort((a, b) => a.monthYear.localeCompare(b.monthYear)),
+      monthlyProdutividade: city.produtividades_mensais.map(month => ({
+        monthYear: toMonthYear(month.mes),
+        quantidade: month.quantidade,
+      })),
     };
   }
 }
\ No newline at end of file
@@ -1,33 +1,24 @@
-import { PrismaClient } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
 
-const prisma = new PrismaClient();
+const toMonthYear = (mes: Date) => `${mes.getUTCFullYear()}-${(mes.getUTCMonth() + 1).toString().padStart(2, '0')}`;
 
 export class ListProdutividadeGeralMensal {
   async execute(limit?: number) {
-    const produtividades = await prisma.produtividade_diaria_cin.findMany({
-      select: {
-        data: true,
+    // produtividade_mensal_cin é mantida por trigger: custo proporcional ao número de meses, não de dias
+    const monthlyTotals = await prisma.produtividade_mensal_cin.groupBy({
+      by: ['mes'],
+      _sum: {
         quantidade: true,
       },
+      orderBy: {
+        mes: 'asc',
+      },
+      take: limit,
     });
 
-    const monthlyTotals = produtividades.reduce((acc, prod) => {
-      const monthYear = `${prod.data.getFullYear()}-${(prod.data.getMonth() + 1).toString().padStart(2, '0')}`;
-      if (!acc[monthYear]) {
-        acc[monthYear] = 0;
-      }
-      acc[monthYear] += prod.quantidade;
-      return acc;
-    }, {} as Record<string, number>);
-
-    const result = Object.entries(monthlyTotals).map(([monthYear, quantidade]) => ({
-      monthYear,
-      quantidade,
+    return monthlyTotals.map(month => ({
+      monthYear: toMonthYear(month.mes),
+      quantidade: month._sum.quantidade || 0,
     }));
-
-    const sortedResult = result.sort((a, b) => a.monthYear.localeCompare(b.monthYear));
-
-    // Apply limit if provided
-    return limit !== undefined ? sortedResult.slice(0, limit) : sortedResult;
   }
 }
\ No newline at end of file
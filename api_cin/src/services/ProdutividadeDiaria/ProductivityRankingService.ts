@@ -0,0 +1,93 @@
+import { Prisma } from '@prisma/client';
+import { prismaRead as prisma } from '../../lib/prisma';
+
+interface ProductivityRankingFilter {
+  inicio: Date;
+  fim: Date;
+  limit?: number;
+}
+
+interface RankingRow {
+  cin_amplo_geral_id: number;
+  nome_municipio: string;
+  total_quantidade: number;
+  rank: number;
+  percentile: number;
+  pos_desc: number;
+  pos_asc: number;
+  total_municipios: number;
+}
+
+export interface RankedCity {
+  cin_amplo_geral_id: number;
+  nome_municipio: string;
+  total_quantidade: number;
+  rank: number;
+  percentile: number;
+}
+
+// [inicio, fim) cobrindo o ano civil inteiro, em UTC como o restante da API
+export const yearRange = (ano: number) => ({
+  inicio: new Date(Date.UTC(ano, 0, 1)),
+  fim: new Date(Date.UTC(ano + 1, 0, 1)),
+});
+
+const isMonthStart = (date: Date) =>
+  date.getUTCDate() === 1 && date.getUTCHours() === 0 && date.getUTCMinutes() === 0 && date.getUTCSeconds() === 0 && date.getUTCMilliseconds() === 0;
+
+const toRankedCity = ({ cin_amplo_geral_id, nome_municipio, total_quantidade, rank, percentile }: RankingRow): RankedCity => ({
+  cin_amplo_geral_id,
+  nome_municipio,
+  total_quantidade,
+  rank,
+  percentile: Number((percentile * 100).toFixed(2)),
+});
+
+export class ProductivityRankingService {
+  async execute({ inicio, fim, limit = 5 }: ProductivityRankingFilter) {
+    // Intervalos em meses inteiros somam o rollup mensal; os demais somam a tabela diária
+    const totals = isMonthStart(inicio) && isMonthStart(fim)
+      ? Prisma.sql`
+          SELECT "cin_amplo_geral_id", SUM("quantidade") AS total
+          FROM "produtividade_mensal_cin"
+          WHERE "mes" >= ${inicio.toISOString()}::date AND "mes" < ${fim.toISOString()}::date
+          GROUP BY "cin_amplo_geral_id"`
+      : Prisma.sql`
+          SELECT "cin_amplo_geral_id", SUM("quantidade") AS total
+          FROM "produtividade_diaria_cin"
+          WHERE "data" >= ${inicio.toISOString()}::timestamp(3) AND "data" < ${fim.toISOString()}::timestamp(3)
+          GROUP BY "cin_amplo_geral_id"`;
+
+    // Uma passada: totais por município (zero para quem não produziu), posições nos dois sentidos,
+    // rank e percentil por funções de janela; nomes vêm do próprio JOIN
+    const rows = await prisma.$queryRaw<RankingRow[]>`
+      WITH totais AS (${totals}),
+      ranqueados AS (
+        SELECT
+          c."id" AS cin_amplo_geral_id,
+          c."nome_municipio",
+          COALESCE(t.total, 0)::int AS total_quantidade,
+          RANK() OVER (ORDER BY COALESCE(t.total, 0) DESC)::int AS rank,
+          PERCENT_RANK() OVER (ORDER BY COALESCE(t.total, 0) ASC) AS percentile,
+          ROW_NUMBER() OVER (ORDER BY COALESCE(t.total, 0) DESC, c."nome_municipio" ASC)::int AS pos_desc,
+          ROW_NUMBER() OVER (ORDER BY COALESCE(t.total, 0) ASC, c."nome_municipio" ASC)::int AS pos_asc,
+          COUNT(*) OVER ()::int AS total_municipios
+        FROM "cin_amplo_geral" c
+        LEFT JOIN totais t ON t."cin_amplo_geral_id" = c."id"
+      )
+      SELECT * FROM ranqueados
+      WHERE pos_desc <= ${limit} OR pos_asc <= ${limit}
+    `;
+
+    const topCities = rows.filter(row => row.pos_desc <= limit).sort((a, b) => a.pos_desc - b.pos_desc);
+    const leastCities = rows.filter(row => row.pos_asc <= limit).sort((a, b) => a.pos_asc - b.pos_asc);
+
+    return {
+      inicio: inicio.toISOString(),
+      fim: fim.toISOString(),
+      totalMunicipios: rows[0]?.total_municipios ?? 0,
+      topCities: topCities.map(toRankedCity),
+      leastCities: leastCities.map(toRankedCity),
+    };
+  }
+}
\ No newline at end of file
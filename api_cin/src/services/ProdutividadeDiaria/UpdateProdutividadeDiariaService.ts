@@ -1,7 +1,8 @@
-import { Cargo, PrismaClient } from '@prisma/client';
-import jwt from 'jsonwebtoken';
-
-const prisma = new PrismaClient();
+import { Cargo } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
 
 interface UpdateProdutividadeDiariaData {
   id: number;
@@ -11,24 +12,16 @@ interface UpdateProdutividadeDiariaData {
 }
 
 export class UpdateProdutividadeDiariaService {
-  async execute({ id, cin_amplo_geral_id, data, quantidade }: UpdateProdutividadeDiariaData, token: string) {
-    if (!process.env.JWT_SECRET) {
-      throw new Error('JWT_SECRET não configurada');
-    }
-
-    let decoded: any;
-    try {
-      decoded = jwt.verify(token, process.env.JWT_SECRET);
-    } catch (error) {
-      throw new Error('Token inválido');
-    }
-
+  async execute({ id, cin_amplo_geral_id, data, quantidade }: UpdateProdutividadeDiariaData, user: AuthUser) {
     const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
-    if (!allowedRoles.includes(decoded.cargo)) {
+    if (!allowedRoles.includes(user.cargo)) {
       throw new Error('Usuário não tem permissão para atualizar produtividade diária');
     }
 
-    const existingRecord = await prisma.produtividade_diaria_cin.findUnique({ where: { id } });
+    const existingRecord = await prisma.produtividade_diaria_cin.findUnique({
+      where: { id },
+      include: { cin_amplo_geral: { select: { nome_municipio: true } } },
+    });
     if (!existingRecord) {
       throw new Error('Registro não encontrado');
     }
@@ -58,13 +51,23 @@ export class UpdateProdutividadeDiariaService {
       }
     }
 
-    const updatedRecord = await prisma.produtividade_diaria_cin.update({
+    const { cin_amplo_geral: municipio, ...updatedRecord } = await prisma.produtividade_diaria_cin.update({
       where: { id },
       data: {
         cin_amplo_geral_id,
         data,
         quantidade,
       },
+      include: { cin_amplo_geral: { select: { nome_municipio: true } } },
+    });
+
+    invalidateCacheTags('produtividade');
+    // Trocar município ou data afeta o antigo e o novo
+    publishChange({
+      entity: 'produtividade',
+      ids: [existingRecord.cin_amplo_geral_id, updatedRecord.cin_amplo_geral_id],
+      municipios: [existingRecord.cin_amplo_geral.nome_municipio, municipio.nome_municipio],
+      datas: [existingRecord.data, updatedRecord.data],
     });
 
     return { message: 'Produtividade diária atualizada', record: updatedRecord };
@@ -0,0 +1,89 @@
+import { Cargo } from '@prisma/client';
+import { AuthUser } from '../../lib/tokenCache';
+import { publishChange } from '../../lib/changeFeed';
+import { invalidateCacheTags } from '../../lib/responseCache';
+import prisma from '../../lib/prisma';
+
+export interface ProdutividadeDiariaLoteRow {
+  index: number;
+  cin_amplo_geral_id: number;
+  data: Date;
+  quantidade: number;
+}
+
+export interface ProdutividadeDiariaLoteReject {
+  index: number;
+  motivo: string;
+}
+
+export class UpsertProdutividadeDiariaLoteService {
+  async execute(rows: ProdutividadeDiariaLoteRow[], user: AuthUser) {
+    const allowedRoles = [Cargo.ADMIN, Cargo.DIRETORIA, Cargo.CARTA];
+    if (!allowedRoles.includes(user.cargo)) {
+      throw new Error('Usuário não tem permissão para criar estes dados.');
+    }
+
+    const rejected: ProdutividadeDiariaLoteReject[] = [];
+
+    // Um único lookup por lote para validar os municípios, em vez de um findUnique por linha
+    const ids = [...new Set(rows.map(row => row.cin_amplo_geral_id))];
+    const municipios = await prisma.cin_amplo_geral.findMany({
+      where: { id: { in: ids } },
+      select: { id: true, nome_municipio: true },
+    });
+    const nomes = new Map(municipios.map(m => [m.id, m.nome_municipio]));
+
+    // O mesmo (município, dia) repetido no lote: vale a última ocorrência,
+    // já que o ON CONFLICT não pode atualizar a mesma linha duas vezes no mesmo comando
+    const byKey = new Map<string, ProdutividadeDiariaLoteRow>();
+    for (const row of rows) {
+      if (!nomes.has(row.cin_amplo_geral_id)) {
+        rejected.push({ index: row.index, motivo: `Município ${row.cin_amplo_geral_id} não encontrado em cin_amplo_geral` });
+        continue;
+      }
+      const key = `${row.cin_amplo_geral_id}:${row.data.toISOString()}`;
+      const previous = byKey.get(key);
+      if (previous) {
+        rejected.push({ index: previous.index, motivo: `Duplicado no lote (substituído pela linha ${row.index})` });
+      }
+      byKey.set(key, row);
+    }
+
+    const valid = [...byKey.values()];
+    if (valid.length === 0) {
+      return { message: 'Nenhum registro gravado', received: rows.length, inserted: 0, updated: 0, rejected };
+    }
+
+    // Upsert em um único comando apoiado na constraint @@unique([cin_amplo_geral_id, data]);
+    // xmax = 0 identifica as linhas recém-inseridas
+    const result = await prisma.$queryRaw<{ inserted: boolean }[]>`
+      INSERT INTO "produtividade_diaria_cin" ("cin_amplo_geral_id", "data", "quantidade", "updateAt")
+      SELECT t.cin_amplo_geral_id, t.data, t.quantidade, now()
+      FROM UNNEST(
+        ${valid.map(row => row.cin_amplo_geral_id)}::int[],
+        ${valid.map(row => row.data.toISOString())}::timestamp(3)[],
+        ${valid.map(row => row.quantidade)}::int[]
+      ) AS t(cin_amplo_geral_id, data, quantidade)
+      ON CONFLICT ("cin_amplo_geral_id", "data")
+      DO UPDATE SET "quantidade" = EXCLUDED."quantidade", "updateAt" = now()
+      RETURNING (xmax = 0) AS inserted
+    `;
+
+    invalidateCacheTags('produtividade');
+    publishChange({
+      entity: 'produtividade',
+      ids: valid.map(row => row.cin_amplo_geral_id),
+      municipios: valid.map(row => nomes.get(row.cin_amplo_geral_id)!),
+      datas: valid.map(row => row.data),
+    });
+    const inserted = result.filter(r => r.inserted).length;
+
+    return {
+      message: 'Lote de produtividade processado',
+      received: rows.length,
+      inserted,
+      updated: result.length - inserted,
+      rejected: rejected.sort((a, b) => a.index - b.index),
+    };
+  }
+}
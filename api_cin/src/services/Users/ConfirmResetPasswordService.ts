@@ -1,8 +1,8 @@
-import { PrismaClient } from '@prisma/client';
 import bcrypt from 'bcrypt';
 import { resetCodes } from './RequestResetPasswordService';
+import prisma from '../../lib/prisma';
+import { evictUser } from '../../lib/tokenCache';
 
-const prisma = new PrismaClient();
 const saltRounds = 10;
 
 interface ConfirmResetData {
@@ -18,10 +18,11 @@ export class ConfirmResetPasswordService {
     }
 
     const passwordHash = await bcrypt.hash(newPassword, saltRounds);
-    await prisma.user.update({
+    const user = await prisma.user.update({
       where: { email },
       data: { passwordHash },
     });
+    evictUser(user.id);
 
     delete resetCodes[email];
     return { message: 'Password reset successful' };
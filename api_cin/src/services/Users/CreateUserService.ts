@@ -1,7 +1,7 @@
-import { PrismaClient, Cargo } from '@prisma/client';
+import { Cargo } from '@prisma/client';
 import bcrypt from 'bcrypt';
+import prisma from '../../lib/prisma';
 
-const prisma = new PrismaClient();
 const saltRounds = 10;
 
 interface CreateUserData {
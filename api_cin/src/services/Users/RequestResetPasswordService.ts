@@ -1,9 +1,7 @@
-import { PrismaClient } from '@prisma/client';
+import prisma from '../../lib/prisma';
 
 const resetCodes: { [email: string]: string } = {};
 
-const prisma = new PrismaClient();
-
 interface RequestResetData {
   email: string;
 }
@@ -1,7 +1,7 @@
-import { PrismaClient } from '@prisma/client';
 import bcrypt from 'bcrypt';
+import prisma from '../../lib/prisma';
+import { evictUser } from '../../lib/tokenCache';
 
-const prisma = new PrismaClient();
 const saltRounds = 10;
 
 interface UpdatePasswordData {
@@ -22,6 +22,7 @@ export class UpdatePasswordService {
       where: { id },
       data: { passwordHash },
     });
+    evictUser(id);
 
     return { message: 'Password updated' };
   }
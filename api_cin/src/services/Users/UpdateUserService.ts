@@ -1,6 +1,5 @@
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import prisma from '../../lib/prisma';
+import { evictUser } from '../../lib/tokenCache';
 
 interface UpdateUserData {
   id: number;
@@ -14,6 +13,7 @@ export class UpdateUserService {
       where: { id },
       data: { name, email },
     });
+    evictUser(id);
     return updatedUser;
   }
 }
\ No newline at end of file
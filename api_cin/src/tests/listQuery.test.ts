@@ -0,0 +1,75 @@
+import { listArgs, listQuerySchema, MAX_PAGE_SIZE, toPage } from '../lib/listQuery';
+
+const rows = (...ids: number[]) => ids.map((id) => ({ id, nome_municipio: `Cidade ${id}` }));
+
+describe('listQuerySchema', () => {
+  test('coerces limit and cursor from the query string', () => {
+    expect(listQuerySchema.parse({ limit: '20', cursor: '7' })).toMatchObject({ limit: 20, cursor: 7 });
+  });
+
+  test('accepts limit up to MAX_PAGE_SIZE and rejects anything above', () => {
+    expect(listQuerySchema.parse({ limit: String(MAX_PAGE_SIZE) }).limit).toBe(MAX_PAGE_SIZE);
+    expect(() => listQuerySchema.parse({ limit: String(MAX_PAGE_SIZE + 1) })).toThrow();
+  });
+
+  test('rejects zero or negative limit and cursor', () => {
+    expect(() => listQuerySchema.parse({ limit: '0' })).toThrow();
+    expect(() => listQuerySchema.parse({ cursor: '-1' })).toThrow();
+  });
+});
+
+describe('listArgs', () => {
+  test('fetches one extra row to detect the next page', () => {
+    expect(listArgs({ limit: 10 }).take).toBe(11);
+    expect(listArgs({}).take).toBeUndefined();
+  });
+
+  test('keeps the service filter and adds id > cursor', () => {
+    const args = listArgs({ cursor: 5 }, { cidade_visita: true });
+    expect(args.where).toEqual({ AND: [{ cidade_visita: true }, { id: { gt: 5 } }] });
+    expect(args.orderBy).toEqual({ id: 'asc' });
+  });
+
+  test('always selects id with a field projection', () => {
+    expect(listArgs({ fields: ['nome_municipio'] }).select).toEqual({ nome_municipio: true, id: true });
+  });
+});
+
+describe('toPage', () => {
+  test('without limit or cursor keeps the legacy plain list', () => {
+    const page = toPage(rows(1, 2, 3), {});
+    expect(page.nextCursor).toBeUndefined();
+    expect(page.meta).toEqual({ count: 3 });
+    expect(page.toResponse()).toEqual(rows(1, 2, 3));
+  });
+
+  test('clamps the extra row and points nextCursor at the last item', () => {
+    const page = toPage(rows(1, 2, 3), { limit: 2 });
+    expect(page.items).toEqual(rows(1, 2));
+    expect(page.nextCursor).toBe(2);
+    expect(page.toResponse()).toEqual({ data: rows(1, 2), meta: { count: 2, nextCursor: 2 } });
+  });
+
+  test('returns nextCursor null on the last page', () => {
+    expect(toPage(rows(4, 5), { limit: 2 }).nextCursor).toBeNull();
+    expect(toPage(rows(4), { limit: 2 }).nextCursor).toBeNull();
+    expect(toPage([], { limit: 2, cursor: 9 }).meta).toEqual({ count: 0, nextCursor: null });
+  });
+
+  test('with only a cursor returns everything after it as the last page', () => {
+    const page = toPage(rows(6, 7, 8), { cursor: 5 });
+    expect(page.items).toHaveLength(3);
+    expect(page.nextCursor).toBeNull();
+  });
+
+  test('falls back to null when the projection has no id', () => {
+    const page = toPage([{ nome_municipio: 'A' }, { nome_municipio: 'B' }], { limit: 1 });
+    expect(page.nextCursor).toBeNull();
+  });
+
+  test('puts the most recent produtividade days back in chronological order', () => {
+    const city = { id: 1, produtividades_diarias: [{ data: '2025-03-03' }, { data: '2025-03-02' }, { data: '2025-03-01' }] };
+    toPage([city], { produtividade_limit: 3 });
+    expect(city.produtividades_diarias.map((p) => p.data)).toEqual(['2025-03-01', '2025-03-02', '2025-03-03']);
+  });
+});
\ No newline at end of file
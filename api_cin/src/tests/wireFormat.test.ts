@@ -0,0 +1,67 @@
+import { encodeColumnar } from '../lib/wireFormat';
+
+// Os mesmos casos estão em dashboard_cin/src/tests/columnar.test.ts (decodificação) e
+// streamlit-docs/test_colunar.py: o que sai daqui precisa voltar idêntico do outro lado
+describe('encodeColumnar', () => {
+  test('dictionary-encodes repetitive string columns, keeping nulls as null codes', () => {
+    const rows = [
+      { id: 1, status: 'Aprovado', data: null },
+      { id: 2, status: 'Reprovado', data: '2025-01-02' },
+      { id: 3, status: null, data: null },
+      { id: 4, status: 'Aprovado', data: null },
+    ];
+    expect(encodeColumnar(rows)).toEqual({
+      $rows: 4,
+      columns: {
+        id: [1, 2, 3, 4],
+        status: { $dict: ['Aprovado', 'Reprovado'], codes: [0, 1, null, 0] },
+        data: { $dict: ['2025-01-02'], codes: [null, 0, null, null] },
+      },
+    });
+  });
+
+  test('encodes an all-null column as an empty dictionary', () => {
+    expect(encodeColumnar([{ x: null }, { x: null }])).toEqual({ $rows: 2, columns: { x: { $dict: [], codes: [null, null] } } });
+  });
+
+  test('keeps high-cardinality strings as a plain column', () => {
+    expect(encodeColumnar([{ nome: 'A' }, { nome: 'B' }, { nome: 'C' }])).toEqual({
+      $rows: 3,
+      columns: { nome: ['A', 'B', 'C'] },
+    });
+  });
+
+  test('encodes nested tables inside columns and envelopes', () => {
+    const body = {
+      data: [
+        { nome: 'Salvador', produtividades: [{ dia: '2025-03-01', q: 5 }, { dia: '2025-03-02', q: 7 }] },
+        { nome: 'Camaçari', produtividades: [] },
+      ],
+      meta: { count: 2 },
+    };
+    expect(encodeColumnar(body)).toEqual({
+      data: {
+        $rows: 2,
+        columns: {
+          nome: ['Salvador', 'Camaçari'],
+          produtividades: [{ $rows: 2, columns: { dia: ['2025-03-01', '2025-03-02'], q: [5, 7] } }, []],
+        },
+      },
+      meta: { count: 2 },
+    });
+  });
+
+  test('leaves empty and single-row lists as rows', () => {
+    expect(encodeColumnar([])).toEqual([]);
+    expect(encodeColumnar([{ id: 1 }])).toEqual([{ id: 1 }]);
+  });
+
+  test('encodes rows without keys as a table with no columns', () => {
+    expect(encodeColumnar([{}, {}])).toEqual({ $rows: 2, columns: {} });
+  });
+
+  test('leaves lists with different keys or key order as rows', () => {
+    expect(encodeColumnar([{ a: 1 }, { b: 2 }])).toEqual([{ a: 1 }, { b: 2 }]);
+    expect(encodeColumnar([{ a: 1, b: 2 }, { b: 2, a: 1 }])).toEqual([{ a: 1, b: 2 }, { b: 2, a: 1 }]);
+  });
+});
\ No newline at end of file
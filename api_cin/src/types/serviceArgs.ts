@@ -14,4 +14,28 @@ export interface MunicipioFilter {
 export interface AutocompleteFilter {
   query: string;
   limit?: number;
+}
+
+export interface RankingFilter {
+  inicio: Date;
+  fim: Date;
+  limit?: number;
+}
+
+export interface MonthlyMatrixFilter {
+  cin_amplo_geral_ids: number[];
+  ano_inicio: number;
+  ano_fim: number;
+}
+
+export interface ProdutividadeExportFilter {
+  inicio?: Date;
+  fim?: Date;
+  cin_amplo_geral_id?: number;
+}
+
+export interface MapaMetricaFilter {
+  metrica: 'status' | 'produtividade' | 'faixa';
+  ano: number;
+  mes?: number;
 }
\ No newline at end of file
@@ -0,0 +1,342 @@
+"""Gera os mapas do dashboard: TopoJSON quantizado em vários níveis de detalhe.
+
+Lê ``geo/bahia_municipios.json`` (GeoJSON bruto, ~2,4 MB) e grava em ``public/mapas/``
+um TopoJSON por nível, com nome ``bahia.<nível>.<hash>.topo.json``:
+
+* as fronteiras entre municípios viram arcos compartilhados (cada divisa é guardada uma vez);
+* os arcos são simplificados (Douglas-Peucker, mantendo as junções) com tolerância de meio pixel
+  na largura alvo do nível, quantizados numa grade inteira e gravados em deltas;
+* cada município leva ``centroide`` ([lon, lat]) nas propriedades e ``bbox`` na geometria;
+* o hash do conteúdo no nome permite servir os arquivos com cache ``immutable``.
+
+A ordem dos municípios é a das features do GeoJSON (a mesma de ``GET /v1/dashboard/mapa``).
+Também regenera ``src/data/mapas.ts`` com os arquivos de cada nível e a largura (em pixels)
+até onde cada um basta; ``useMapLevel`` escolhe o menor que cabe na tela. Arquivos de níveis
+antigos são removidos.
+
+Só usa a biblioteca padrão. Rodar sempre que o GeoJSON mudar:
+    npm run mapas
+    python scripts/gerar_mapas.py --entrada outro.geojson
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+ENTRADA = os.path.join(BASE, "geo", "bahia_municipios.json")
+SAIDA = os.path.join(BASE, "public", "mapas")
+MODULO = os.path.join(BASE, "src", "data", "mapas.ts")
+PREFIXO = "bahia"
+OBJETO = "municipios"
+PROPRIEDADES = ("GEOCODIGO", "NOME")
+
+# (nível, largura do estado na tela, em pixels, até onde o nível basta)
+NIVEIS = [
+    ("visao-geral", 600),
+    ("medio", 1600),
+    ("detalhado", 4800),
+]
+TOLERANCIA_PX = 0.5  # erro máximo da simplificação, em pixels da largura alvo
+GRADE_PX = 0.25  # passo da quantização, em pixels da largura alvo
+
+Ponto = Tuple[int, int]
+Anel = List[Ponto]
+ArcoRef = Tuple[int, bool]  # (índice do arco, percorrido ao contrário)
+
+ESCALA_ORIGEM = 10 ** 6  # coordenadas de origem viram inteiros (micrograus) para comparação exata
+
+
+def carregar(caminho: str) -> List[dict]:
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)["features"]
+
+
+def poligonos(geometria: dict) -> List[List[Anel]]:
+    """Polígonos da geometria em coordenadas inteiras, anéis sem o ponto de fechamento."""
+    coords = geometria["coordinates"]
+    lista = [coords] if geometria["type"] == "Polygon" else coords
+    saida = []
+    for poligono in lista:
+        aneis = []
+        for anel in poligono:
+            pontos: Anel = []
+            for x, y in ((round(p[0] * ESCALA_ORIGEM), round(p[1] * ESCALA_ORIGEM)) for p in anel):
+                if not pontos or pontos[-1] != (x, y):
+                    pontos.append((x, y))
+            if len(pontos) > 1 and pontos[0] == pontos[-1]:
+                pontos.pop()
+            aneis.append(pontos)
+        saida.append(aneis)
+    return saida
+
+
+def juncoes(aneis: Sequence[Anel]) -> set:
+    """Pontos onde a vizinhança muda: ali começa ou termina uma fronteira compartilhada."""
+    vizinhos: Dict[Ponto, frozenset] = {}
+    saida = set()
+    for anel in aneis:
+        n = len(anel)
+        for i, ponto in enumerate(anel):
+            par = frozenset((anel[i - 1], anel[(i + 1) % n]))
+            visto = vizinhos.setdefault(ponto, par)
+            if visto != par:
+                saida.add(ponto)
+    return saida
+
+
+def _rotacao_canonica(anel: Anel) -> Tuple[Ponto, ...]:
+    i = anel.index(min(anel))
+    return tuple(anel[i:] + anel[:i])
+
+
+class Topologia:
+    """Arcos únicos; um arco repetido (no mesmo sentido ou ao contrário) é reaproveitado."""
+
+    def __init__(self):
+        self.arcos: List[List[Ponto]] = []
+        self._indice: Dict[Tuple[Ponto, ...], int] = {}
+
+    def _arco(self, pontos: List[Ponto], chave: Tuple[Ponto, ...], chave_inversa: Tuple[Ponto, ...]) -> ArcoRef:
+        if chave in self._indice:
+            return self._indice[chave], False
+        if chave_inversa in self._indice:
+            return self._indice[chave_inversa], True
+        self._indice[chave] = len(self.arcos)
+        self.arcos.append(pontos)
+        return len(self.arcos) - 1, False
+
+    def anel(self, anel: Anel, cortes: set) -> List[ArcoRef]:
+        posicoes = [i for i, ponto in enumerate(anel) if ponto in cortes]
+        if not posicoes:
+            # Anel sem junções (ilha, ou divisa inteira com um só vizinho): um arco fechado
+            direto = _rotacao_canonica(anel)
+            inverso = _rotacao_canonica(anel[::-1])
+            # O arco guardado pode começar noutro ponto do anel: como é fechado, tanto faz
+            return [self._arco(list(direto) + [direto[0]], direto, inverso)]
+        inicio = posicoes[0]
+        girado = anel[inicio:] + anel[:inicio] + [anel[inicio]]
+        refs = []
+        trecho = [girado[0]]
+        for ponto in girado[1:]:
+            trecho.append(ponto)
+            if ponto in cortes:
+                refs.append(self._arco(trecho, tuple(trecho), tuple(reversed(trecho))))
+                trecho = [ponto]
+        return refs
+
+
+def _distancia2(p: Ponto, a: Ponto, b: Ponto) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    if dx == 0 and dy == 0:
+        return (p[0] - a[0]) ** 2 + (p[1] - a[1]) ** 2
+    t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / (dx * dx + dy * dy)))
+    return (p[0] - a[0] - t * dx) ** 2 + (p[1] - a[1] - t * dy) ** 2
+
+
+def douglas_peucker(pontos: List[Ponto], tolerancia: float) -> List[Ponto]:
+    """Simplifica mantendo as duas pontas (junções). Iterativo para arcos longos."""
+    if len(pontos) < 3:
+        return pontos
+    manter = [False] * len(pontos)
+    manter[0] = manter[-1] = True
+    limite = tolerancia * tolerancia
+    pilha = [(0, len(pontos) - 1)]
+    while pilha:
+        i, j = pilha.pop()
+        pior, indice = 0.0, -1
+        for k in range(i + 1, j):
+            d = _distancia2(pontos[k], pontos[i], pontos[j])
+            if d > pior:
+                pior, indice = d, k
+        if indice >= 0 and pior > limite:
+            manter[indice] = True
+            pilha.append((i, indice))
+            pilha.append((indice, j))
+    return [p for p, m in zip(pontos, manter) if m]
+
+
+def simplificar_arco(arco: List[Ponto], tolerancia: float) -> List[Ponto]:
+    if arco[0] != arco[-1] or len(arco) < 4:
+        return douglas_peucker(arco, tolerancia)
+    # Arco fechado: divide no ponto mais distante do início para o DP ter uma corda de verdade
+    meio = max(range(1, len(arco) - 1), key=lambda k: _distancia2(arco[k], arco[0], arco[0]))
+    return douglas_peucker(arco[: meio + 1], tolerancia)[:-1] + douglas_peucker(arco[meio:], tolerancia)
+
+
+def area2(anel: Sequence[Tuple[float, float]]) -> float:
+    """Duas vezes a área com sinal (fórmula do laço) de um anel sem ponto de fechamento."""
+    return sum(anel[i - 1][0] * p[1] - p[0] * anel[i - 1][1] for i, p in enumerate(anel))
+
+
+def montar_anel(refs: List[ArcoRef], arcos: List[List[Ponto]]) -> Anel:
+    pontos: Anel = []
+    for indice, invertido in refs:
+        arco = arcos[indice][::-1] if invertido else arcos[indice]
+        pontos.extend(arco if not pontos else arco[1:])
+    return pontos[:-1]
+
+
+def quantizar(ponto: Ponto, origem: Tuple[float, float], passo: Tuple[float, float]) -> Ponto:
+    return round((ponto[0] - origem[0]) / passo[0]), round((ponto[1] - origem[1]) / passo[1])
+
+
+def centroide(aneis_por_poligono: List[List[Anel]]) -> List[float]:
+    """Centroide de área (planar, em graus); buracos descontam da área do polígono."""
+    soma_a = soma_x = soma_y = 0.0
+    for aneis in aneis_por_poligono:
+        sinal_externo = math.copysign(1, area2(aneis[0]))
+        for anel in aneis:
+            for i, p in enumerate(anel):
+                q = anel[i - 1]
+                cruz = (q[0] * p[1] - p[0] * q[1]) * sinal_externo
+                soma_a += cruz
+                soma_x += (q[0] + p[0]) * cruz
+                soma_y += (q[1] + p[1]) * cruz
+    if soma_a == 0:
+        x, y = aneis_por_poligono[0][0][0]
+        return [x / ESCALA_ORIGEM, y / ESCALA_ORIGEM]
+    return [round(soma_x / (3 * soma_a) / ESCALA_ORIGEM, 5), round(soma_y / (3 * soma_a) / ESCALA_ORIGEM, 5)]
+
+
+def caixa(aneis_por_poligono: List[List[Anel]]) -> List[float]:
+    pontos = [p for aneis in aneis_por_poligono for p in aneis[0]]
+    xs = [p[0] for p in pontos]
+    ys = [p[1] for p in pontos]
+    return [round(v / ESCALA_ORIGEM, 5) for v in (min(xs), min(ys), max(xs), max(ys))]
+
+
+def gerar_nivel(features: List[dict], largura_px: int) -> dict:
+    geometrias = [poligonos(f["geometry"]) for f in features]
+    todos = [anel for g in geometrias for aneis in g for anel in aneis]
+    x0 = min(p[0] for anel in todos for p in anel)
+    x1 = max(p[0] for anel in todos for p in anel)
+    y0 = min(p[1] for anel in todos for p in anel)
+    y1 = max(p[1] for anel in todos for p in anel)
+    px = (x1 - x0) / largura_px  # unidades de origem por pixel na largura alvo
+    origem = (x0, y0)
+    passo = (px * GRADE_PX, px * GRADE_PX)
+
+    topologia = Topologia()
+    cortes = juncoes(todos)
+    refs = [[[topologia.anel(anel, cortes) for anel in aneis] for aneis in g] for g in geometrias]
+
+    originais = topologia.arcos
+    arcos = [[quantizar(p, origem, passo) for p in simplificar_arco(a, px * TOLERANCIA_PX)] for a in originais]
+
+    # Anel que degenerou (menos de 3 pontos, ou virou do avesso e o d3 pintaria o resto do globo):
+    # seus arcos voltam sem simplificação. Repete até estabilizar, pois os arcos são compartilhados.
+    completos = set()
+    mudou = True
+    while mudou:
+        mudou = False
+        for g_refs, g in zip(refs, geometrias):
+            for p_refs, aneis in zip(g_refs, g):
+                for anel_refs, anel in zip(p_refs, aneis):
+                    pontos = montar_anel(anel_refs, arcos)
+                    if len(set(pontos)) >= 3 and area2(pontos) * area2(anel) > 0:
+                        continue
+                    pendentes = {i for i, _ in anel_refs} - completos
+                    if not pendentes:
+                        raise ValueError(f"Anel degenerado mesmo sem simplificação (nível {largura_px}px)")
+                    for i in pendentes:
+                        arcos[i] = [quantizar(p, origem, passo) for p in originais[i]]
+                    completos |= pendentes
+                    mudou = True
+
+    arcos_delta = []
+    for arco in arcos:
+        sem_repetidos = [arco[0]] + [p for a, p in zip(arco, arco[1:]) if p != a]
+        if len(sem_repetidos) == 1:
+            sem_repetidos.append(sem_repetidos[0])
+        delta = [list(sem_repetidos[0])]
+        delta.extend([b[0] - a[0], b[1] - a[1]] for a, b in zip(sem_repetidos, sem_repetidos[1:]))
+        arcos_delta.append(delta)
+
+    objetos = []
+    for feature, g, g_refs in zip(features, geometrias, refs):
+        # TopoJSON: arco ao contrário é ~i (= -i - 1)
+        aneis = [[[~i if invertido else i for i, invertido in anel] for anel in p] for p in g_refs]
+        objeto = {
+            "type": "Polygon" if len(aneis) == 1 else "MultiPolygon",
+            "arcs": aneis[0] if len(aneis) == 1 else aneis,
+            "bbox": caixa(g),
+            "properties": {
+                **{k: feature["properties"].get(k) for k in PROPRIEDADES},
+                "centroide": centroide(g),
+            },
+        }
+        objetos.append(objeto)
+
+    return {
+        "type": "Topology",
+        "bbox": [round(v / ESCALA_ORIGEM, 5) for v in (x0, y0, x1, y1)],
+        "transform": {
+            "scale": [passo[0] / ESCALA_ORIGEM, passo[1] / ESCALA_ORIGEM],
+            "translate": [x0 / ESCALA_ORIGEM, y0 / ESCALA_ORIGEM],
+        },
+        "objects": {OBJETO: {"type": "GeometryCollection", "geometries": objetos}},
+        "arcs": arcos_delta,
+    }
+
+
+def gravar(topologia: dict, nivel: str, pasta: str) -> Tuple[str, int]:
+    conteudo = json.dumps(topologia, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    nome = f"{PREFIXO}.{nivel}.{hashlib.sha256(conteudo).hexdigest()[:8]}.topo.json"
+    with open(os.path.join(pasta, nome), "wb") as f:
+        f.write(conteudo)
+    return nome, len(conteudo)
+
+
+def limpar(pasta: str, atuais: List[str]) -> None:
+    padrao = re.compile(rf"^{re.escape(PREFIXO)}\.[\w-]+\.[0-9a-f]{{8}}\.topo\.json$")
+    for nome in os.listdir(pasta):
+        if padrao.match(nome) and nome not in atuais:
+            os.remove(os.path.join(pasta, nome))
+
+
+def gravar_modulo(caminho: str, niveis: List[Tuple[str, int, str, int]], largura_rad: float) -> None:
+    linhas = [
+        "// Gerado por npm run mapas (scripts/gerar_mapas.py) a partir de geo/bahia_municipios.json; não editar.",
+        "// Níveis de detalhe do mapa da Bahia, do mais leve ao mais detalhado. larguraPx é a largura do",
+        "// estado na tela até onde o nível basta; LARGURA_BAHIA_RAD é a extensão em longitude, em radianos.",
+        f"export const LARGURA_BAHIA_RAD = {largura_rad:.5f};",
+        "",
+        "export const MAPA_NIVEIS = [",
+    ]
+    for nivel, largura, nome, tamanho in niveis:
+        linhas.append(f"  {{ nivel: '{nivel}', larguraPx: {largura}, url: '/mapas/{nome}', bytes: {tamanho} }},")
+    linhas.append("] as const;")
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("\n".join(linhas))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Gera os TopoJSON do mapa da Bahia em níveis de detalhe")
+    parser.add_argument("--entrada", default=ENTRADA)
+    parser.add_argument("--saida", default=SAIDA)
+    parser.add_argument("--modulo", default=MODULO)
+    args = parser.parse_args(argv)
+
+    features = carregar(args.entrada)
+    os.makedirs(args.saida, exist_ok=True)
+    gerados = []
+    for nivel, largura in NIVEIS:
+        topologia = gerar_nivel(features, largura)
+        nome, tamanho = gravar(topologia, nivel, args.saida)
+        gerados.append((nivel, largura, nome, tamanho))
+        print(f"{nivel:>12}: {nome} ({tamanho / 1024:.0f} KB, {len(topologia['arcs'])} arcos)", file=sys.stderr)
+    limpar(args.saida, [nome for _, _, nome, _ in gerados])
+
+    x0, _, x1, _ = topologia["bbox"]
+    gravar_modulo(args.modulo, gerados, math.radians(x1 - x0))
+
+
+if __name__ == "__main__":
+    main()
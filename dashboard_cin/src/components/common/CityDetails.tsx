@@ -12,6 +12,9 @@ import { getCityDetails } from '../../services/api';
 import { City, ApiResponse } from '../../types';
 import { AxiosResponse } from 'axios';
 
+// O gráfico mostra só os dias mais recentes; o histórico completo fica na aba de produtividade
+const HISTORY_DAYS = 90;
+
 interface CityDetailsProps {
   cityName: string;
 }
@@ -22,13 +25,14 @@ const CityDetails: React.FC<CityDetailsProps> = ({ cityName }) => {
   const gridStroke = useColorModeValue('gray.200', 'gray.600');
 
   const { data: cityDetails, isLoading } = useQuery<City[], Error>({
-    queryKey: ['cityDetails', cityName],
+    queryKey: ['cityDetails', cityName, HISTORY_DAYS],
     queryFn: async () => {
-      const response: AxiosResponse<ApiResponse<City[]>> = await getCityDetails(cityName);
+      const response: AxiosResponse<ApiResponse<City[]>> = await getCityDetails(cityName, {
+        produtividade_limit: HISTORY_DAYS,
+      });
       return response.data.data;
     },
     enabled: !!cityName,
-    staleTime: 5 * 60 * 1000,
     gcTime: 10 * 60 * 1000,
   });
 
@@ -1,6 +1,7 @@
 import React, { useState, useRef, useEffect, memo } from 'react';
 import { Box, Tooltip } from '@chakra-ui/react';
 import { ComposableMap, Geographies, Geography, ZoomableGroup } from 'react-simple-maps';
+import { useMapLevel } from '../../hooks/useMapLevel';
 
 interface BahiaMapProps {
   isInteractive?: boolean;
@@ -19,6 +20,7 @@ const BahiaMap = memo(
     const [hoveredCity, setHoveredCity] = useState<string | null>(null);
     const mapRef = useRef<HTMLDivElement>(null);
     const [dimensions, setDimensions] = useState({ width: 600, height: 450 });
+    const [zoom, setZoom] = useState(1);
 
     useEffect(() => {
       const updateDimensions = () => {
@@ -35,6 +37,7 @@ const BahiaMap = memo(
     }, []);
 
     const scale = (dimensions.width / 800) * 4000;
+    const geography = useMapLevel(scale, zoom);
 
     return (
       <Box
@@ -51,6 +54,7 @@ const BahiaMap = memo(
         <ComposableMap
           width={dimensions.width}
           height={dimensions.height}
+          projectionConfig={{ scale, center: [-42, -13] }}
           style={{ width: '100%', height: '100%' }}
         >
           <ZoomableGroup
@@ -59,8 +63,9 @@ const BahiaMap = memo(
             minZoom={1}
             maxZoom={5}
             translateExtent={[[-1000, -1000], [1000, 1000]]}
+            onMoveEnd={({ zoom: novoZoom }: { zoom: number }) => setZoom(novoZoom)}
           >
-            <Geographies geography="/bahia_municipios.json">
+            <Geographies geography={geography}>
               {({ geographies }: { geographies: GeographyType[] }) =>
                 geographies.map((geo) => {
                   const isSelected = selectedCity === geo.properties.NOME;
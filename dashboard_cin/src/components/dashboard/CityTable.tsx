@@ -18,7 +18,7 @@ import { getAmploGeral } from '../../services/api';
 import { downloadCSV } from '../../utils/downloadChart';
 import { useAppContext } from '../../contexts/AppContext';
 import { useCitySearch } from '../../hooks/useCitySearch';
-import { City, Column } from '../../types';
+import { City, CityField, Column } from '../../types';
 
 // Restrict SortConfig to keys with safe types, excluding arrays
 type SortKey = Exclude<keyof City, 'produtividades_diarias'> | 'produtividade_total';
@@ -39,6 +39,16 @@ const columns: Column[] = [
   { key: 'produtividade_total', label: 'Produtividade Total' },
 ];
 
+// Só as colunas que a tabela exibe
+const fields: CityField[] = [
+  'nome_municipio',
+  'status_visita',
+  'status_publicacao',
+  'status_instalacao',
+  'data_visita',
+  'data_instalacao',
+];
+
 export function CityTable() {
   const { setSelectedCity } = useAppContext();
   const theme = useTheme();
@@ -49,9 +59,9 @@ export function CityTable() {
 
   // Fetch city data
   const { data = [], isLoading } = useQuery<City[], Error>({
-    queryKey: ['cities'],
+    queryKey: ['cities', fields],
     queryFn: async () => {
-      const response = await getAmploGeral();
+      const response = await getAmploGeral({ fields });
       return response.data.data;
     },
   });
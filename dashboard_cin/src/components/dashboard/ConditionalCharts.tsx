@@ -108,7 +108,6 @@ const ConditionalCharts = ({ selectedCity }: ConditionalChartsProps) => {
         };
       }).filter((data): data is ChartData => data !== null);
     },
-    staleTime: 5 * 60 * 1000,
     gcTime: 10 * 60 * 1000,
     enabled: !!selectedCity,
   });
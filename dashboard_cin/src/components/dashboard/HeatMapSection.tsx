@@ -6,6 +6,7 @@ import {
   Button,
   VStack,
   HStack,
+  Select,
   useColorModeValue,
   Modal,
   ModalOverlay,
@@ -19,20 +20,67 @@ import {
 } from '@chakra-ui/react';
 import { ChevronDownIcon, ChevronUpIcon, DownloadIcon } from '@chakra-ui/icons';
 import { ComposableMap, Geographies, Geography } from 'react-simple-maps';
-import { useQuery } from '@tanstack/react-query';
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
 import {
-  getAmploGeral,
+  getByCidade,
   getCityDetails,
+  getMapaMetrica,
   getTopAndLeastCities,
 } from '../../services/api';
+import { useMapLevel } from '../../hooks/useMapLevel';
 import { downloadChartAsImage, downloadCSV } from '../../utils/downloadChart';
-import { City, TopAndLeastCitiesResponse, TopCity } from '../../types';
+import { ByCidadeResponse, City, CityField, MapaMetrica, MapaMetricaResponse, TopAndLeastCitiesResponse, TopCity } from '../../types';
 import { BarChart as RechartsBarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, LabelList, AreaChart, Area, ResponsiveContainer } from 'recharts';
 
+// Cor de município sem cadastro ou sem valor
+const NO_DATA_COLOR = '#000000';
+
+// Mapa de cores por status (rótulos da legenda de /dashboard/mapa?metrica=status)
+const statusColors: { [key: string]: string } = {
+  'Não Informado': NO_DATA_COLOR,
+  Instalado: '#00FF00',
+  'Ag. Instalação': '#FFFF00',
+  Publicado: '#0000FF',
+  'Ag. Publicação': '#8B4513',
+  Aprovado: '#FFA500',
+  Reprovado: '#FF0000',
+};
+
+// Faixas de produtividade: sem produção, depois do quintil mais produtivo ao menos produtivo
+const faixaColors = ['#D7DBD9', '#006400', '#32CD32', '#FFFF00', '#FFA500', '#FF0000'];
+
+// Escala contínua da produtividade, do menor ao maior total do período
+const SCALE_FROM = [224, 243, 255];
+const SCALE_TO = [8, 48, 107];
+const scaleColor = (ratio: number) =>
+  `rgb(${SCALE_FROM.map((from, i) => Math.round(from + (SCALE_TO[i] - from) * Math.min(Math.max(ratio, 0), 1))).join(',')})`;
+
+const METRICAS: { value: MapaMetrica; label: string }[] = [
+  { value: 'status', label: 'Status' },
+  { value: 'produtividade', label: 'Produtividade' },
+  { value: 'faixa', label: 'Faixa de produtividade' },
+];
+
+const CURRENT_YEAR = new Date().getFullYear();
+const ANOS = Array.from({ length: CURRENT_YEAR - 2023 + 1 }, (_, i) => 2023 + i);
+const MESES = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'];
+
+// Uma cor por feature do GeoJSON, na mesma ordem de valores
+const toFills = ({ metrica, legenda = [], max = 0, valores }: MapaMetricaResponse) =>
+  valores.map((valor) => {
+    if (valor === null) return NO_DATA_COLOR;
+    if (metrica === 'status') return statusColors[legenda[valor]] || NO_DATA_COLOR;
+    if (metrica === 'faixa') return faixaColors[valor] || NO_DATA_COLOR;
+    return scaleColor(max > 0 ? valor / max : 0);
+  });
+
 const HeatMapSection = () => {
   const [selectedCity, setSelectedCity] = useState<string | null>(null);
   const [expanded, setExpanded] = useState(false);
   const [modalOpen, setModalOpen] = useState(false);
+  const [metrica, setMetrica] = useState<MapaMetrica>('status');
+  const [ano, setAno] = useState(CURRENT_YEAR);
+  const [mes, setMes] = useState<number | undefined>(undefined);
   const mapRef = useRef<HTMLDivElement>(null);
   const chartRef = useRef<HTMLDivElement>(null);
   const [carouselIndex, setCarouselIndex] = useState(0);
@@ -42,13 +90,28 @@ const HeatMapSection = () => {
   const barColor = useColorModeValue('#3182ce', '#63b3ed');
   const areaColor = useColorModeValue('#8884d8', '#a3bffa');
 
-  // Fetch dados gerais
-  const { data: allCities = [], isLoading, error } = useQuery<City[], Error>({
-    queryKey: ['amploGeral'],
+  // Vetor da métrica já alinhado ao GeoJSON; trocar métrica/período é uma requisição pequena,
+  // e o mapa anterior continua na tela até a nova chegar
+  const periodo = metrica === 'status' ? {} : { ano, mes };
+  const { data: mapa, isLoading, error } = useQuery<MapaMetricaResponse, Error>({
+    queryKey: ['mapaMetrica', metrica, periodo],
+    queryFn: async () => {
+      const response = await getMapaMetrica({ metrica, ...periodo });
+      return response.data.data;
+    },
+    placeholderData: keepPreviousData,
+  });
+
+  const fills = useMemo(() => (mapa ? toFills(mapa) : []), [mapa]);
+
+  // Produtividade mensal do município selecionado, só quando os detalhes estão abertos
+  const { data: cidade } = useQuery<ByCidadeResponse, Error>({
+    queryKey: ['byCidade', selectedCity],
     queryFn: async () => {
-      const response = await getAmploGeral();
+      const response = await getByCidade(selectedCity as string);
       return response.data.data;
     },
+    enabled: !!selectedCity && expanded,
   });
 
   // Fetch top/least cities
@@ -78,42 +141,16 @@ const HeatMapSection = () => {
     return () => window.removeEventListener('resize', updateDimensions);
   }, []);
 
-  // Determina status de maior prioridade
-  const getHighestPriorityStatus = (city: City | undefined): string => {
-    if (!city) return 'Não Informado';
-    return (
-      city.status_instalacao === 'instalado' ? 'Instalado' :
-      city.status_publicacao === 'publicado' ? 'Publicado' :
-      city.status_instalacao === 'aguardando_instalacao' ? 'Ag. Instalação' :
-      city.status_publicacao === 'aguardando_publicacao' ? 'Ag. Publicação' :
-      city.status_visita === 'Aprovado' ? 'Aprovado' :
-      city.status_visita === 'Reprovado' ? 'Reprovado' :
-      'Não Informado'
-    );
-  };
-
-  // Mapa de cores por status
-  const statusColors: { [key: string]: string } = {
-    'Não Informado': '#000000',
-    Instalado: '#00FF00',
-    'Ag. Instalação': '#FFFF00',
-    Publicado: '#0000FF',
-    'Ag. Publicação': '#8B4513',
-    Aprovado: '#FFA500',
-    Reprovado: '#FF0000',
-  };
+  const mapScale = (dimensions.width / 800) * 2800;
+  const geography = useMapLevel(mapScale);
 
   // Dados do carrossel
-  const cityProduction = useMemo(() => {
-    return selectedCity ? allCities.find((c) => c.nome_municipio === selectedCity)?.produtividades_diarias || [] : [];
-  }, [selectedCity, allCities]);
-
   const cityData = useMemo(() => {
-    return cityProduction.map((item) => ({
-      month: new Date(item.data).toLocaleDateString('pt-BR', { month: 'short' }),
+    return (cidade?.monthlyProdutividade || []).map((item) => ({
+      month: new Date(`${item.monthYear}-01T00:00:00Z`).toLocaleDateString('pt-BR', { month: 'short', timeZone: 'UTC' }),
       quantidade: item.quantidade || 0,
     }));
-  }, [cityProduction]);
+  }, [cidade]);
 
   // Dados para gráfico de área
   const topLeastCitiesSafe = useMemo(() => {
@@ -122,11 +159,11 @@ const HeatMapSection = () => {
 
   const areaChartData = useMemo(() => {
     return [
-      ...(selectedCity ? [{ name: selectedCity, quantidade: cityProduction.reduce((sum: number, p) => sum + (p.quantidade || 0), 0) }] : []),
+      ...(selectedCity ? [{ name: selectedCity, quantidade: cidade?.totalProdutividade || 0 }] : []),
       ...(topLeastCitiesSafe.length > 0 ? topLeastCitiesSafe.slice(0, 1).map((city: TopCity) => ({ name: `${city.nome_municipio} (Top)`, quantidade: city.total_quantidade || 0 })) : []),
       ...(topLeastCitiesSafe.length > 0 ? topLeastCitiesSafe.slice(-1).map((city: TopCity) => ({ name: `${city.nome_municipio} (Least)`, quantidade: city.total_quantidade || 0 })) : []),
     ].filter((item) => item.name && item.quantidade !== undefined);
-  }, [selectedCity, cityProduction, topLeastCitiesSafe]);
+  }, [selectedCity, cidade, topLeastCitiesSafe]);
 
   if (isLoading) return <Text>Carregando...</Text>;
   if (error) return <Text color="red.500">{error.message}</Text>;
@@ -148,48 +185,85 @@ const HeatMapSection = () => {
         <Heading size="lg" color={textFill} textAlign="center">
           Mapa de Calor da Bahia
         </Heading>
+        <HStack spacing="space.md" justifyContent="center" wrap="wrap">
+          <Select
+            aria-label="Métrica do mapa"
+            width="auto"
+            value={metrica}
+            onChange={(e) => setMetrica(e.target.value as MapaMetrica)}
+          >
+            {METRICAS.map(({ value, label }) => (
+              <option key={value} value={value}>{label}</option>
+            ))}
+          </Select>
+          {metrica !== 'status' && (
+            <>
+              <Select aria-label="Ano" width="auto" value={ano} onChange={(e) => setAno(Number(e.target.value))}>
+                {ANOS.map((value) => (
+                  <option key={value} value={value}>{value}</option>
+                ))}
+              </Select>
+              <Select
+                aria-label="Mês"
+                width="auto"
+                value={mes ?? ''}
+                onChange={(e) => setMes(e.target.value ? Number(e.target.value) : undefined)}
+              >
+                <option value="">Ano inteiro</option>
+                {MESES.map((label, index) => (
+                  <option key={label} value={index + 1}>{label}</option>
+                ))}
+              </Select>
+            </>
+          )}
+        </HStack>
         <Box ref={mapRef} width="100%" textAlign="center">
           <ComposableMap
             width={dimensions.width}
             height={dimensions.height}
-            projectionConfig={{ scale: (dimensions.width / 800) * 2800, center: [-42, -13] }}
+            projectionConfig={{ scale: mapScale, center: [-42, -13] }}
             style={{ width: '100%', height: '100%', margin: '0 auto' }}
           >
-            <Geographies geography="/bahia_municipios.json">
+            <Geographies geography={geography}>
               {({ geographies }: { geographies: any[] }) =>
-                geographies.map((geo: any) => {
-                  const cityData = allCities.find((c: City) => c.nome_municipio === geo.properties.NOME);
-                  const status = getHighestPriorityStatus(cityData);
-                  return (
-                    <Geography
-                      key={geo.rsmKey}
-                      geography={geo}
-                      fill={statusColors[status] || '#000000'}
-                      stroke="#000"
-                      strokeWidth={0.5}
-                      onClick={() => {
-                        setSelectedCity(geo.properties.NOME);
-                        setModalOpen(true);
-                      }}
-                      style={{
-                        default: { outline: 'none' },
-                        hover: { fill: '#29C3FF', outline: 'none' },
-                        pressed: { outline: 'none' },
-                      }}
-                    />
-                  );
-                })
+                geographies.map((geo: any, index: number) => (
+                  <Geography
+                    key={geo.rsmKey}
+                    geography={geo}
+                    // Vetor de outro GeoJSON (tamanho diferente) não é aplicado
+                    fill={fills.length === geographies.length ? fills[index] : NO_DATA_COLOR}
+                    stroke="#000"
+                    strokeWidth={0.5}
+                    onClick={() => {
+                      setSelectedCity(geo.properties.NOME);
+                      setModalOpen(true);
+                    }}
+                    style={{
+                      default: { outline: 'none' },
+                      hover: { fill: '#29C3FF', outline: 'none' },
+                      pressed: { outline: 'none' },
+                    }}
+                  />
+                ))
               }
             </Geographies>
           </ComposableMap>
         </Box>
         <HStack spacing="space.md" justifyContent="center" wrap="wrap">
-          {Object.entries(statusColors).map(([status, color]: [string, string]) => (
-            <HStack key={status} spacing="space.sm">
-              <Box w="15px" h="15px" bg={color} />
-              <Text fontSize="sm">{status}</Text>
+          {mapa?.metrica === 'produtividade' ? (
+            <HStack spacing="space.sm">
+              <Text fontSize="sm">0</Text>
+              <Box w="120px" h="15px" bg={`linear-gradient(to right, ${scaleColor(0)}, ${scaleColor(1)})`} />
+              <Text fontSize="sm">{(mapa.max ?? 0).toLocaleString('pt-BR')}</Text>
             </HStack>
-          ))}
+          ) : (
+            (mapa?.legenda || []).map((label, index) => (
+              <HStack key={label} spacing="space.sm">
+                <Box w="15px" h="15px" bg={mapa?.metrica === 'faixa' ? faixaColors[index] : statusColors[label]} />
+                <Text fontSize="sm">{label}</Text>
+              </HStack>
+            ))
+          )}
         </HStack>
         <Button
           onClick={() => setExpanded(!expanded)}
@@ -282,6 +356,16 @@ const HeatMapSection = () => {
   );
 };
 
+// Detalhes exibidos na seção e no modal; dispensam o histórico de produtividade
+const DETAIL_FIELDS: CityField[] = [
+  'nome_municipio',
+  'status_visita',
+  'status_publicacao',
+  'status_instalacao',
+  'data_visita',
+  'data_instalacao',
+];
+
 // Subcomponente para detalhes na seção expandida
 interface CityDetailsSectionProps {
   cityName: string;
@@ -289,9 +373,9 @@ interface CityDetailsSectionProps {
 
 const CityDetailsSection = ({ cityName }: CityDetailsSectionProps) => {
   const { data: cityDetails = [], isLoading } = useQuery<City[], Error>({
-    queryKey: ['cityDetails', cityName],
+    queryKey: ['cityDetails', cityName, DETAIL_FIELDS],
     queryFn: async () => {
-      const response = await getCityDetails(cityName);
+      const response = await getCityDetails(cityName, { fields: DETAIL_FIELDS });
       return response.data.data;
     },
     enabled: !!cityName,
@@ -324,9 +408,9 @@ interface CityDetailsModalProps {
 
 const CityDetailsModal = ({ cityName }: CityDetailsModalProps) => {
   const { data: cityDetails = [], isLoading } = useQuery<City[], Error>({
-    queryKey: ['cityDetailsModal', cityName],
+    queryKey: ['cityDetailsModal', cityName, DETAIL_FIELDS],
     queryFn: async () => {
-      const response = await getCityDetails(cityName);
+      const response = await getCityDetails(cityName, { fields: DETAIL_FIELDS });
       return response.data.data;
     },
     enabled: !!cityName,
@@ -106,7 +106,6 @@ const MainSection = () => {
         monthlyData: sortedMonthlyData,
       };
     },
-    staleTime: 5 * 60 * 1000,
     gcTime: 10 * 60 * 1000,
     refetchOnWindowFocus: false,
   });
@@ -79,7 +79,6 @@ const PieChartSection = () => {
         instalacaoRes: instalacaoRes.data,
       };
     },
-    staleTime: 5 * 60 * 1000,
     gcTime: 10 * 60 * 1000,
   });
 
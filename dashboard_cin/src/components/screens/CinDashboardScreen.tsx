@@ -1,31 +1,14 @@
 import { lazy, Suspense, useState, useEffect } from 'react';
 import { Box, Grid, Button, VStack, useColorModeValue, Heading, Flex } from '@chakra-ui/react';
-import { useQuery } from '@tanstack/react-query';
-import { AxiosResponse } from 'axios';
 import MetricCard from '../dashboard/MetricCard';
 import DashboardCard from '../dashboard/DashboardCard';
 import MainSection from '../dashboard/MainSection';
 import CityLists from '../dashboard/CityLists';
 import LoadingSpinner from '../common/LoadingSpinner';
-import {
-  getVisitedCities,
-  getStatusVisitaBreakdown,
-  getStatusPublicacaoBreakdown,
-  getStatusInstalacaoBreakdown,
-  getAmploGeral,
-  getGeralMensal,
-} from '../../services/api';
+import { useDashboardSummary } from '../../hooks/useDashboardSummary';
+import { buildCardData, buildListsData, buildMetricData } from '../../utils/dashboardMetrics';
 import { useAppContext } from '../../contexts/AppContext';
 import { ArrowBackIcon } from '@chakra-ui/icons';
-import {
-  City,
-  ApiResponse,
-  VisitedCitiesResponse,
-  StatusVisitaBreakdownResponse,
-  StatusPublicacaoBreakdownResponse,
-  StatusInstalacaoBreakdownResponse,
-  MonthlyData,
-} from '../../types';
 import { ErrorBoundary } from 'react-error-boundary';
 import { PresentationChartBarIcon, ChartBarIcon, MapPinIcon, CheckCircleIcon } from '@heroicons/react/24/solid';
 
@@ -43,191 +26,20 @@ const ErrorFallback = ({ error }: ErrorFallbackProps) => (
   </Box>
 );
 
-interface CardData {
-  [key: string]: {
-    percentage: number | null;
-    cities: City[] | null;
-  };
-}
-
-interface ListsData {
-  visits: (City & { NOME: string; daysLeft: number })[];
-  installations: (City & { NOME: string; daysLeft: number })[];
-}
-
 const CinDashboard = () => {
   const [mode, setMode] = useState<'interativa' | 'slideshow' | null>(null);
   const { setSelectedCity, setCardData } = useAppContext();
   const bgMain = useColorModeValue('bg.main._light', 'bg.main._dark');
   const textColor = useColorModeValue('text._light', 'text._dark');
 
-  const { data: cardData, isLoading, error } = useQuery<CardData | null>({
-    queryKey: ['cardData', mode],
-    queryFn: async () => {
-      if (mode !== 'interativa') return null;
-
-      const [
-        visitedRes,
-        visitaBreakdownRes,
-        publicacaoRes,
-        instalacaoRes,
-        amploGeralRes,
-      ] = await Promise.all([
-        getVisitedCities() as Promise<AxiosResponse<ApiResponse<VisitedCitiesResponse>>>,
-        getStatusVisitaBreakdown() as Promise<
-          AxiosResponse<ApiResponse<StatusVisitaBreakdownResponse>>
-        >,
-        getStatusPublicacaoBreakdown() as Promise<
-          AxiosResponse<ApiResponse<StatusPublicacaoBreakdownResponse>>
-        >,
-        getStatusInstalacaoBreakdown() as Promise<
-          AxiosResponse<ApiResponse<StatusInstalacaoBreakdownResponse>>
-        >,
-        getAmploGeral(),
-      ]);
-
-      const data: CardData = {
-        '343 Cidades': {
-          percentage: null,
-          cities: amploGeralRes.data.data || [],
-        },
-        Visitados: {
-          percentage: visitedRes.data.data.percentage ?? null,
-          cities: visitedRes.data.data.visitedCities ?? [],
-        },
-        Aprovados: {
-          percentage: visitaBreakdownRes.data.data.approvedPercentage ?? null,
-          cities: visitaBreakdownRes.data.data.approvedCities ?? [],
-        },
-        Reprovados: {
-          percentage: visitaBreakdownRes.data.data.rejectedPercentage ?? null,
-          cities: visitaBreakdownRes.data.data.rejectedCities ?? [],
-        },
-        Publicados: {
-          percentage: publicacaoRes.data.data.publishedPercentage ?? null,
-          cities: publicacaoRes.data.data.publishedCities ?? [],
-        },
-        Instalados: {
-          percentage: instalacaoRes.data.data.installedPercentage ?? null,
-          cities: instalacaoRes.data.data.installedCities ?? [],
-        },
-        'AG. Instalação': {
-          percentage: instalacaoRes.data.data.awaitingPercentage ?? null,
-          cities: instalacaoRes.data.data.awaitingInstallationCities ?? [],
-        },
-      };
-      return data;
-    },
-    staleTime: 5 * 60 * 1000,
-    gcTime: 10 * 60 * 1000,
-  });
-
-  const { data: listsData } = useQuery<ListsData>({
-    queryKey: ['listsData', mode],
-    queryFn: async () => {
-      const amploRes = await getAmploGeral();
-      const amploData = Array.isArray(amploRes.data.data) ? amploRes.data.data : [];
-
-      const today = new Date('2025-09-18');
-      const sevenDaysFromNow = new Date(today.getTime() + 7 * 24 * 60 * 60 * 1000);
-
-      const visits = amploData
-        .filter(
-          (city: City) =>
-            city?.data_visita &&
-            new Date(city.data_visita) <= sevenDaysFromNow &&
-            new Date(city.data_visita) >= today
-        )
-        .map((city: City) => ({
-          ...city,
-          NOME: city.nome_municipio || 'Unknown',
-          daysLeft: Math.ceil((new Date(city.data_visita!).getTime() - today.getTime()) / (1000 * 60 * 60 * 24)),
-        }));
-
-      const installations = amploData
-        .filter(
-          (city: City) =>
-            city?.data_instalacao &&
-            new Date(city.data_instalacao) <= sevenDaysFromNow &&
-            new Date(city.data_instalacao) >= today
-        )
-        .map((city: City) => ({
-          ...city,
-          NOME: city.nome_municipio || 'Unknown',
-          daysLeft: Math.ceil((new Date(city.data_instalacao!).getTime() - today.getTime()) / (1000 * 60 * 60 * 24)),
-        }));
-
-      return { visits, installations };
-    },
-    staleTime: 5 * 60 * 1000,
-    gcTime: 10 * 60 * 1000,
-    enabled: mode === 'interativa',
-  });
-
-  const { data: metricData } = useQuery({
-    queryKey: ['metricData', mode],
-    queryFn: async () => {
-      if (mode !== 'interativa') return null;
-
-      const geralMensalRes = await getGeralMensal();
-      const visitaBreakdownRes = await getStatusVisitaBreakdown();
-      const instalacaoRes = await getStatusInstalacaoBreakdown();
-
-      const monthlyData: MonthlyData[] = geralMensalRes.data.data || [];
-      const currentMonth = '2025-09';
-      const currentMonthData = monthlyData.find((d) => d.monthYear === currentMonth);
-      const previousMonthData = monthlyData.find((d) => d.monthYear === '2025-08');
-
-      const monthlyProduction = currentMonthData?.quantidade || 0;
-      const monthlyGrowth = previousMonthData
-        ? ((monthlyProduction - previousMonthData.quantidade) / previousMonthData.quantidade) * 100
-        : 0;
-
-      const annualProduction = monthlyData.reduce((sum, d) => sum + d.quantidade, 0);
-      const totalUntilPreviousMonth = monthlyData
-        .filter((d) => d.monthYear < currentMonth)
-        .reduce((sum, d) => sum + d.quantidade, 0);
-      const annualContribution = totalUntilPreviousMonth
-        ? (monthlyProduction / totalUntilPreviousMonth) * 100
-        : 0;
-
-      return {
-        producaoMensal: {
-          value: monthlyProduction,
-          trend: {
-            value: Number(monthlyGrowth.toFixed(1)),
-            label: 'vs. mês anterior',
-            isPositive: monthlyGrowth >= 0,
-          },
-        },
-        producaoAnual: {
-          value: annualProduction,
-          subtitle: `Mês atual: ${monthlyProduction.toLocaleString('pt-BR')}`,
-          trend: {
-            value: Number(annualContribution.toFixed(1)),
-            label: 'Contribuição mensal',
-            isPositive: true,
-          },
-        },
-        cidadesContempladas: {
-          value: visitaBreakdownRes.data.data.totalCitiesWithStatus || 0,
-        },
-        cidadesInstaladas: {
-          value: instalacaoRes.data.data.totalCitiesWithStatus || 0,
-          donutPercentage: instalacaoRes.data.data.installedPercentage || 0,
-        },
-      };
-    },
-    staleTime: 5 * 60 * 1000,
-    gcTime: 10 * 60 * 1000,
-    enabled: mode === 'interativa',
-  });
+  const interactive = mode === 'interativa';
+  const { data: cardData, isLoading, error } = useDashboardSummary(buildCardData, interactive);
+  const { data: listsData } = useDashboardSummary(buildListsData, interactive);
+  const { data: metricData } = useDashboardSummary(buildMetricData, interactive);
 
   useEffect(() => {
-    if (cardData !== undefined) {
-      setCardData(cardData);
-    }
-  }, [cardData, setCardData]);
+    setCardData(interactive ? cardData ?? null : null);
+  }, [interactive, cardData, setCardData]);
 
   if (isLoading) return <LoadingSpinner />;
   if (error) return <Box>Erro ao carregar dados: {(error as Error).message}</Box>;
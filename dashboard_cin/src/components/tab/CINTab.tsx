@@ -139,7 +139,6 @@ const CINTab = ({ setMode, setSelectedCity }: CINTabProps) => {
         visitedRes: visitedRes.data,
       };
     },
-    staleTime: 5 * 60 * 1000,
     gcTime: 10 * 60 * 1000,
   });
 
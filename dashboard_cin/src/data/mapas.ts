@@ -0,0 +1,10 @@
+// Gerado por npm run mapas (scripts/gerar_mapas.py) a partir de geo/bahia_municipios.json; não editar.
+// Níveis de detalhe do mapa da Bahia, do mais leve ao mais detalhado. larguraPx é a largura do
+// estado na tela até onde o nível basta; LARGURA_BAHIA_RAD é a extensão em longitude, em radianos.
+export const LARGURA_BAHIA_RAD = 0.16189;
+
+export const MAPA_NIVEIS = [
+  { nivel: 'visao-geral', larguraPx: 600, url: '/mapas/bahia.visao-geral.7c4528e6.topo.json', bytes: 144064 },
+  { nivel: 'medio', larguraPx: 1600, url: '/mapas/bahia.medio.4e18d6ba.topo.json', bytes: 202520 },
+  { nivel: 'detalhado', larguraPx: 4800, url: '/mapas/bahia.detalhado.88966f75.topo.json', bytes: 340466 },
+] as const;
\ No newline at end of file
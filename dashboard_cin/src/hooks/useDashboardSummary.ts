@@ -0,0 +1,21 @@
+import { useQuery } from '@tanstack/react-query';
+import { getDashboardSummary } from '../services/api';
+import { DashboardSummaryResponse } from '../types';
+
+// Todas as telas usam a mesma chave: uma única requisição a /dashboard/summary
+// alimenta cada `select` (cartões, listas, métricas).
+export function useDashboardSummary<T = DashboardSummaryResponse>(
+  select?: (summary: DashboardSummaryResponse) => T,
+  enabled = true
+) {
+  return useQuery<DashboardSummaryResponse, Error, T>({
+    queryKey: ['dashboardSummary'],
+    queryFn: async () => {
+      const response = await getDashboardSummary();
+      return response.data.data;
+    },
+    select,
+    gcTime: 10 * 60 * 1000,
+    enabled,
+  });
+}
\ No newline at end of file
@@ -0,0 +1,19 @@
+import { useRef } from 'react';
+import { LARGURA_BAHIA_RAD, MAPA_NIVEIS } from '../data/mapas';
+
+// TopoJSON do mapa da Bahia (public/mapas, gerado por npm run mapas) no menor nível de detalhe
+// que basta para a largura que o estado ocupa na tela: escala da projeção × zoom × extensão em
+// radianos, em pixels físicos (densidade limitada a 2). Nunca volta a um nível mais leve: ao
+// diminuir o zoom ou a janela, o arquivo já carregado continua servindo.
+export function mapLevelIndex(scale: number, zoom: number, devicePixelRatio: number) {
+  const densidade = Math.min(devicePixelRatio || 1, 2);
+  const larguraPx = scale * zoom * LARGURA_BAHIA_RAD * densidade;
+  const indice = MAPA_NIVEIS.findIndex((nivel) => nivel.larguraPx >= larguraPx);
+  return indice < 0 ? MAPA_NIVEIS.length - 1 : indice;
+}
+
+export function useMapLevel(scale: number, zoom = 1) {
+  const maior = useRef(0);
+  maior.current = Math.max(maior.current, mapLevelIndex(scale, zoom, window.devicePixelRatio));
+  return MAPA_NIVEIS[maior.current].url;
+}
\ No newline at end of file
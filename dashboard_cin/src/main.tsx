@@ -3,9 +3,15 @@ import ReactDOM from 'react-dom/client';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import App from './App';
 import { AppContextProvider } from './contexts/AppContext';
+import { feedStaleTime, startChangeFeed } from './services/changeFeed';
 import './index.css';
 
-const queryClient = new QueryClient();
+// Sem staleTime próprio nas consultas: enquanto o feed de mudanças está conectado nada envelhece
+// por tempo e as escritas chegam como invalidações; sem ele, 5 minutos como antes
+const queryClient = new QueryClient({
+  defaultOptions: { queries: { staleTime: feedStaleTime } },
+});
+startChangeFeed(queryClient);
 
 ReactDOM.createRoot(document.getElementById('root')!).render(
   <React.StrictMode>
@@ -1,6 +1,7 @@
 import axios from 'axios';
 import {
   City,
+  CityField,
   TopCity,
   MonthlyData,
   ApiResponse,
@@ -10,12 +11,35 @@ import {
   StatusInstalacaoBreakdownResponse,
   ByCidadeResponse,
   TopAndLeastCitiesResponse,
+  DashboardSummaryResponse,
+  MapaMetrica,
+  MapaMetricaResponse,
 } from '../types';
+import { COLUMNAR_MEDIA_TYPE, decodeColumnar } from '../utils/columnar';
 
+export const API_BASE_URL = 'http://localhost:3000/v1/';
+
+// Pede o JSON colunar (listas menores, status em dicionário) e aceita JSON comum de rotas que não o
+// oferecem; gzip/br ficam a cargo do navegador
 const api = axios.create({
-  baseURL: 'http://localhost:3000/v1/',
+  baseURL: API_BASE_URL,
+  headers: { Accept: `${COLUMNAR_MEDIA_TYPE}, application/json` },
+});
+
+api.interceptors.response.use((response) => {
+  if (String(response.headers?.['content-type'] ?? '').includes(COLUMNAR_MEDIA_TYPE)) {
+    response.data = decodeColumnar(response.data);
+  }
+  return response;
 });
 
+// Todos os cartões da dashboard em uma única requisição (cache no servidor, invalidado nas escritas)
+export const getDashboardSummary = () => api.get<ApiResponse<DashboardSummaryResponse>>('dashboard/summary');
+
+// Uma métrica por município, na ordem das features do GeoJSON (cache no servidor, invalidado nas escritas)
+export const getMapaMetrica = (params: { metrica: MapaMetrica; ano?: number; mes?: number }) =>
+  api.get<ApiResponse<MapaMetricaResponse>>('dashboard/mapa', { params });
+
 export const getVisitedCities = () =>
   api.get<ApiResponse<VisitedCitiesResponse>>('amplo-geral/visited-cities');
 
@@ -28,7 +52,24 @@ export const getStatusPublicacaoBreakdown = () =>
 export const getStatusInstalacaoBreakdown = () =>
   api.get<ApiResponse<StatusInstalacaoBreakdownResponse>>('amplo-geral/status-instalacao-breakdown');
 
-export const getAmploGeral = () => api.get<ApiResponse<City[]>>('amplo-geral');
+// Parâmetros comuns das listagens de amplo-geral: projeção de colunas, página por cursor
+// e recorte da produtividade diária aninhada (datas AAAA-MM-DD, fim inclusivo)
+export interface AmploGeralListParams {
+  fields?: CityField[];
+  limit?: number;
+  cursor?: number;
+  produtividade_inicio?: string;
+  produtividade_fim?: string;
+  produtividade_limit?: number;
+}
+
+const listParams = ({ fields, ...params }: AmploGeralListParams) => ({
+  ...params,
+  ...(fields ? { fields: fields.join(',') } : {}),
+});
+
+export const getAmploGeral = (params: AmploGeralListParams = {}) =>
+  api.get<ApiResponse<City[]>>('amplo-geral', { params: listParams(params) });
 
 export const getTopCities = ({ ano = 2025, limit = 10 }: { ano?: number; limit?: number }) =>
   api.get<ApiResponse<TopCity[]>>(`produtividade/top-cities?ano=${ano}&limit=${limit}`);
@@ -41,5 +82,5 @@ export const getByCidade = (cidade: string) =>
 export const getTopAndLeastCities = ({ ano = 2025, limit = 5 }: { ano?: number; limit?: number }) =>
   api.get<ApiResponse<TopAndLeastCitiesResponse>>(`produtividade/top-and-least-cities?ano=${ano}&limit=${limit}`);
 
-export const getCityDetails = (nome_municipio: string) =>
-  api.get<ApiResponse<City[]>>(`amplo-geral/nome-municipio?nome_municipio=${nome_municipio}`);
\ No newline at end of file
+export const getCityDetails = (nome_municipio: string, params: AmploGeralListParams = {}) =>
+  api.get<ApiResponse<City[]>>('amplo-geral/nome-municipio', { params: { nome_municipio, ...listParams(params) } });
\ No newline at end of file
@@ -0,0 +1,100 @@
+import { Query, QueryClient, QueryKey } from '@tanstack/react-query';
+import { API_BASE_URL } from './api';
+import { ChangeEvent } from '../types';
+
+// Feed de mudanças da API (GET /events, Server-Sent Events). Enquanto a conexão está saudável as
+// consultas não envelhecem por tempo (feedStaleTime = Infinity, sem refetch no foco/montagem):
+// cada escrita chega como um evento e invalida só as chaves afetadas. Se o feed cair (erro, ou
+// PING_TIMEOUT_MS sem nenhum evento), volta o staleTime de 5 minutos; ao reconectar tudo é
+// invalidado uma vez, já que eventos podem ter sido perdidos.
+const OFFLINE_STALE_TIME = 5 * 60 * 1000;
+const PING_TIMEOUT_MS = 60 * 1000; // a API manda ping a cada 25 s
+const RECONNECT_MS = 5000;
+
+let healthy = false;
+
+export const feedStaleTime = () => (healthy ? Infinity : OFFLINE_STALE_TIME);
+
+const sameCity = (name: unknown, event: ChangeEvent) =>
+  typeof name === 'string' &&
+  event.municipios.some((municipio) => municipio.localeCompare(name, 'pt-BR', { sensitivity: 'base' }) === 0);
+
+// Período do mapa ({} em status, { ano, mes? } nas demais) contra os meses gravados
+export const samePeriod = (periodo: unknown, event: ChangeEvent) => {
+  const { ano, mes } = (periodo ?? {}) as { ano?: number; mes?: number };
+  if (!event.meses || ano === undefined) return true;
+  return event.meses.some((anoMes) => {
+    const [eventAno, eventMes] = anoMes.split('-').map(Number);
+    return eventAno === ano && (mes === undefined || eventMes === mes);
+  });
+};
+
+// O que cada consulta lê, pela primeira parte da chave. Chaves fora da tabela (resumo, slideshow,
+// rankings, listas de cidades) dependem das duas entidades e são invalidadas a qualquer escrita.
+const AFFECTED_BY: Record<string, (key: QueryKey, event: ChangeEvent) => boolean> = {
+  pieChartData: (_, event) => event.entity === 'amplo-geral',
+  cityDetails: ([, cityName], event) => sameCity(cityName, event),
+  cityDetailsModal: ([, cityName], event) => sameCity(cityName, event),
+  byCidade: ([, cityName], event) => sameCity(cityName, event),
+  mapaMetrica: ([, metrica, periodo], event) =>
+    event.entity === 'amplo-geral' || (metrica !== 'status' && samePeriod(periodo, event)),
+};
+
+export const isAffected = (query: Pick<Query, 'queryKey'>, event: ChangeEvent) => {
+  const rule = AFFECTED_BY[String(query.queryKey[0])];
+  return rule ? rule(query.queryKey, event) : true;
+};
+
+export function startChangeFeed(queryClient: QueryClient) {
+  if (typeof EventSource === 'undefined') return () => {};
+
+  let source: EventSource | null = null;
+  let watchdog: ReturnType<typeof setTimeout> | undefined;
+  let reconnect: ReturnType<typeof setTimeout> | undefined;
+  let connectedBefore = false;
+  let stopped = false;
+
+  const retry = () => {
+    healthy = false;
+    clearTimeout(watchdog);
+    source?.close();
+    // Espalha as reconexões dos quiosques depois de uma queda da API
+    reconnect = setTimeout(connect, RECONNECT_MS + Math.random() * RECONNECT_MS);
+  };
+
+  const alive = () => {
+    clearTimeout(watchdog);
+    watchdog = setTimeout(retry, PING_TIMEOUT_MS); // conexão parada sem erro (proxy, rede)
+  };
+
+  function connect() {
+    if (stopped) return;
+    source = new EventSource(`${API_BASE_URL}events`);
+    source.onopen = () => {
+      if (connectedBefore) queryClient.invalidateQueries();
+      connectedBefore = true;
+      healthy = true;
+      alive();
+    };
+    source.addEventListener('ping', alive);
+    source.addEventListener('change', (message) => {
+      alive();
+      const event = JSON.parse((message as MessageEvent<string>).data) as ChangeEvent;
+      queryClient.invalidateQueries({ predicate: (query) => isAffected(query, event) });
+    });
+    source.onerror = () => {
+      healthy = false;
+      // CONNECTING: o navegador reconecta sozinho (retry enviado pela API); CLOSED (503, 404): por aqui
+      if (source?.readyState === EventSource.CLOSED) retry();
+    };
+  }
+
+  connect();
+  return () => {
+    stopped = true;
+    healthy = false;
+    clearTimeout(watchdog);
+    clearTimeout(reconnect);
+    source?.close();
+  };
+}
\ No newline at end of file
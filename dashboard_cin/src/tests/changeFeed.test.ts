@@ -0,0 +1,72 @@
+import { describe, expect, test } from 'vitest';
+import { isAffected, samePeriod } from '../services/changeFeed';
+import { ChangeEvent } from '../types';
+
+const produtividade: ChangeEvent = { entity: 'produtividade', ids: [10], municipios: ['Camaçari'], meses: ['2025-03'] };
+const amploGeral: ChangeEvent = { entity: 'amplo-geral', ids: [2], municipios: ['Salvador'] };
+
+const query = (...queryKey: unknown[]) => ({ queryKey });
+
+describe('samePeriod', () => {
+  test('matches the year and month of the written rows', () => {
+    expect(samePeriod({ ano: 2025, mes: 3 }, produtividade)).toBe(true);
+    expect(samePeriod({ ano: 2025, mes: 4 }, produtividade)).toBe(false);
+    expect(samePeriod({ ano: 2024, mes: 3 }, produtividade)).toBe(false);
+  });
+
+  test('a period without month matches any month of that year', () => {
+    expect(samePeriod({ ano: 2025 }, produtividade)).toBe(true);
+    expect(samePeriod({ ano: 2024 }, produtividade)).toBe(false);
+  });
+
+  test('checks every month in the event', () => {
+    const lote = { ...produtividade, meses: ['2024-12', '2025-01'] };
+    expect(samePeriod({ ano: 2025, mes: 1 }, lote)).toBe(true);
+    expect(samePeriod({ ano: 2024, mes: 12 }, lote)).toBe(true);
+    expect(samePeriod({ ano: 2025, mes: 2 }, lote)).toBe(false);
+  });
+
+  test('is conservative when the period or the months are unknown', () => {
+    expect(samePeriod({}, produtividade)).toBe(true);
+    expect(samePeriod(undefined, produtividade)).toBe(true);
+    expect(samePeriod({ ano: 2025, mes: 3 }, amploGeral)).toBe(true);
+  });
+});
+
+describe('isAffected', () => {
+  test('pie charts only depend on municipality writes', () => {
+    expect(isAffected(query('pieChartData'), amploGeral)).toBe(true);
+    expect(isAffected(query('pieChartData'), produtividade)).toBe(false);
+  });
+
+  test('city queries match the written municipality ignoring accents and case', () => {
+    for (const key of ['cityDetails', 'cityDetailsModal', 'byCidade']) {
+      expect(isAffected(query(key, 'camacari', 30), produtividade)).toBe(true);
+      expect(isAffected(query(key, 'CAMAÇARI'), produtividade)).toBe(true);
+      expect(isAffected(query(key, 'Salvador'), produtividade)).toBe(false);
+    }
+  });
+
+  test('city queries without a selected city are not affected', () => {
+    expect(isAffected(query('byCidade', undefined), produtividade)).toBe(false);
+  });
+
+  test('the status map only changes with municipality writes', () => {
+    expect(isAffected(query('mapaMetrica', 'status', {}), produtividade)).toBe(false);
+    expect(isAffected(query('mapaMetrica', 'status', {}), amploGeral)).toBe(true);
+  });
+
+  test('productivity maps follow the period of the written rows', () => {
+    expect(isAffected(query('mapaMetrica', 'produtividade', { ano: 2025, mes: 3 }), produtividade)).toBe(true);
+    expect(isAffected(query('mapaMetrica', 'faixa', { ano: 2025, mes: 5 }), produtividade)).toBe(false);
+    expect(isAffected(query('mapaMetrica', 'faixa', { ano: 2025 }), produtividade)).toBe(true);
+    expect(isAffected(query('mapaMetrica', 'faixa', { ano: 2024, mes: 3 }), amploGeral)).toBe(true);
+  });
+
+  test('keys outside the table are invalidated by any write', () => {
+    for (const key of ['dashboardSummary', 'slideshowData', 'topAndLeastCities', 'cities']) {
+      expect(isAffected(query(key), produtividade)).toBe(true);
+      expect(isAffected(query(key), amploGeral)).toBe(true);
+    }
+  });
+});
\ No newline at end of file
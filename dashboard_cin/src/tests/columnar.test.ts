@@ -0,0 +1,57 @@
+import { describe, expect, test } from 'vitest';
+import { decodeColumnar } from '../utils/columnar';
+
+// Os mesmos casos de api_cin/src/tests/wireFormat.test.ts: o que a API codifica volta igual aqui
+describe('decodeColumnar', () => {
+  test('decodes dictionary columns, including null codes', () => {
+    const encoded = {
+      $rows: 4,
+      columns: {
+        id: [1, 2, 3, 4],
+        status: { $dict: ['Aprovado', 'Reprovado'], codes: [0, 1, null, 0] },
+        data: { $dict: ['2025-01-02'], codes: [null, 0, null, null] },
+      },
+    };
+    expect(decodeColumnar(encoded)).toEqual([
+      { id: 1, status: 'Aprovado', data: null },
+      { id: 2, status: 'Reprovado', data: '2025-01-02' },
+      { id: 3, status: null, data: null },
+      { id: 4, status: 'Aprovado', data: null },
+    ]);
+  });
+
+  test('decodes an all-null column from an empty dictionary', () => {
+    expect(decodeColumnar({ $rows: 2, columns: { x: { $dict: [], codes: [null, null] } } })).toEqual([{ x: null }, { x: null }]);
+  });
+
+  test('decodes nested tables inside columns and envelopes', () => {
+    const encoded = {
+      data: {
+        $rows: 2,
+        columns: {
+          nome: ['Salvador', 'Camaçari'],
+          produtividades: [{ $rows: 2, columns: { dia: ['2025-03-01', '2025-03-02'], q: [5, 7] } }, []],
+        },
+      },
+      meta: { count: 2 },
+    };
+    expect(decodeColumnar(encoded)).toEqual({
+      data: [
+        { nome: 'Salvador', produtividades: [{ dia: '2025-03-01', q: 5 }, { dia: '2025-03-02', q: 7 }] },
+        { nome: 'Camaçari', produtividades: [] },
+      ],
+      meta: { count: 2 },
+    });
+  });
+
+  test('decodes a table with no columns into empty rows', () => {
+    expect(decodeColumnar({ $rows: 2, columns: {} })).toEqual([{}, {}]);
+    expect(decodeColumnar({ $rows: 0, columns: { id: [] } })).toEqual([]);
+  });
+
+  test('passes plain JSON through unchanged', () => {
+    const body = { data: [{ a: 1 }, { b: 2 }], meta: { count: 2 }, total: 3, vazio: [] };
+    expect(decodeColumnar(body)).toEqual(body);
+    expect(decodeColumnar(null)).toBeNull();
+  });
+});
\ No newline at end of file
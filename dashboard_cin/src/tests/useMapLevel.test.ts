@@ -0,0 +1,68 @@
+import { beforeEach, describe, expect, test, vi } from 'vitest';
+import { LARGURA_BAHIA_RAD, MAPA_NIVEIS } from '../data/mapas';
+import { mapLevelIndex, useMapLevel } from '../hooks/useMapLevel';
+
+// useRef fora de um componente: um único ref, como entre renderizações do mesmo mapa
+const ref = vi.hoisted(() => ({ current: 0 }));
+vi.mock('react', () => ({ useRef: () => ref }));
+
+// Escala da projeção que faz o estado ocupar larguraPx pixels com zoom 1 e densidade 1
+const scaleFor = (larguraPx: number) => larguraPx / LARGURA_BAHIA_RAD;
+
+describe('mapLevelIndex', () => {
+  test('levels are ordered from lightest to most detailed', () => {
+    const larguras = MAPA_NIVEIS.map((nivel) => nivel.larguraPx);
+    expect([...larguras].sort((a, b) => a - b)).toEqual(larguras);
+  });
+
+  test('picks the lightest level whose width covers the rendered state', () => {
+    MAPA_NIVEIS.forEach((nivel, indice) => {
+      expect(mapLevelIndex(scaleFor(nivel.larguraPx - 1), 1, 1)).toBe(indice);
+    });
+  });
+
+  test('moves to the next level just above each threshold', () => {
+    MAPA_NIVEIS.slice(0, -1).forEach((nivel, indice) => {
+      expect(mapLevelIndex(scaleFor(nivel.larguraPx + 1), 1, 1)).toBe(indice + 1);
+    });
+  });
+
+  test('stays on the most detailed level beyond the last threshold', () => {
+    const ultimo = MAPA_NIVEIS[MAPA_NIVEIS.length - 1];
+    expect(mapLevelIndex(scaleFor(ultimo.larguraPx * 10), 1, 1)).toBe(MAPA_NIVEIS.length - 1);
+  });
+
+  test('multiplies by zoom and device pixel ratio', () => {
+    const scale = scaleFor(MAPA_NIVEIS[0].larguraPx * 0.75);
+    expect(mapLevelIndex(scale, 1, 1)).toBe(0);
+    expect(mapLevelIndex(scale, 2, 1)).toBe(1);
+    expect(mapLevelIndex(scale, 1, 2)).toBe(1);
+  });
+
+  test('caps the density at 2 and treats a missing ratio as 1', () => {
+    const scale = scaleFor(MAPA_NIVEIS[0].larguraPx * 0.75);
+    expect(mapLevelIndex(scale, 1, 3)).toBe(mapLevelIndex(scale, 1, 2));
+    expect(mapLevelIndex(scale, 1, 0)).toBe(0);
+  });
+
+  test('the default dashboard map (800px, scale 2800) loads the lightest level', () => {
+    expect(mapLevelIndex(2800, 1, 1)).toBe(0);
+  });
+});
+
+describe('useMapLevel', () => {
+  beforeEach(() => {
+    ref.current = 0;
+    vi.stubGlobal('window', { devicePixelRatio: 1 });
+  });
+
+  test('returns the url of the chosen level', () => {
+    expect(useMapLevel(2800)).toBe(MAPA_NIVEIS[0].url);
+  });
+
+  test('never goes back to a lighter level after zooming out', () => {
+    const scale = scaleFor(MAPA_NIVEIS[0].larguraPx * 0.75);
+    expect(useMapLevel(scale, 4)).toBe(MAPA_NIVEIS[2].url);
+    expect(useMapLevel(scale, 1)).toBe(MAPA_NIVEIS[2].url);
+  });
+});
\ No newline at end of file
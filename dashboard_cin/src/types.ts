@@ -1,6 +1,7 @@
 export interface ApiResponse<T> {
   data: T;
-  meta?: { count: number };
+  // nextCursor só vem em listagens paginadas (?limit/?cursor); null indica a última página
+  meta?: { count: number; nextCursor?: number | null };
 }
 
 export interface City {
@@ -32,9 +33,15 @@ export interface City {
   populacao?: number;
 }
 
+// Colunas aceitas em ?fields= (produtividades_diarias inclui a relação); os demais campos não existem na tabela
+export type CityField = Exclude<keyof City, 'IF_VISITAS' | 'motivo' | 'colaborador' | 'populacao'>;
+
 export interface TopCity {
+  cin_amplo_geral_id?: number;
   nome_municipio: string;
   total_quantidade: number;
+  rank?: number;
+  percentile?: number;
   [key: string]: string | number | Date | null | undefined;
 }
 
@@ -91,6 +98,39 @@ export interface TopAndLeastCitiesResponse {
   leastCities: TopCity[];
 }
 
+export interface DashboardSummaryResponse {
+  generatedAt: string;
+  totalCities: number;
+  visited: VisitedCitiesResponse;
+  statusVisita: StatusVisitaBreakdownResponse;
+  statusPublicacao: StatusPublicacaoBreakdownResponse;
+  statusInstalacao: StatusInstalacaoBreakdownResponse;
+  monthly: MonthlyData[];
+  cities: City[];
+}
+
+// GET /dashboard/mapa: valores[i] é o valor da feature i de geo/bahia_municipios.json (e dos TopoJSON de public/mapas)
+export type MapaMetrica = 'status' | 'produtividade' | 'faixa';
+
+export interface MapaMetricaResponse {
+  metrica: MapaMetrica;
+  ano?: number;
+  mes?: number | null;
+  // status e faixa: valores são índices na legenda
+  legenda?: string[];
+  // produtividade: maior total do período, para a escala de cor
+  max?: number;
+  valores: (number | null)[];
+}
+
+// GET /events (SSE), event: change — uma escrita em amplo-geral ou produtividade
+export interface ChangeEvent {
+  entity: 'amplo-geral' | 'produtividade';
+  ids: number[];
+  municipios: string[];
+  meses?: string[]; // AAAA-MM das produtividades gravadas
+}
+
 export interface InstalledCityComparison {
   nome_municipio: string;
   total_quantidade: number;
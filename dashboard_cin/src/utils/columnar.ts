@@ -0,0 +1,35 @@
+// Decodificação do JSON colunar da API (Accept: application/vnd.dashdos.columnar+json).
+// Listas de objetos chegam como { $rows, columns: { campo: [...] } } e colunas de status como
+// { $dict, codes }; aqui voltam ao formato de linhas que os componentes já usam.
+
+export const COLUMNAR_MEDIA_TYPE = 'application/vnd.dashdos.columnar+json';
+
+type Dictionary = { $dict: string[]; codes: (number | null)[] };
+type Table = { $rows: number; columns: Record<string, unknown[] | Dictionary> };
+
+const isObject = (value: unknown): value is Record<string, unknown> =>
+  value !== null && typeof value === 'object' && !Array.isArray(value);
+
+const isTable = (value: Record<string, unknown>): value is Table => '$rows' in value && 'columns' in value;
+
+const decodeColumn = (column: unknown[] | Dictionary): unknown[] =>
+  Array.isArray(column) ? column.map(decodeColumnar) : column.codes.map((code) => (code === null ? null : column.$dict[code]));
+
+export function decodeColumnar(value: unknown): unknown {
+  if (Array.isArray(value)) return value.map(decodeColumnar);
+  if (!isObject(value)) return value;
+  if (isTable(value)) {
+    const keys = Object.keys(value.columns);
+    const columns = keys.map((key) => decodeColumn(value.columns[key]));
+    const rows = new Array(value.$rows);
+    for (let i = 0; i < value.$rows; i++) {
+      const row: Record<string, unknown> = {};
+      for (let j = 0; j < keys.length; j++) row[keys[j]] = columns[j][i];
+      rows[i] = row;
+    }
+    return rows;
+  }
+  const decoded: Record<string, unknown> = {};
+  for (const key of Object.keys(value)) decoded[key] = decodeColumnar(value[key]);
+  return decoded;
+}
\ No newline at end of file
@@ -0,0 +1,155 @@
+import { City, DashboardSummaryResponse } from '../types';
+
+// Derivações do resumo único de /dashboard/summary (ver useDashboardSummary)
+
+export interface MetricData {
+  producaoMensal: {
+    value: number;
+    trend: {
+      value: number;
+      label: string;
+      isPositive: boolean;
+    };
+  };
+  producaoAnual: {
+    value: number;
+    subtitle: string;
+    trend: {
+      value: number;
+      label: string;
+      isPositive: boolean;
+    };
+  };
+  cidadesContempladas: {
+    value: number;
+  };
+  cidadesInstaladas: {
+    value: number;
+    donutPercentage: number;
+  };
+}
+
+export function buildMetricData({ monthly, statusVisita, statusInstalacao }: DashboardSummaryResponse): MetricData {
+  const monthlyData = monthly || [];
+  const currentMonth = '2025-09';
+  const currentMonthData = monthlyData.find((d) => d.monthYear === currentMonth);
+  const previousMonthData = monthlyData.find((d) => d.monthYear === '2025-08');
+
+  const monthlyProduction = currentMonthData?.quantidade || 0;
+  const monthlyGrowth = previousMonthData
+    ? ((monthlyProduction - previousMonthData.quantidade) / previousMonthData.quantidade) * 100
+    : 0;
+
+  const annualProduction = monthlyData.reduce((sum, d) => sum + d.quantidade, 0);
+  const totalUntilPreviousMonth = monthlyData
+    .filter((d) => d.monthYear < currentMonth)
+    .reduce((sum, d) => sum + d.quantidade, 0);
+  const annualContribution = totalUntilPreviousMonth
+    ? (monthlyProduction / totalUntilPreviousMonth) * 100
+    : 0;
+
+  return {
+    producaoMensal: {
+      value: monthlyProduction,
+      trend: {
+        value: Number(monthlyGrowth.toFixed(1)),
+        label: 'vs. mês anterior',
+        isPositive: monthlyGrowth >= 0,
+      },
+    },
+    producaoAnual: {
+      value: annualProduction,
+      subtitle: `Mês atual: ${monthlyProduction.toLocaleString('pt-BR')}`,
+      trend: {
+        value: Number(annualContribution.toFixed(1)),
+        label: 'Contribuição mensal',
+        isPositive: true,
+      },
+    },
+    cidadesContempladas: {
+      value: statusVisita.totalCitiesWithStatus || 0,
+    },
+    cidadesInstaladas: {
+      value: statusInstalacao.totalCitiesWithStatus || 0,
+      donutPercentage: statusInstalacao.installedPercentage || 0,
+    },
+  };
+}
+
+export interface CardData {
+  [key: string]: {
+    percentage: number | null;
+    cities: City[] | null;
+  };
+}
+
+export interface ListsData {
+  visits: (City & { NOME: string; daysLeft: number })[];
+  installations: (City & { NOME: string; daysLeft: number })[];
+}
+
+export const buildCardData = (summary: DashboardSummaryResponse): CardData => ({
+  '343 Cidades': {
+    percentage: null,
+    cities: summary.cities || [],
+  },
+  Visitados: {
+    percentage: summary.visited.percentage ?? null,
+    cities: summary.visited.visitedCities ?? [],
+  },
+  Aprovados: {
+    percentage: summary.statusVisita.approvedPercentage ?? null,
+    cities: summary.statusVisita.approvedCities ?? [],
+  },
+  Reprovados: {
+    percentage: summary.statusVisita.rejectedPercentage ?? null,
+    cities: summary.statusVisita.rejectedCities ?? [],
+  },
+  Publicados: {
+    percentage: summary.statusPublicacao.publishedPercentage ?? null,
+    cities: summary.statusPublicacao.publishedCities ?? [],
+  },
+  Instalados: {
+    percentage: summary.statusInstalacao.installedPercentage ?? null,
+    cities: summary.statusInstalacao.installedCities ?? [],
+  },
+  'AG. Instalação': {
+    percentage: summary.statusInstalacao.awaitingPercentage ?? null,
+    cities: summary.statusInstalacao.awaitingInstallationCities ?? [],
+  },
+});
+
+export const buildListsData = (summary: DashboardSummaryResponse): ListsData => {
+  const amploData = Array.isArray(summary.cities) ? summary.cities : [];
+
+  const today = new Date('2025-09-18');
+  const sevenDaysFromNow = new Date(today.getTime() + 7 * 24 * 60 * 60 * 1000);
+
+  const visits = amploData
+    .filter(
+      (city: City) =>
+        city?.data_visita &&
+        new Date(city.data_visita) <= sevenDaysFromNow &&
+        new Date(city.data_visita) >= today
+    )
+    .map((city: City) => ({
+      ...city,
+      NOME: city.nome_municipio || 'Unknown',
+      daysLeft: Math.ceil((new Date(city.data_visita!).getTime() - today.getTime()) / (1000 * 60 * 60 * 24)),
+    }));
+
+  const installations = amploData
+    .filter(
+      (city: City) =>
+        city?.data_instalacao &&
+        new Date(city.data_instalacao) <= sevenDaysFromNow &&
+        new Date(city.data_instalacao) >= today
+    )
+    .map((city: City) => ({
+      ...city,
+      NOME: city.nome_municipio || 'Unknown',
+      daysLeft: Math.ceil((new Date(city.data_instalacao!).getTime() - today.getTime()) / (1000 * 60 * 60 * 24)),
+    }));
+
+  return { visits, installations };
+};
\ No newline at end of file
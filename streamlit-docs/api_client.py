@@ -0,0 +1,161 @@
+"""Cliente HTTP compartilhado pela documentação Streamlit para falar com a api_cin.
+
+Mantém um único ``requests.Session`` (pool keep-alive) entre os reruns do
+Streamlit, um cache em memória com TTL e limite de tamanho (LRU) chaveado por
+rota + parâmetros, e revalidação condicional via ETag/If-None-Match.
+
+Com ``columnar=True`` o cliente pede o JSON colunar da API (ver ``colunar.py``)
+e devolve o payload já decodificado no formato de linhas; gzip/br são
+descomprimidos pelo ``requests``.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import colunar
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 15.0)  # (conexão, leitura) em segundos
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class ApiResult:
+    status_code: int
+    payload: Any
+    cache_status: str  # "hit", "revalidated" (304), "miss" ou "bypass"
+    nbytes: int = 0
+    ttfb: float = 0.0
+    elapsed: float = 0.0
+    etag: Optional[str] = None
+    text: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+
+@dataclass
+class _CacheEntry:
+    expires_at: float
+    status_code: int
+    payload: Any
+    nbytes: int
+    etag: Optional[str] = None
+
+
+class ApiClient:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        cache_ttl: float = 60.0,
+        cache_size: int = 256,
+        pool_size: int = 10,
+        columnar: bool = False,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        accept = f"{colunar.MEDIA_TYPE}, application/json" if columnar else "application/json"
+        self.session.headers.update({"Accept": accept})
+
+        self._cache: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(route: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return route, items
+
+    def _lookup(self, key: CacheKey) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _store(self, key: CacheKey, entry: _CacheEntry) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get(
+        self,
+        route: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Tuple[float, float] | float] = None,
+        use_cache: bool = True,
+    ) -> ApiResult:
+        """GET em ``route`` (relativa a ``base_url``) usando o cache quando possível.
+
+        Respostas ainda dentro do TTL são servidas da memória; entradas vencidas
+        que possuem ETag são revalidadas com If-None-Match, e um 304 renova o TTL
+        sem transferir o corpo novamente. Erros de rede propagam como
+        ``requests.RequestException``.
+        """
+        key = self._key(route, params)
+        entry = self._lookup(key) if use_cache else None
+        now = time.monotonic()
+
+        if entry is not None and entry.expires_at > now:
+            return ApiResult(entry.status_code, entry.payload, "hit", entry.nbytes, etag=entry.etag)
+
+        headers: Dict[str, str] = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+
+        started = time.perf_counter()
+        response = self.session.get(
+            f"{self.base_url}/{route.lstrip('/')}",
+            params=params,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        elapsed = time.perf_counter() - started
+        ttfb = response.elapsed.total_seconds()
+
+        if response.status_code == 304 and entry is not None:
+            entry.expires_at = time.monotonic() + self.cache_ttl
+            self._store(key, entry)
+            return ApiResult(
+                entry.status_code, entry.payload, "revalidated", len(response.content),
+                ttfb, elapsed, entry.etag,
+            )
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        if colunar.MEDIA_TYPE in response.headers.get("Content-Type", ""):
+            payload = colunar.decode(payload)
+
+        etag = response.headers.get("ETag")
+        result = ApiResult(
+            response.status_code, payload, "miss" if use_cache else "bypass",
+            len(response.content), ttfb, elapsed, etag, response.text,
+        )
+        if use_cache and response.status_code == 200:
+            self._store(
+                key,
+                _CacheEntry(time.monotonic() + self.cache_ttl, response.status_code, payload, result.nbytes, etag),
+            )
+        return result
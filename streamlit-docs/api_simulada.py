@@ -0,0 +1,902 @@
+"""API simulada (sem Postgres) que imita as rotas GET ``/v1`` da api_cin.
+
+Gera dados sintéticos determinísticos no formato de ``cin_amplo_geral`` e
+``produtividade_diaria_cin`` (mesma semente -> mesmas respostas), com os nomes
+dos 417 municípios de ``dashboard_cin/geo/bahia_municipios.json`` quando o
+arquivo está disponível. As respostas seguem os formatos dos controllers (com
+ou sem o envelope ``{data, meta}`` do BaseController) e usam ETag/304 como o
+Express.
+
+Latência e tamanho de payload são configuráveis para medir cache, concorrência
+e renderização dos clientes de forma reproduzível numa só máquina. ``/events``
+mantém o feed de mudanças (SSE) aberto com pings e, com ``--mudancas-s``, publica
+mudanças sintéticas de produtividade para medir a carga das invalidações.
+
+Exemplo:
+    python api_simulada.py --porta 3000 --anos 3 --latencia-ms 40 --jitter-ms 20
+    python api_simulada.py --mudancas-s 30
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import product
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import colunar
+
+try:
+    import brotli
+except ImportError:  # dependência opcional: sem ela, só gzip
+    brotli = None
+
+GEOJSON_PATH = os.path.join(os.path.dirname(__file__), "..", "dashboard_cin", "geo", "bahia_municipios.json")
+MONTHS = [
+    "janeiro", "fevereiro", "março", "abril", "maio", "junho",
+    "julho", "agosto", "setembro", "outubro", "novembro", "dezembro",
+]
+
+
+def fold(text: str) -> str:
+    """Mesma normalização de ``normalizar_nome`` no Postgres: sem acento, minúscula, pontuação como espaço."""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", ascii_text).split())
+
+
+def trigrams(text: str) -> set:
+    return {f"  {word} "[i:i + 3] for word in text.split() for i in range(len(word) + 1)}
+
+
+def similarity(a: str, b: str) -> float:
+    """``similarity()`` do pg_trgm: trigramas em comum sobre a união."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta or tb else 0.0
+
+
+def search_cities(cities: List[Dict[str, Any]], term: str, mode: str = "fuzzy") -> List[Dict[str, Any]]:
+    """Imita ``searchMunicipios`` (api_cin/src/lib/municipioSearch.ts): filtro por modo e ordem por relevância."""
+    term = fold(term)
+    if not term:
+        return []
+    scored = []
+    for c in cities:
+        name = fold(c["nome_municipio"])
+        if mode == "exact":
+            matched = name == term
+        elif mode == "fuzzy" and len(term) < 3:
+            matched = name.startswith(term)
+        else:
+            matched = term in name or (mode == "fuzzy" and similarity(name, term) > 0.3)
+        if matched:
+            tier = 3 if name == term else 2 if name.startswith(term) else 1 if term in name else 0
+            scored.append((-(tier + similarity(name, term)), c["nome_municipio"], c))
+    return [c for *_, c in sorted(scored, key=lambda item: item[:2])]
+
+
+def iso(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def feature_names() -> List[str]:
+    """Nomes das features do GeoJSON do dashboard, na ordem do arquivo (vazio sem o arquivo)."""
+    try:
+        with open(GEOJSON_PATH, encoding="utf-8") as f:
+            return [feature["properties"]["NOME"] for feature in json.load(f)["features"]]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def load_names(count: int) -> List[str]:
+    names = sorted(set(feature_names()))[:count]
+    names += [f"Município {i:03d}" for i in range(len(names) + 1, count + 1)]
+    return names
+
+
+class Dataset:
+    """Tabelas sintéticas em memória, indexadas como o Postgres faria."""
+
+    def __init__(self, municipios: int, anos: int, ultimo_ano: int, seed: int) -> None:
+        rng = random.Random(seed)
+        self.ultimo_ano = ultimo_ano
+        self.cities: List[Dict[str, Any]] = []
+        # produtividade[cidade_id] = lista de (data, quantidade) em ordem cronológica
+        self.daily: Dict[int, List[Tuple[datetime, int]]] = {}
+        created = datetime(ultimo_ano - anos + 1, 1, 1, tzinfo=timezone.utc)
+
+        for city_id, name in enumerate(load_names(municipios), start=1):
+            cidade_visita = rng.random() < 0.6
+            visita = created + timedelta(days=rng.randint(0, 365 * anos - 1))
+            instalacao = visita + timedelta(days=rng.randint(7, 60))
+            instalado = rng.random() < 0.7
+            self.cities.append({
+                "id": city_id,
+                "nome_municipio": name,
+                "status_infra": rng.choice(["Fibra", "Rádio", "Satélite", "Pendente"]),
+                "cidade_visita": cidade_visita,
+                "periodo_visita": iso(visita) if cidade_visita else None,
+                "periodo_instalacao": iso(instalacao) if cidade_visita else None,
+                "data_visita": None if cidade_visita else iso(visita),
+                "data_instalacao": None if cidade_visita else iso(instalacao),
+                "status_visita": "Aprovado" if rng.random() < 0.85 else "Reprovado",
+                "status_publicacao": "publicado" if rng.random() < 0.75 else "aguardando_publicacao",
+                "status_instalacao": "instalado" if instalado else "aguardando_instalacao",
+                "publicacao": iso(visita - timedelta(days=rng.randint(10, 90))),
+                "createAt": iso(created),
+                "updateAt": iso(created),
+            })
+
+            # Municípios instalados produzem todo dia útil, com porte sorteado por cidade
+            base = rng.lognormvariate(3, 0.8) if instalado else 0
+            rows: List[Tuple[datetime, int]] = []
+            day = created
+            end = datetime(ultimo_ano, 12, 31, tzinfo=timezone.utc)
+            while base and day <= end:
+                if day.weekday() < 5:
+                    rows.append((day, max(0, int(rng.gauss(base, base * 0.3)))))
+                day += timedelta(days=1)
+            self.daily[city_id] = rows
+
+        self.by_name = {fold(c["nome_municipio"]): c for c in self.cities}
+        self.rows = sum(len(r) for r in self.daily.values())
+
+    def daily_json(
+        self,
+        city_id: int,
+        inicio: Optional[datetime] = None,
+        fim: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Produtividade de ``[inicio, fim)`` em ordem cronológica; ``limit`` fica com os dias mais recentes."""
+        rows = self.daily[city_id]
+        lo = bisect_left(rows, (inicio,)) if inicio else 0
+        hi = bisect_left(rows, (fim,)) if fim else len(rows)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return [
+            {
+                "id": city_id * 100000 + i,
+                "cin_amplo_geral_id": city_id,
+                "data": iso(day),
+                "quantidade": qtd,
+                "createAt": iso(day),
+                "updateAt": iso(day),
+            }
+            for i, (day, qtd) in enumerate(rows[lo:hi], start=lo)
+        ]
+
+    def totals(self, inicio: datetime, fim: datetime) -> Dict[int, int]:
+        # Todos os municípios, inclusive os que não produziram no intervalo [inicio, fim)
+        return {city_id: sum(q for d, q in rows if inicio <= d < fim) for city_id, rows in self.daily.items()}
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, body: Any) -> None:
+        super().__init__(str(body))
+        self.status = status
+        self.body = body
+
+
+class Stream:
+    """Resposta em streaming (``Transfer-Encoding: chunked``), como as rotas ``/export`` e ``/events`` da api_cin."""
+
+    def __init__(
+        self, content_type: str, filename: Optional[str], chunks: Iterator[bytes],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.content_type = content_type
+        self.filename = filename
+        self.chunks = chunks
+        self.headers = headers or {}
+
+
+EVENTS_HEARTBEAT_S = 25.0
+
+
+class ChangeFeed:
+    """Feed de ``/events`` como ``lib/changeFeed.ts``: ``retry``, ``ping`` a cada 25 s e eventos ``change``.
+
+    Os dados não mudam de verdade: com ``intervalo`` > 0, uma thread publica a cada ``intervalo``
+    segundos uma produtividade de município e mês sorteados, só para os clientes invalidarem.
+    """
+
+    def __init__(self, ds: "Dataset", intervalo: float, seed: int) -> None:
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.recent: Deque[Tuple[int, bytes]] = deque(maxlen=100)
+        if intervalo > 0:
+            threading.Thread(target=self._publish, args=(ds, intervalo, seed), daemon=True).start()
+
+    def _publish(self, ds: "Dataset", intervalo: float, seed: int) -> None:
+        rng = random.Random(seed)
+        while True:
+            time.sleep(intervalo)
+            city = rng.choice(ds.cities)
+            event = {
+                "entity": "produtividade",
+                "ids": [city["id"]],
+                "municipios": [city["nome_municipio"]],
+                "meses": [f"{ds.ultimo_ano}-{rng.randint(1, 12):02d}"],
+            }
+            frame = f"event: change\ndata: {json.dumps(event, ensure_ascii=False, separators=(',', ':'))}\n\n".encode("utf-8")
+            with self.cond:
+                self.seq += 1
+                self.recent.append((self.seq, frame))
+                self.cond.notify_all()
+
+    def stream(self) -> Stream:
+        def chunks() -> Iterator[bytes]:
+            yield b"retry: 5000\n\n"
+            with self.cond:
+                seen = self.seq
+            while True:
+                with self.cond:
+                    self.cond.wait_for(lambda: self.seq != seen, timeout=EVENTS_HEARTBEAT_S)
+                    frames = [frame for seq, frame in self.recent if seq > seen]
+                    seen = self.seq
+                yield b"".join(frames) or b"event: ping\ndata: {}\n\n"
+
+        return Stream(
+            "text/event-stream; charset=utf-8", None, chunks(),
+            {"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"},
+        )
+
+
+EXPORT_BATCH = 5000
+EXPORT_TYPES = {"ndjson": "application/x-ndjson; charset=utf-8", "csv": "text/csv; charset=utf-8"}
+
+
+def csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    return '"' + text.replace('"', '""') + '"' if any(c in text for c in ',"\r\n') else text
+
+
+def export_stream(name: str, formato: str, columns: List[str], rows: Iterator[Dict[str, Any]]) -> Stream:
+    """Codifica ``rows`` em lotes de ``EXPORT_BATCH`` linhas, como ``lib/exportStream.ts``."""
+    def chunks() -> Iterator[bytes]:
+        pending = ",".join(columns) + "\r\n" if formato == "csv" else ""
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == EXPORT_BATCH:
+                yield (pending + encode(batch)).encode("utf-8")
+                pending, batch = "", []
+        if batch or pending:
+            yield (pending + encode(batch)).encode("utf-8")
+
+    def encode(batch: List[Dict[str, Any]]) -> str:
+        if formato == "csv":
+            return "".join(",".join(csv_value(r.get(c)) for c in columns) + "\r\n" for r in batch)
+        return "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in batch)
+
+    return Stream(EXPORT_TYPES[formato], f"{name}.{formato}", chunks())
+
+
+def envelope(result: Any) -> Dict[str, Any]:
+    # Mesmo formato do BaseController
+    return {"data": result, "meta": {"count": len(result)} if isinstance(result, list) else {}}
+
+
+STATUS_VALUES: Dict[str, Tuple[str, ...]] = {
+    "status_visita": ("Aprovado", "Reprovado"),
+    "status_publicacao": ("publicado", "aguardando_publicacao"),
+    "status_instalacao": ("instalado", "aguardando_instalacao"),
+}
+
+
+def status_breakdown(ds: Dataset, dimensions: List[str], include_cities: bool) -> Dict[str, Any]:
+    """Mesmo formato do StatusBreakdownService: todas as combinações, inclusive as vazias."""
+    groups: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    for values in product(*(STATUS_VALUES[d] for d in dimensions)):
+        group: Dict[str, Any] = {"values": dict(zip(dimensions, values)), "count": 0, "percentage": 0}
+        if include_cities:
+            group["cities"] = []
+        groups[values] = group
+    for c in ds.cities:
+        group = groups[tuple(c[d] for d in dimensions)]
+        group["count"] += 1
+        if include_cities:
+            group["cities"].append({"id": c["id"], "nome_municipio": c["nome_municipio"], **{d: c[d] for d in dimensions}})
+    total = sum(g["count"] for g in groups.values())
+    for group in groups.values():
+        group["percentage"] = round(group["count"] / total * 100, 2) if total else 0
+    return {"dimensions": dimensions, "total": total, "groups": list(groups.values())}
+
+
+def breakdown(ds: Dataset, field: str, keys: Tuple[str, ...], include_cities: bool) -> Dict[str, Any]:
+    first, second = status_breakdown(ds, [field], include_cities)["groups"]
+    count_a, count_b, total_key, pct_a, pct_b, list_a, list_b = keys
+    result = {
+        count_a: first["count"], count_b: second["count"], total_key: first["count"] + second["count"],
+        pct_a: first["percentage"], pct_b: second["percentage"],
+    }
+    if include_cities:
+        result.update({list_a: first["cities"], list_b: second["cities"]})
+    return result
+
+
+def bool_param(query: Dict[str, str], name: str, default: bool) -> bool:
+    value = query.get(name)
+    if value is None:
+        return default
+    if value not in ("true", "false"):
+        raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": f"{name} deve ser true ou false"}})
+    return value == "true"
+
+
+def monthly(rows: List[Tuple[datetime, int]]) -> List[Dict[str, Any]]:
+    totals: Dict[str, int] = defaultdict(int)
+    for day, qtd in rows:
+        totals[day.strftime("%Y-%m")] += qtd
+    return [{"monthYear": k, "quantidade": v} for k, v in sorted(totals.items())]
+
+
+def year_range(ano: int) -> Tuple[datetime, datetime]:
+    return datetime(ano, 1, 1, tzinfo=timezone.utc), datetime(ano + 1, 1, 1, tzinfo=timezone.utc)
+
+
+def ranking(ds: Dataset, inicio: datetime, fim: datetime, limit: int) -> Dict[str, Any]:
+    """Mesmo formato do ProductivityRankingService (RANK e PERCENT_RANK do Postgres)."""
+    names = {c["id"]: c["nome_municipio"] for c in ds.cities}
+    totals = ds.totals(inicio, fim)
+    ordered = sorted(totals.values())
+    n = len(ordered)
+
+    def row(city_id: int) -> Dict[str, Any]:
+        total = totals[city_id]
+        below = bisect_left(ordered, total)
+        return {
+            "cin_amplo_geral_id": city_id,
+            "nome_municipio": names[city_id],
+            "total_quantidade": total,
+            "rank": n - bisect_right(ordered, total) + 1,
+            "percentile": round(below / (n - 1) * 100, 2) if n > 1 else 0,
+        }
+
+    top = sorted(totals, key=lambda i: (-totals[i], names[i]))[:limit]
+    least = sorted(totals, key=lambda i: (totals[i], names[i]))[:limit]
+    return {
+        "inicio": iso(inicio),
+        "fim": iso(fim),
+        "totalMunicipios": n,
+        "topCities": [row(i) for i in top],
+        "leastCities": [row(i) for i in least],
+    }
+
+
+MAPA_STATUS = ["Não Informado", "Instalado", "Publicado", "Ag. Instalação", "Ag. Publicação", "Aprovado", "Reprovado"]
+MAPA_FAIXAS = ["Sem produção", "Top 20%", "20-40%", "40-60%", "60-80%", "80-100%"]
+
+
+def status_code(city: Dict[str, Any]) -> int:
+    """Status mais avançado do município, como índice em ``MAPA_STATUS``."""
+    return (
+        1 if city["status_instalacao"] == "instalado" else
+        2 if city["status_publicacao"] == "publicado" else
+        3 if city["status_instalacao"] == "aguardando_instalacao" else
+        4 if city["status_publicacao"] == "aguardando_publicacao" else
+        5 if city["status_visita"] == "Aprovado" else
+        6 if city["status_visita"] == "Reprovado" else 0
+    )
+
+
+def mapa_metrica(ds: Dataset, features: List[str], metrica: str, ano: int, mes: Optional[int]) -> Dict[str, Any]:
+    """Mesmo formato do GetMapaMetricaService: um valor por feature do GeoJSON, na ordem do arquivo."""
+    cities = [ds.by_name.get(fold(name)) for name in features]
+    if metrica == "status":
+        return {"metrica": metrica, "legenda": MAPA_STATUS, "valores": [status_code(c) if c else 0 for c in cities]}
+
+    inicio, fim = year_range(ano) if mes is None else (
+        datetime(ano, mes, 1, tzinfo=timezone.utc),
+        datetime(ano + mes // 12, mes % 12 + 1, 1, tzinfo=timezone.utc),
+    )
+    totals = ds.totals(inicio, fim)
+    periodo = {"metrica": metrica, "ano": ano, "mes": mes}
+    if metrica == "produtividade":
+        valores = [totals[c["id"]] if c else None for c in cities]
+        return {**periodo, "max": max([0] + [v for v in valores if v is not None]), "valores": valores}
+
+    # NTILE(5) entre os que produziram, do maior total ao menor (empate pelo nome)
+    names = {c["id"]: c["nome_municipio"] for c in ds.cities}
+    producing = sorted((i for i, t in totals.items() if t > 0), key=lambda i: (-totals[i], names[i]))
+    size, extra = divmod(len(producing), 5)
+    faixa: Dict[int, int] = {}
+    start = 0
+    for tile in range(1, 6):
+        end = start + size + (1 if tile <= extra else 0)
+        faixa.update((i, tile) for i in producing[start:end])
+        start = end
+    return {**periodo, "legenda": MAPA_FAIXAS, "valores": [faixa.get(c["id"], 0) if c else None for c in cities]}
+
+
+def int_param(query: Dict[str, str], name: str, default: Optional[int] = None) -> int:
+    value = query.get(name)
+    if value is None:
+        if default is None:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": f"{name} é obrigatório"}})
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": f"{name} deve ser um número"}})
+
+
+CITY_FIELDS = (
+    "id", "nome_municipio", "status_infra", "cidade_visita", "periodo_visita", "periodo_instalacao",
+    "data_visita", "data_instalacao", "status_visita", "status_publicacao", "status_instalacao",
+    "publicacao", "createAt", "updateAt", "produtividades_diarias",
+)
+MAX_PAGE_SIZE = 500
+
+
+def date_param(query: Dict[str, str], name: str) -> Optional[datetime]:
+    value = query.get(name)
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": f"{name} deve estar em AAAA-MM-DD"}})
+
+
+def list_page(
+    ds: Dataset,
+    cities: List[Dict[str, Any]],
+    query: Dict[str, str],
+    with_produtividade: bool = False,
+    plain: bool = False,
+) -> Any:
+    """Mesmas regras de ``lib/listQuery.ts``: cursor por id, ``?fields=`` e recorte da produtividade.
+
+    Sem ``limit``/``cursor`` devolve o formato antigo; ``plain`` imita os controllers
+    que respondem a lista pura (só ganham o envelope quando paginados).
+    """
+    def bad(message: str) -> ApiError:
+        return ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": message}})
+
+    cursor = int_param(query, "cursor", 0)
+    limit = int_param(query, "limit") if "limit" in query else None
+    prod_limit = int_param(query, "produtividade_limit") if "produtividade_limit" in query else None
+    if ("cursor" in query and cursor < 1) or any(v is not None and not 1 <= v <= MAX_PAGE_SIZE for v in (limit, prod_limit)):
+        raise bad(f"cursor deve ser positivo e os limites entre 1 e {MAX_PAGE_SIZE}")
+    fields = [f for f in query["fields"].split(",") if f] if "fields" in query else None
+    if fields is not None and (not fields or any(f not in CITY_FIELDS for f in fields)):
+        raise bad("fields deve listar colunas de cin_amplo_geral")
+    inicio = date_param(query, "produtividade_inicio")
+    fim = date_param(query, "produtividade_fim")
+    if inicio and fim and fim < inicio:
+        raise bad("produtividade_fim deve ser >= produtividade_inicio")
+
+    # Páginas seguem o cursor por id; sem paginação vale a ordem recebida (ex.: relevância da busca)
+    rows = [c for c in cities if c["id"] > cursor]
+    if limit or "cursor" in query:
+        rows.sort(key=lambda c: c["id"])
+    page = rows[:limit] if limit else rows
+    include = "produtividades_diarias" in fields if fields else with_produtividade
+    keep = set(fields or CITY_FIELDS) | {"id"}
+    items = []
+    for c in page:
+        item = {k: v for k, v in c.items() if k in keep}
+        if include:
+            item["produtividades_diarias"] = ds.daily_json(
+                c["id"], inicio, fim + timedelta(days=1) if fim else None, prod_limit)
+        items.append(item)
+
+    if limit is None and "cursor" not in query:
+        return items if plain else envelope(items)
+    next_cursor = page[-1]["id"] if limit and len(rows) > limit else None
+    return {"data": items, "meta": {"count": len(items), "nextCursor": next_cursor}}
+
+
+def build_routes(ds: Dataset, feed: Optional[ChangeFeed] = None) -> Dict[str, Callable[[Dict[str, str], str], Any]]:
+    today = datetime.now(timezone.utc)
+    features = feature_names()
+
+    def in_window(value: Optional[str], start: datetime, end: datetime) -> bool:
+        return value is not None and start <= datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.000Z").replace(tzinfo=timezone.utc) <= end
+
+    def nome_municipio(q: Dict[str, str], _: str) -> Any:
+        term = q.get("nome_municipio", "")
+        if not fold(term):
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "Nome do município é obrigatório"}})
+        return list_page(ds, search_cities(ds.cities, term, "contains"), q, with_produtividade=True)
+
+    def autocomplete(q: Dict[str, str], _: str) -> Any:
+        term = q.get("query", "")
+        if not fold(term):
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "Query é obrigatória"}})
+        limit = int_param(q, "limit", 10)
+        return envelope([
+            {"id": c["id"], "nome_municipio": c["nome_municipio"]}
+            for c in search_cities(ds.cities, term, "fuzzy")[:limit]
+        ])
+
+    def visited(_: Dict[str, str], __: str) -> Any:
+        cities = [
+            {"id": c["id"], "nome_municipio": c["nome_municipio"], "periodo_visita": c["periodo_visita"]}
+            for c in ds.cities if c["periodo_visita"] is not None
+        ]
+        total = len(ds.cities)
+        return envelope({
+            "visitedCount": len(cities), "totalCities": total,
+            "percentage": round(len(cities) / total * 100, 2) if total else 0,
+            "visitedCities": cities,
+        })
+
+    def status_list(field: str, a: str, b: str) -> Callable[[Dict[str, str], str], Any]:
+        def handler(_: Dict[str, str], __: str) -> Any:
+            return {
+                "total_cities": len(ds.cities),
+                a: [c["nome_municipio"] for c in ds.cities if c[field] == a],
+                b: [c["nome_municipio"] for c in ds.cities if c[field] == b],
+            }
+        return handler
+
+    def status_visita(q: Dict[str, str], _: str) -> Any:
+        status = q.get("status_visita")
+        if status not in ("Aprovado", "Reprovado"):
+            raise ApiError(400, {"error": "status_visita deve ser Aprovado ou Reprovado"})
+        return list_page(ds, [c for c in ds.cities if c["status_visita"] == status], q, plain=True)
+
+    def visitas_proximas(q: Dict[str, str], _: str) -> Any:
+        end = today + timedelta(days=7)
+        return list_page(ds, [
+            c for c in ds.cities
+            if in_window(c["periodo_visita"] if c["cidade_visita"] else c["data_visita"], today, end)
+        ], q, plain=True)
+
+    def instalacoes_recentes(q: Dict[str, str], _: str) -> Any:
+        window = [c for c in ds.cities if in_window(c["periodo_instalacao"], today - timedelta(days=7), today)]
+        return list_page(ds, window, q, plain=True)
+
+    def mensal(q: Dict[str, str], _: str) -> Any:
+        city_id, ano = int_param(q, "cin_amplo_geral_id"), int_param(q, "ano")
+        if not 1 <= city_id <= len(ds.cities):
+            raise ApiError(400, {"error": "Município não encontrado em cin_amplo_geral"})
+        totals = [0] * 12
+        for day, qtd in ds.daily[city_id]:
+            if day.year == ano:
+                totals[day.month - 1] += qtd
+        return {"nome_municipio": ds.cities[city_id - 1]["nome_municipio"], "ano": ano, **dict(zip(MONTHS, totals))}
+
+    def matriz(q: Dict[str, str], _: str) -> Any:
+        ids = list(dict.fromkeys(int(v) for v in q.get("cin_amplo_geral_ids", "").split(",") if v.strip().isdigit()))
+        inicio, fim = int_param(q, "ano_inicio"), int_param(q, "ano_fim")
+        if not ids or not 0 <= fim - inicio < 10:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "Parâmetros da matriz inválidos"}})
+        if any(not 1 <= i <= len(ds.cities) for i in ids):
+            raise ApiError(404, {"error": {"code": "NOT_FOUND", "message": "Município não encontrado em cin_amplo_geral"}})
+        meses = [f"{ano}-{m:02d}" for ano in range(inicio, fim + 1) for m in range(1, 13)]
+        column = {mes: i for i, mes in enumerate(meses)}
+        rows = []
+        for city_id in ids:
+            valores = [0] * len(meses)
+            for day, qtd in ds.daily[city_id]:
+                i = column.get(day.strftime("%Y-%m"))
+                if i is not None:
+                    valores[i] += qtd
+            rows.append({
+                "cin_amplo_geral_id": city_id, "nome_municipio": ds.cities[city_id - 1]["nome_municipio"],
+                "total": sum(valores), "valores": valores,
+            })
+        return envelope({"ano_inicio": inicio, "ano_fim": fim, "meses": meses, "municipios": rows})
+
+    def year_ranking(q: Dict[str, str]) -> Dict[str, Any]:
+        return ranking(ds, *year_range(int_param(q, "ano")), int_param(q, "limit", 5))
+
+    def top_and_least(q: Dict[str, str], _: str) -> Any:
+        result = year_ranking(q)
+        return envelope({"topCities": result["topCities"], "leastCities": result["leastCities"]})
+
+    def ranking_route(q: Dict[str, str], _: str) -> Any:
+        try:
+            inicio = datetime.strptime(q.get("inicio", ""), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            fim = datetime.strptime(q.get("fim", ""), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "inicio e fim devem estar em AAAA-MM-DD"}})
+        limit = int_param(q, "limit", 5)
+        if fim < inicio or not 1 <= limit <= 100:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "fim deve ser >= inicio e limit entre 1 e 100"}})
+        # fim é inclusivo na URL
+        return envelope(ranking(ds, inicio, fim + timedelta(days=1), limit))
+
+    def by_cidade(_: Dict[str, str], rest: str) -> Any:
+        city = ds.by_name.get(fold(unquote(rest)))  # mesmo critério do modo "exact" da busca
+        if city is None:
+            raise ApiError(404, {"error": {"code": "NOT_FOUND", "message": "Cidade não encontrada"}})
+        rows = ds.daily[city["id"]]
+        return envelope({
+            "nome_municipio": city["nome_municipio"],
+            "totalProdutividade": sum(q for _, q in rows),
+            "monthlyProdutividade": monthly(rows),
+        })
+
+    def geral_mensal(q: Dict[str, str], _: str) -> Any:
+        result = monthly([row for rows in ds.daily.values() for row in rows])
+        limit = q.get("limit")
+        return envelope(result[: int(limit)] if limit else result)
+
+    def status_breakdown_route(q: Dict[str, str], _: str) -> Any:
+        dimensions = [d for d in q.get("por", "").split(",") if d]
+        if not dimensions or any(d not in STATUS_VALUES for d in dimensions) or len(set(dimensions)) != len(dimensions):
+            message = "por deve listar status distintos entre " + ", ".join(STATUS_VALUES)
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": message}})
+        return envelope(status_breakdown(ds, dimensions, bool_param(q, "incluir_cidades", True)))
+
+    def formato_param(q: Dict[str, str]) -> str:
+        formato = q.get("formato", "ndjson")
+        if formato not in EXPORT_TYPES:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "formato deve ser ndjson ou csv"}})
+        return formato
+
+    def export_amplo_geral(q: Dict[str, str], _: str) -> Any:
+        columns = [c for c in CITY_FIELDS if c != "produtividades_diarias"]
+        return export_stream("cin_amplo_geral", formato_param(q), columns, iter(ds.cities))
+
+    def export_produtividade(q: Dict[str, str], _: str) -> Any:
+        formato = formato_param(q)
+        inicio = date_param(q, "inicio")
+        fim = date_param(q, "fim")
+        if inicio and fim and fim < inicio:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "fim deve ser >= inicio"}})
+        city_id = int_param(q, "cin_amplo_geral_id") if "cin_amplo_geral_id" in q else None
+        cities = [c for c in ds.cities if city_id is None or c["id"] == city_id]
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            # Mesma ordem do cursor por id da api_cin
+            for c in cities:
+                for item in ds.daily_json(c["id"], inicio, fim + timedelta(days=1) if fim else None):
+                    yield {
+                        "id": item["id"], "cin_amplo_geral_id": c["id"], "nome_municipio": c["nome_municipio"],
+                        "data": item["data"], "quantidade": item["quantidade"],
+                    }
+
+        columns = ["id", "cin_amplo_geral_id", "nome_municipio", "data", "quantidade"]
+        return export_stream("produtividade_diaria_cin", formato, columns, rows())
+
+    def summary(q: Dict[str, str], r: str) -> Any:
+        monthly_totals = geral_mensal({}, "")["data"]
+        return envelope({
+            "generatedAt": iso(datetime.now(timezone.utc)),
+            "totalCities": len(ds.cities),
+            "visited": visited(q, r)["data"],
+            "statusVisita": routes["/amplo-geral/status-visita-breakdown"]({}, r)["data"],
+            "statusPublicacao": routes["/amplo-geral/status-publicacao-breakdown"]({}, r)["data"],
+            "statusInstalacao": routes["/amplo-geral/status-instalacao-breakdown"]({}, r)["data"],
+            "monthly": monthly_totals,
+            "cities": ds.cities,
+        })
+
+    def mapa(q: Dict[str, str], _: str) -> Any:
+        metrica = q.get("metrica", "status")
+        ano = int_param(q, "ano", today.year)
+        mes = int_param(q, "mes") if "mes" in q else None
+        if metrica not in ("status", "produtividade", "faixa") or not 2000 <= ano <= 2030 or not 1 <= (mes or 1) <= 12:
+            raise ApiError(400, {"error": {"code": "VALIDATION_ERROR", "message": "metrica, ano ou mes inválidos"}})
+        return envelope(mapa_metrica(ds, features, metrica, ano, mes))
+
+    routes: Dict[str, Callable[[Dict[str, str], str], Any]] = {
+        "/dashboard/summary": summary,
+        "/dashboard/mapa": mapa,
+        # Sem banco por trás: mesmo formato do GET /health/db, com o pool zerado
+        "/health/db": lambda q, r: envelope({
+            "primary": {"inUse": 0, "idle": 0, "open": 0, "waiting": 0,
+                        "acquireLatencyMs": {"count": 0, "avg": 0, "buckets": []}},
+            "replica": None,
+        }),
+        "/amplo-geral": lambda q, r: list_page(ds, ds.cities, q),
+        "/amplo-geral/nome-municipio": nome_municipio,
+        "/amplo-geral/autocomplete": autocomplete,
+        "/amplo-geral/export": export_amplo_geral,
+        "/produtividade-diaria/export": export_produtividade,
+        "/amplo-geral/visited-cities": visited,
+        "/amplo-geral/status-breakdown": status_breakdown_route,
+        "/amplo-geral/status-visita-breakdown": lambda q, r: envelope(breakdown(
+            ds, "status_visita",
+            ("approvedCount", "rejectedCount", "totalCitiesWithStatus", "approvedPercentage",
+             "rejectedPercentage", "approvedCities", "rejectedCities"), bool_param(q, "incluir_cidades", True))),
+        "/amplo-geral/status-publicacao-breakdown": lambda q, r: envelope(breakdown(
+            ds, "status_publicacao",
+            ("publishedCount", "awaitingCount", "totalCitiesWithStatus", "publishedPercentage",
+             "awaitingPercentage", "publishedCities", "awaitingPublicationCities"), bool_param(q, "incluir_cidades", True))),
+        "/amplo-geral/status-instalacao-breakdown": lambda q, r: envelope(breakdown(
+            ds, "status_instalacao",
+            ("installedCount", "awaitingCount", "totalCitiesWithStatus", "installedPercentage",
+             "awaitingPercentage", "installedCities", "awaitingInstallationCities"), bool_param(q, "incluir_cidades", True))),
+        "/amplo-geral/status-visita": status_visita,
+        "/amplo-geral/status-publicacao": status_list("status_publicacao", "publicado", "aguardando_publicacao"),
+        "/amplo-geral/status-instalacao": status_list("status_instalacao", "instalado", "aguardando_instalacao"),
+        "/amplo-geral/visitas-proximas": visitas_proximas,
+        "/amplo-geral/instalacoes-recentes": instalacoes_recentes,
+        "/produtividade/mensal": mensal,
+        "/produtividade/mensal/matriz": matriz,
+        "/produtividade/top-cities": lambda q, r: envelope(year_ranking(q)["topCities"]),
+        "/produtividade/least-cities": lambda q, r: envelope(year_ranking(q)["leastCities"]),
+        "/produtividade/ranking": ranking_route,
+        "/produtividade/top-and-least-cities": top_and_least,
+        "/produtividade/by-cidade/": by_cidade,
+        "/produtividade/geral-mensal": geral_mensal,
+    }
+    if feed is not None:
+        routes["/events"] = lambda q, r: feed.stream()
+    return routes
+
+
+def pad_rows(value: Any, extra: int) -> Any:
+    """Acrescenta ``extra`` bytes de enchimento a cada objeto de lista (simula colunas largas)."""
+    if isinstance(value, list):
+        return [pad_rows(v, extra) for v in value]
+    if isinstance(value, dict):
+        padded = {k: pad_rows(v, extra) for k, v in value.items()}
+        if "nome_municipio" in value or "quantidade" in value:
+            padded["_padding"] = "x" * extra
+        return padded
+    return value
+
+
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """``br`` (se o módulo brotli existir) ou ``gzip``, conforme o Accept-Encoding (q=0 recusa)."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(name.lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    return "gzip" if "gzip" in accepted else None
+
+
+def make_handler(args: argparse.Namespace, ds: Dataset) -> type:
+    routes = build_routes(ds, ChangeFeed(ds, args.mudancas_s, args.seed))
+    prefix_routes = [p for p in routes if p.endswith("/")]
+    rng = random.Random(args.seed)
+    rng_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        server_version = "api-simulada"
+
+        def log_message(self, fmt: str, *params: Any) -> None:
+            if args.verbose:
+                super().log_message(fmt, *params)
+
+        def send_json(self, status: int, body: Any) -> None:
+            # Mesma negociação da api_cin: JSON colunar por Accept, br/gzip por Accept-Encoding,
+            # com um ETag por representação
+            columnar = status == 200 and colunar.MEDIA_TYPE in self.headers.get("Accept", "")
+            payload = json.dumps(
+                colunar.encode(body) if columnar else body, ensure_ascii=False, separators=(",", ":"),
+            ).encode("utf-8")
+            encoding = negotiate_encoding(self.headers.get("Accept-Encoding", "")) if status == 200 else None
+            if encoding and len(payload) >= COMPRESSION_MIN_BYTES:
+                payload = brotli.compress(payload, quality=5) if encoding == "br" else gzip.compress(payload, 6)
+            else:
+                encoding = None
+            suffix = ("-c" if columnar else "") + (f"-{encoding}" if encoding else "")
+            etag = f'W/"{len(payload):x}-{hashlib.sha1(payload).hexdigest()[:27]}{suffix}"'
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Vary", "Accept, Accept-Encoding")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(status)
+            content_type = colunar.MEDIA_TYPE if columnar else "application/json"
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            if status == 200:
+                self.send_header("ETag", etag)
+                self.send_header("Vary", "Accept, Accept-Encoding")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def send_stream(self, stream: Stream) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", stream.content_type)
+            if stream.filename:
+                self.send_header("Content-Disposition", f'attachment; filename="{stream.filename}"')
+            for name, value in stream.headers.items():
+                self.send_header(name, value)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            try:
+                # write() bloqueia com o socket cheio: o próximo lote só é gerado quando o cliente lê
+                for chunk in stream.chunks:
+                    self.wfile.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            path = url.path
+            if not path.startswith("/v1/"):
+                return self.send_json(404, {"error": "Not found"})
+            path = path[len("/v1"):].rstrip("/") or "/"
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+            handler, rest = routes.get(path), ""
+            if handler is None:
+                for prefix in prefix_routes:
+                    if path.startswith(prefix):
+                        handler, rest = routes[prefix], path[len(prefix):]
+                        break
+            if handler is None:
+                return self.send_json(404, {"error": "Not found"})
+
+            if args.latencia_ms or args.jitter_ms:
+                with rng_lock:
+                    delay = args.latencia_ms + rng.uniform(0, args.jitter_ms)
+                time.sleep(delay / 1000)
+
+            try:
+                body = handler(query, rest)
+            except ApiError as e:
+                return self.send_json(e.status, e.body)
+            if isinstance(body, Stream):
+                return self.send_stream(body)
+            self.send_json(200, pad_rows(body, args.payload_extra) if args.payload_extra else body)
+
+        def do_OPTIONS(self) -> None:
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Headers", "*")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="API simulada da api_cin para benchmarks sem Postgres")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=3000)
+    parser.add_argument("--municipios", type=int, default=417)
+    parser.add_argument("--anos", type=int, default=1, help="Anos de histórico diário por município")
+    parser.add_argument("--ultimo-ano", type=int, default=2025, help="Último ano gerado (a dashboard consulta 2025)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latencia-ms", type=float, default=0.0, help="Latência fixa adicionada a cada resposta")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Latência extra aleatória (0..jitter)")
+    parser.add_argument("--payload-extra", type=int, default=0, help="Bytes de enchimento por linha nas listas")
+    parser.add_argument("--mudancas-s", type=float, default=0.0,
+                        help="Intervalo entre mudanças sintéticas em /events (0: só pings)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    ds = Dataset(args.municipios, args.anos, args.ultimo_ano, args.seed)
+    print(f"{len(ds.cities)} municípios, {ds.rows} linhas diárias geradas em {time.perf_counter() - started:.1f}s")
+
+    server = ThreadingHTTPServer((args.host, args.porta), make_handler(args, ds))
+    print(f"API simulada em http://{args.host}:{args.porta}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
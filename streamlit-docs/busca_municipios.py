@@ -0,0 +1,48 @@
+"""Índice de prefixos local para sugerir nomes de municípios sem ida à API.
+
+A lista de nomes é baixada uma vez (``GET /amplo-geral``, sem histórico de
+produtividade); cada tecla consulta apenas o índice em memória. Prefixos casam
+com o início de qualquer palavra do nome, ignorando acentos e caixa
+("santana" e "feira" sugerem "Feira de Santana").
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List, Tuple
+
+from nomes import normalize_name
+
+
+class PrefixIndex:
+    def __init__(self, names: Iterable[str]) -> None:
+        entries: List[Tuple[str, int, str]] = []
+        for name in set(names):
+            words = normalize_name(name).split()
+            # Uma entrada por início de palavra; a posição desempata a favor de quem começa com o prefixo
+            for position in range(len(words)):
+                entries.append((" ".join(words[position:]), position, name))
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len({name for _, _, name in self._entries})
+
+    def search(self, prefix: str, limit: int = 10) -> List[str]:
+        folded = normalize_name(prefix)
+        if not folded:
+            return []
+        matches: List[Tuple[int, str]] = []
+        i = bisect_left(self._keys, folded)
+        while i < len(self._keys) and self._keys[i].startswith(folded):
+            _, position, name = self._entries[i]
+            matches.append((position, name))
+            i += 1
+        seen = set()
+        result: List[str] = []
+        for _, name in sorted(matches, key=lambda m: (m[0], normalize_name(m[1]))):
+            if name not in seen:
+                seen.add(name)
+                result.append(name)
+                if len(result) >= limit:
+                    break
+        return result
@@ -0,0 +1,244 @@
+"""Carga em massa de produtividade diária via ``POST /v1/produtividade-diaria/lote``.
+
+Lê um CSV ou XLSX em blocos de tamanho fixo (sem carregar o arquivo inteiro),
+envia os blocos em paralelo com novas tentativas e backoff, e ao final informa
+linhas/s e as linhas rejeitadas (pelo loader ou pela API).
+
+Colunas esperadas: ``data``, ``quantidade`` e ``cin_amplo_geral_id`` ou
+``nome_municipio`` (resolvido uma única vez via ``GET /amplo-geral``).
+
+Exemplo:
+    python carga_produtividade.py produtividade.csv --token $API_TOKEN --lote 2000 --paralelo 4
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api_client import ApiClient
+from nomes import normalize_name
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+Row = Dict[str, Any]
+Chunk = List[Tuple[int, Row]]  # (linha no arquivo, registro)
+
+
+@dataclass
+class LoadReport:
+    sent: int = 0
+    inserted: int = 0
+    updated: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+    failed_chunks: int = 0
+
+
+def iter_rows(path: str) -> Iterator[Row]:
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise SystemExit("Leitura de XLSX requer openpyxl (pip install openpyxl)")
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        first = next(rows, None)
+        if first is None:
+            workbook.close()
+            raise SystemExit(f"{path}: planilha vazia (a primeira linha deve ter os nomes das colunas)")
+        header = [str(h).strip().lower() if h is not None else "" for h in first]
+        for values in rows:
+            yield dict(zip(header, values))
+        workbook.close()
+        return
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        if not sample.strip():
+            raise SystemExit(f"{path}: arquivo vazio (a primeira linha deve ter os nomes das colunas)")
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            # Uma coluna só, ou amostra ambígua: o arquivo não tem o formato esperado
+            raise SystemExit(
+                f"{path}: não foi possível identificar o separador (use , ; ou tab, com as colunas "
+                "data, quantidade e cin_amplo_geral_id ou nome_municipio)"
+            )
+        reader = csv.DictReader(f, dialect=dialect)
+        for row in reader:
+            yield {k.strip().lower(): v for k, v in row.items() if k}
+
+
+def iter_chunks(rows: Iterator[Row], size: int) -> Iterator[Chunk]:
+    chunk: Chunk = []
+    for line, row in enumerate(rows, start=2):  # linha 1 é o cabeçalho
+        chunk.append((line, row))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def format_date(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d")
+    text = str(value).strip()
+    if len(text) == 10 and text[2] == "/" and text[5] == "/":  # DD/MM/AAAA
+        return f"{text[6:]}-{text[3:5]}-{text[:2]}"
+    return text
+
+
+def build_payload(
+    chunk: Chunk, ids_by_name: Optional[Dict[str, int]]
+) -> Tuple[List[Row], List[int], List[Tuple[int, str]]]:
+    """``ids_by_name`` é None quando a lista de municípios não pôde ser carregada."""
+    payload: List[Row] = []
+    lines: List[int] = []
+    rejected: List[Tuple[int, str]] = []
+    for line, row in chunk:
+        municipio_id = row.get("cin_amplo_geral_id")
+        if not municipio_id and row.get("nome_municipio"):
+            if ids_by_name is None:
+                rejected.append((line, "Lista de municípios indisponível (GET /amplo-geral falhou); use cin_amplo_geral_id"))
+                continue
+            municipio_id = ids_by_name.get(normalize_name(str(row["nome_municipio"])))
+            if municipio_id is None:
+                rejected.append((line, f"Município desconhecido: {row['nome_municipio']}"))
+                continue
+        data = format_date(row.get("data"))
+        if not municipio_id or data is None or row.get("quantidade") in (None, ""):
+            rejected.append((line, "Campos obrigatórios ausentes (município, data, quantidade)"))
+            continue
+        payload.append({"cin_amplo_geral_id": municipio_id, "data": data, "quantidade": row["quantidade"]})
+        lines.append(line)
+    return payload, lines, rejected
+
+
+def post_chunk(
+    session: requests.Session, url: str, payload: List[Row], retries: int, timeout: float
+) -> Dict[str, Any]:
+    # O upsert é idempotente, então reenviar um bloco inteiro é seguro
+    for attempt in range(retries + 1):
+        try:
+            response = session.post(url, json=payload, timeout=timeout)
+            if response.status_code not in RETRY_STATUS:
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = {"error": response.text}
+                body["status_code"] = response.status_code
+                return body
+        except requests.RequestException as e:
+            if attempt == retries:
+                return {"status_code": None, "error": str(e)}
+        if attempt < retries:
+            time.sleep(min(2 ** attempt, 30))
+    return {"status_code": response.status_code, "error": response.text}
+
+
+def load(args: argparse.Namespace) -> LoadReport:
+    base_url = args.api.rstrip("/")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=args.paralelo, pool_maxsize=args.paralelo)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Authorization": f"Bearer {args.token}"})
+
+    ids_by_name: Optional[Dict[str, int]] = None
+    try:
+        result = ApiClient(base_url).get("/amplo-geral", timeout=30)
+        if result.ok:
+            ids_by_name = {normalize_name(c["nome_municipio"]): c["id"] for c in result.payload.get("data", [])}
+        else:
+            problem = f"HTTP {result.status_code}"
+    except requests.RequestException as e:
+        problem = str(e)
+    if ids_by_name is None:
+        print(
+            f"Aviso: não foi possível carregar os municípios (GET /amplo-geral: {problem}); "
+            "linhas identificadas só por nome_municipio serão rejeitadas",
+            file=sys.stderr,
+        )
+
+    url = f"{base_url}/produtividade-diaria/lote"
+    report = LoadReport()
+    started = time.perf_counter()
+    pending: Dict[Future, List[int]] = {}
+
+    def collect(done: Set[Future]) -> None:
+        for future in done:
+            lines = pending.pop(future)
+            body = future.result()
+            # 400 com "rejected" significa que nenhuma linha do bloco passou na validação da API
+            if body.get("status_code") != 200 and "rejected" not in body:
+                report.failed_chunks += 1
+                message = body.get("error") or f"HTTP {body.get('status_code')}"
+                report.rejected.extend((line, f"Bloco falhou: {message}") for line in lines)
+                continue
+            report.inserted += body.get("inserted", 0)
+            report.updated += body.get("updated", 0)
+            report.rejected.extend((lines[r["index"]], r["motivo"]) for r in body.get("rejected", []))
+
+    with ThreadPoolExecutor(max_workers=args.paralelo) as pool:
+        for chunk in iter_chunks(iter_rows(args.arquivo), args.lote):
+            payload, lines, rejected = build_payload(chunk, ids_by_name)
+            report.rejected.extend(rejected)
+            report.sent += len(chunk)
+            if payload:
+                pending[pool.submit(post_chunk, session, url, payload, args.tentativas, args.timeout)] = lines
+            # Limita os blocos em voo para manter a memória constante em arquivos grandes
+            if len(pending) >= args.paralelo * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            elapsed = time.perf_counter() - started
+            print(f"\r{report.sent} linhas lidas · {report.sent / max(elapsed, 1e-9):,.0f} linhas/s", end="", file=sys.stderr)
+        done, _ = wait(pending)
+        collect(done)
+
+    elapsed = time.perf_counter() - started
+    print(file=sys.stderr)
+    print(f"Linhas lidas: {report.sent} em {elapsed:.1f}s ({report.sent / max(elapsed, 1e-9):,.0f} linhas/s)")
+    print(f"Inseridas: {report.inserted} · Atualizadas: {report.updated} · Rejeitadas: {len(report.rejected)}")
+    if report.failed_chunks:
+        print(f"Blocos com falha após {args.tentativas} tentativas: {report.failed_chunks}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Carga em massa de produtividade diária na api_cin")
+    parser.add_argument("arquivo", help="CSV (separado por , ; ou tab) ou XLSX")
+    parser.add_argument("--api", default=os.getenv("API_BASE_URL", "http://localhost:3000/v1"))
+    parser.add_argument("--token", default=os.getenv("API_TOKEN"), help="JWT de um usuário ADMIN/DIRETORIA/CARTA")
+    parser.add_argument("--lote", type=int, default=2000, help="Linhas por requisição (máx. 5000)")
+    parser.add_argument("--paralelo", type=int, default=4, help="Requisições simultâneas")
+    parser.add_argument("--tentativas", type=int, default=3, help="Novas tentativas por bloco em erro de rede/5xx/429")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--rejeitados", default="rejeitados.csv", help="Arquivo de saída com as linhas rejeitadas")
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error("informe --token ou a variável API_TOKEN")
+    args.lote = max(1, min(args.lote, 5000))
+
+    report = load(args)
+    if report.rejected:
+        with open(args.rejeitados, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["linha", "motivo"])
+            writer.writerows(sorted(report.rejected))
+        print(f"Linhas rejeitadas gravadas em {args.rejeitados}")
+
+
+if __name__ == "__main__":
+    main()
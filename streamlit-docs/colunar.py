@@ -0,0 +1,67 @@
+"""JSON colunar da api_cin (``Accept: application/vnd.dashdos.columnar+json``).
+
+Espelha ``api_cin/src/lib/wireFormat.ts``: toda lista com pelo menos duas
+linhas-objeto com as mesmas chaves (na mesma ordem) vira
+``{"$rows": n, "columns": {campo: [...]}}``, e colunas de texto com poucos
+valores distintos (até ``MAX_DICTIONARY`` e no máximo metade das linhas) viram
+``{"$dict": [...], "codes": [...]}``. Chaves iniciadas por ``$`` são reservadas.
+
+``encode`` é usado pela ``api_simulada``; ``decode`` pelo ``ApiClient``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+MEDIA_TYPE = "application/vnd.dashdos.columnar+json"
+MAX_DICTIONARY = 256
+
+
+def _table_keys(rows: List[Any]) -> Optional[List[str]]:
+    if len(rows) < 2 or not all(isinstance(row, dict) for row in rows):
+        return None
+    keys = list(rows[0])
+    return keys if all(list(row) == keys for row in rows) else None
+
+
+def _encode_column(values: List[Any]) -> Any:
+    encoded = [encode(value) for value in values]
+    if not all(value is None or isinstance(value, str) for value in encoded):
+        return encoded
+    dictionary: Dict[str, int] = {}
+    for value in encoded:
+        if value is not None and value not in dictionary:
+            dictionary[value] = len(dictionary)
+        if len(dictionary) > MAX_DICTIONARY:
+            return encoded
+    if len(dictionary) * 2 > len(encoded):
+        return encoded
+    return {"$dict": list(dictionary), "codes": [None if value is None else dictionary[value] for value in encoded]}
+
+
+def encode(value: Any) -> Any:
+    if isinstance(value, list):
+        keys = _table_keys(value)
+        if keys is None:
+            return [encode(item) for item in value]
+        return {"$rows": len(value), "columns": {key: _encode_column([row[key] for row in value]) for key in keys}}
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode_column(column: Any) -> List[Any]:
+    if isinstance(column, dict):
+        dictionary = column["$dict"]
+        return [None if code is None else dictionary[code] for code in column["codes"]]
+    return [decode(item) for item in column]
+
+
+def decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "$rows" in value and "columns" in value:
+        keys = list(value["columns"])
+        columns = [_decode_column(value["columns"][key]) for key in keys]
+        return [dict(zip(keys, row)) for row in zip(*columns)] if keys else [{} for _ in range(value["$rows"])]
+    return {key: decode(item) for key, item in value.items()}
@@ -0,0 +1,161 @@
+"""Consumidor em streaming das rotas de exportação da api_cin.
+
+``GET /v1/amplo-geral/export`` e ``GET /v1/produtividade-diaria/export`` devolvem
+NDJSON ou CSV em pedaços, lidos do banco em lotes por cursor. Aqui a resposta é
+lida com ``requests`` em modo ``stream`` e nunca fica inteira em memória:
+
+* ``baixar`` grava os bytes direto em disco (arquivo ``.parcial`` renomeado no fim);
+* ``iterar_lotes`` entrega listas de dicionários de tamanho fixo (NDJSON);
+* ``iterar_dataframes`` / ``para_dataframe`` montam ``pandas.DataFrame`` lote a lote.
+
+Uma conexão cortada no meio (erro no servidor depois do primeiro lote) chega como
+``requests.exceptions.ChunkedEncodingError`` e o arquivo parcial é descartado.
+
+Requer ``pandas`` apenas para os DataFrames.
+
+Exemplo:
+    python exportacao.py produtividade-diaria --formato csv --inicio 2025-01-01 --fim 2025-03-31 --saida prod.csv
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from api_client import ApiClient
+
+try:
+    import pandas as pd
+except ImportError:  # dependência opcional
+    pd = None
+
+ROTAS = {
+    "amplo-geral": "/amplo-geral/export",
+    "produtividade-diaria": "/produtividade-diaria/export",
+}
+# Colunas convertidas para datetime (UTC) nos DataFrames
+DATE_COLUMNS = {
+    "data", "periodo_visita", "periodo_instalacao", "data_visita", "data_instalacao",
+    "publicacao", "createAt", "updateAt",
+}
+CHUNK_BYTES = 64 * 1024
+
+
+def _abrir(client: ApiClient, recurso: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+    if recurso not in ROTAS:
+        raise ValueError(f"recurso deve ser um de: {', '.join(ROTAS)}")
+    response = client.session.get(
+        f"{client.base_url}{ROTAS[recurso]}",
+        params={k: v for k, v in (params or {}).items() if v is not None},
+        headers={"Accept": "*/*"},
+        stream=True,
+        timeout=client.timeout,  # o timeout de leitura vale entre pedaços, não para o download inteiro
+    )
+    if not response.ok:
+        response.close()
+        response.raise_for_status()
+    return response
+
+
+def baixar(
+    client: ApiClient,
+    recurso: str,
+    destino: str,
+    formato: str = "ndjson",
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Grava a exportação em ``destino`` pedaço a pedaço e devolve o total de bytes."""
+    parcial = destino + ".parcial"
+    total = 0
+    with _abrir(client, recurso, {**(params or {}), "formato": formato}) as response:
+        try:
+            with open(parcial, "wb") as f:
+                for chunk in response.iter_content(CHUNK_BYTES):
+                    f.write(chunk)
+                    total += len(chunk)
+        except BaseException:
+            os.remove(parcial)
+            raise
+    os.replace(parcial, destino)
+    return total
+
+
+def iterar_lotes(
+    client: ApiClient,
+    recurso: str,
+    params: Optional[Dict[str, Any]] = None,
+    tamanho_lote: int = 10_000,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Linhas da exportação NDJSON em listas de até ``tamanho_lote`` dicionários."""
+    with _abrir(client, recurso, {**(params or {}), "formato": "ndjson"}) as response:
+        lote: List[Dict[str, Any]] = []
+        for line in response.iter_lines(CHUNK_BYTES):
+            if not line:
+                continue
+            lote.append(json.loads(line))
+            if len(lote) == tamanho_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+
+def iterar_dataframes(
+    client: ApiClient,
+    recurso: str,
+    params: Optional[Dict[str, Any]] = None,
+    tamanho_lote: int = 10_000,
+) -> Iterator["pd.DataFrame"]:
+    if pd is None:
+        raise RuntimeError("Instale pandas para montar DataFrames")
+    for lote in iterar_lotes(client, recurso, params, tamanho_lote):
+        df = pd.DataFrame.from_records(lote)
+        for column in DATE_COLUMNS.intersection(df.columns):
+            df[column] = pd.to_datetime(df[column], utc=True)
+        yield df
+
+
+def para_dataframe(
+    client: ApiClient,
+    recurso: str,
+    params: Optional[Dict[str, Any]] = None,
+    tamanho_lote: int = 10_000,
+) -> "pd.DataFrame":
+    """DataFrame completo, montado a partir dos lotes (o JSON nunca fica inteiro em memória)."""
+    frames = list(iterar_dataframes(client, recurso, params, tamanho_lote))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Exportação em streaming da api_cin para um arquivo")
+    parser.add_argument("recurso", choices=sorted(ROTAS))
+    parser.add_argument("--api", default=os.getenv("API_BASE_URL", "http://localhost:3000/v1"))
+    parser.add_argument("--formato", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--saida", help="Arquivo de destino (padrão: <recurso>.<formato>)")
+    parser.add_argument("--inicio", help="AAAA-MM-DD (produtividade-diaria)")
+    parser.add_argument("--fim", help="AAAA-MM-DD, inclusivo (produtividade-diaria)")
+    parser.add_argument("--municipio-id", type=int, help="cin_amplo_geral_id (produtividade-diaria)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Espera máxima entre pedaços (s)")
+    args = parser.parse_args(argv)
+
+    client = ApiClient(args.api, timeout=(3.05, args.timeout))
+    params = {"inicio": args.inicio, "fim": args.fim, "cin_amplo_geral_id": args.municipio_id}
+    destino = args.saida or f"{args.recurso}.{args.formato}"
+
+    started = time.perf_counter()
+    try:
+        total = baixar(client, args.recurso, destino, args.formato, params)
+    except requests.RequestException as e:
+        sys.exit(f"Falha na exportação: {e}")
+    elapsed = time.perf_counter() - started
+    print(f"{destino}: {total / 1024 / 1024:.1f} MB em {elapsed:.1f}s ({total / 1024 / 1024 / max(elapsed, 1e-9):.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""Normalização de nomes de municípios compartilhada pelos utilitários da documentação."""
+
+import unicodedata
+
+
+def normalize_name(name: str) -> str:
+    """Chave de comparação: sem acentos, minúscula e com espaços colapsados."""
+    folded = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return " ".join(folded.lower().split())
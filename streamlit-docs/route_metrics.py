@@ -0,0 +1,143 @@
+"""Medição ao vivo das rotas GET documentadas na página "Rotas da API".
+
+As rotas são chamadas em paralelo (``ThreadPoolExecutor``) através do
+``ApiClient`` compartilhado, cada uma com seu próprio timeout, e o histórico de
+latências fica em ``RollingStats`` para calcular p50/p95 ao longo da sessão.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import requests
+
+from api_client import ApiClient
+
+
+@dataclass(frozen=True)
+class RouteSpec:
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    timeout: float = 10.0
+
+    @property
+    def label(self) -> str:
+        if not self.params:
+            return self.path
+        query = "&".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.path}?{query}"
+
+
+# Mesmas rotas e parâmetros de exemplo usados na página "Rotas da API".
+# Rotas que varrem a tabela inteira recebem um timeout maior.
+DOCUMENTED_ROUTES: List[RouteSpec] = [
+    RouteSpec("/dashboard/summary", timeout=20.0),
+    RouteSpec("/dashboard/mapa", {"metrica": "produtividade", "ano": 2025}),
+    RouteSpec("/health/db"),
+    RouteSpec("/amplo-geral", {"fields": "nome_municipio,status_visita,status_publicacao,status_instalacao", "limit": 100}),
+    RouteSpec("/amplo-geral/nome-municipio", {"nome_municipio": "Salvador", "produtividade_limit": 90}),
+    RouteSpec("/amplo-geral/autocomplete", {"query": "camacari"}),
+    RouteSpec("/amplo-geral/visited-cities"),
+    RouteSpec("/amplo-geral/status-visita-breakdown"),
+    RouteSpec("/amplo-geral/status-publicacao-breakdown"),
+    RouteSpec("/amplo-geral/status-instalacao-breakdown"),
+    RouteSpec("/amplo-geral/status-breakdown", {"por": "status_visita,status_instalacao", "incluir_cidades": "false"}),
+    RouteSpec("/produtividade/top-cities", {"ano": 2025, "limit": 10}),
+    RouteSpec("/produtividade/geral-mensal", timeout=20.0),
+    RouteSpec("/produtividade/top-and-least-cities", {"ano": 2025, "limit": 5}),
+    RouteSpec("/produtividade/ranking", {"inicio": "2025-03-15", "fim": "2025-09-14", "limit": 5}),
+    RouteSpec("/produtividade/by-cidade/Salvador", timeout=15.0),
+    RouteSpec("/produtividade/mensal/matriz", {"cin_amplo_geral_ids": "1,2,3", "ano_inicio": 2024, "ano_fim": 2025}),
+]
+
+
+@dataclass
+class RouteSample:
+    route: RouteSpec
+    status_code: Optional[int]
+    ttfb_ms: float
+    total_ms: float
+    nbytes: int
+    rows: int
+    cache_status: str
+    error: Optional[str] = None
+
+
+def count_rows(payload: Any) -> int:
+    """Conta linhas no envelope ``{data, meta}`` da API (listas somadas dentro de objetos)."""
+    data = payload.get("data", payload) if isinstance(payload, dict) else payload
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        lists = [v for v in data.values() if isinstance(v, list)]
+        return sum(len(v) for v in lists) if lists else 1
+    return 0 if data is None else 1
+
+
+def probe_route(client: ApiClient, route: RouteSpec, use_cache: bool = True) -> RouteSample:
+    started = time.perf_counter()
+    try:
+        result = client.get(route.path, params=route.params or None, timeout=route.timeout, use_cache=use_cache)
+    except requests.RequestException as e:
+        elapsed = (time.perf_counter() - started) * 1000
+        return RouteSample(route, None, 0.0, elapsed, 0, 0, "erro", str(e))
+
+    return RouteSample(
+        route,
+        result.status_code,
+        result.ttfb * 1000,
+        result.elapsed * 1000,
+        result.nbytes,
+        count_rows(result.payload),
+        result.cache_status,
+        None if result.ok else result.text[:200],
+    )
+
+
+def probe_routes(
+    client: ApiClient,
+    routes: List[RouteSpec] = DOCUMENTED_ROUTES,
+    use_cache: bool = True,
+    max_workers: int = 8,
+) -> Dict[str, RouteSample]:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        samples = pool.map(lambda r: probe_route(client, r, use_cache), routes)
+        return {sample.route.path: sample for sample in samples}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil por interpolação linear entre os vizinhos mais próximos."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * pct / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+class RollingStats:
+    """Janela deslizante de latências (ms) por rota.
+
+    Respostas servidas do cache local do ``ApiClient`` (``cache_status == "hit"``) não entram:
+    não houve requisição, e o ~0 ms puxaria p50/p95 para baixo. Revalidações (304) contam.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def add(self, sample: RouteSample) -> None:
+        if sample.error is None and sample.cache_status != "hit":
+            self._samples.setdefault(sample.route.path, deque(maxlen=self.window)).append(sample.total_ms)
+
+    def count(self, path: str) -> int:
+        return len(self._samples.get(path, ()))
+
+    def p50(self, path: str) -> float:
+        return percentile(list(self._samples.get(path, ())), 50)
+
+    def p95(self, path: str) -> float:
+        return percentile(list(self._samples.get(path, ())), 95)
@@ -0,0 +1,76 @@
+"""Ida e volta do JSON colunar (``colunar.encode``/``colunar.decode``).
+
+Os casos são os mesmos de ``api_cin/src/tests/wireFormat.test.ts`` e
+``dashboard_cin/src/tests/columnar.test.ts``, para os três lados concordarem no formato.
+
+    python -m pytest streamlit-docs/test_colunar.py
+"""
+
+import json
+
+import pytest
+
+import colunar
+
+STATUS_ROWS = [
+    {"id": 1, "status": "Aprovado", "data": None},
+    {"id": 2, "status": "Reprovado", "data": "2025-01-02"},
+    {"id": 3, "status": None, "data": None},
+    {"id": 4, "status": "Aprovado", "data": None},
+]
+
+NESTED = {
+    "data": [
+        {"nome": "Salvador", "produtividades": [{"dia": "2025-03-01", "q": 5}, {"dia": "2025-03-02", "q": 7}]},
+        {"nome": "Camaçari", "produtividades": []},
+    ],
+    "meta": {"count": 2},
+}
+
+CASES = [
+    pytest.param(STATUS_ROWS, {
+        "$rows": 4,
+        "columns": {
+            "id": [1, 2, 3, 4],
+            "status": {"$dict": ["Aprovado", "Reprovado"], "codes": [0, 1, None, 0]},
+            "data": {"$dict": ["2025-01-02"], "codes": [None, 0, None, None]},
+        },
+    }, id="dicionario-com-nulos"),
+    pytest.param([{"x": None}, {"x": None}], {"$rows": 2, "columns": {"x": {"$dict": [], "codes": [None, None]}}}, id="coluna-so-nulos"),
+    pytest.param([{"nome": "A"}, {"nome": "B"}, {"nome": "C"}], {"$rows": 3, "columns": {"nome": ["A", "B", "C"]}}, id="texto-sem-repeticao"),
+    pytest.param(NESTED, {
+        "data": {
+            "$rows": 2,
+            "columns": {
+                "nome": ["Salvador", "Camaçari"],
+                "produtividades": [{"$rows": 2, "columns": {"dia": ["2025-03-01", "2025-03-02"], "q": [5, 7]}}, []],
+            },
+        },
+        "meta": {"count": 2},
+    }, id="tabelas-aninhadas"),
+    pytest.param([], [], id="lista-vazia"),
+    pytest.param([{"id": 1}], [{"id": 1}], id="uma-linha"),
+    pytest.param([{}, {}], {"$rows": 2, "columns": {}}, id="linhas-sem-chaves"),
+    pytest.param([{"a": 1}, {"b": 2}], [{"a": 1}, {"b": 2}], id="chaves-diferentes"),
+]
+
+
+@pytest.mark.parametrize("rows, encoded", CASES)
+def test_encode(rows, encoded):
+    assert colunar.encode(rows) == encoded
+
+
+@pytest.mark.parametrize("rows, encoded", CASES)
+def test_decode(rows, encoded):
+    assert colunar.decode(encoded) == rows
+
+
+@pytest.mark.parametrize("rows, encoded", CASES)
+def test_ida_e_volta_por_json(rows, encoded):
+    # Passa por texto, como na resposta HTTP: a ordem das chaves das linhas também precisa voltar
+    decoded = colunar.decode(json.loads(json.dumps(colunar.encode(rows))))
+    assert json.dumps(decoded) == json.dumps(rows)
+
+
+def test_decode_tabela_vazia():
+    assert colunar.decode({"$rows": 0, "columns": {"id": []}}) == []
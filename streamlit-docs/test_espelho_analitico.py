@@ -0,0 +1,60 @@
+"""Consultas do espelho analítico sobre um espelho Parquet montado em diretório temporário.
+
+    python -m pytest streamlit-docs/test_espelho_analitico.py
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("duckdb")
+
+from espelho_analitico import Consultas, Mirror  # noqa: E402
+
+AGORA = datetime(2025, 6, 1)
+
+
+def cidade(city_id: int, nome: str) -> dict:
+    return {
+        "id": city_id, "nome_municipio": nome, "status_infra": None, "cidade_visita": False,
+        "periodo_visita": None, "periodo_instalacao": None, "data_visita": None, "data_instalacao": None,
+        "status_visita": None, "status_publicacao": None, "status_instalacao": None, "publicacao": None,
+        "createAt": AGORA, "updateAt": AGORA,
+    }
+
+
+@pytest.fixture
+def consultas(tmp_path):
+    # 20 municípios: 12 com produção distinta em 2025 (10, 20, ..., 120) e 8 sem nenhum registro
+    mirror = Mirror(str(tmp_path))
+    mirror.upsert_cities([cidade(i, f"Cidade {i:02d}") for i in range(1, 21)])
+    mirror.upsert_produtividade([
+        {"id": i, "cin_amplo_geral_id": i, "data": datetime(2025, 3, 1), "quantidade": 10 * i,
+         "createAt": AGORA, "updateAt": AGORA}
+        for i in range(1, 13)
+    ])
+    mirror.flush()
+    return Consultas(str(tmp_path))
+
+
+def test_ranking_com_empate_em_zero(consultas):
+    ranking = consultas.ranking(2025, limit=3)
+
+    maiores = ranking[ranking["pos_desc"] <= 3].sort_values("pos_desc")
+    assert list(maiores["nome_municipio"]) == ["Cidade 12", "Cidade 11", "Cidade 10"]
+
+    # Empatadas em zero dividem o mesmo RANK(); a ponta de baixo desempata pelo nome
+    menores = ranking[ranking["pos_asc"] <= 3].sort_values("pos_asc")
+    assert list(menores["nome_municipio"]) == ["Cidade 13", "Cidade 14", "Cidade 15"]
+    assert list(menores["total_quantidade"]) == [0, 0, 0]
+    assert menores["posicao"].nunique() == 1
+
+    assert len(ranking) == 6
+
+
+def test_ranking_com_limite_maior_que_metade(consultas):
+    ranking = consultas.ranking(2025, limit=15)
+    # As pontas se sobrepõem: cada município aparece uma vez só
+    assert len(ranking) == 20
+    assert ranking["nome_municipio"].is_unique
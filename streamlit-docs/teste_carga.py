@@ -0,0 +1,259 @@
+"""Gerador de carga headless que reproduz o fan-out real das telas da dashboard.
+
+Cada cenário espelha as chamadas de ``dashboard_cin/src/services/api.ts`` feitas
+por uma tela: queries do TanStack Query que rodam em paralelo, cada uma com
+estágios sequenciais (``await`` encadeado) de chamadas simultâneas
+(``Promise.all``). Usuários virtuais entram em rampa, abrem telas sorteadas
+pelo peso do cenário e esperam um tempo de reflexão entre aberturas.
+
+O relatório JSON traz, por rota e por tela: contagem, vazão, taxa de erro,
+percentis e histograma de latência.
+
+A api_cin limita cada IP a 100 requisições a cada 15 minutos (``src/server.ts``);
+com os padrões daqui um único gerador passa disso em segundos. Rode contra uma
+instância com ``RATE_LIMIT_MAX=0`` (limite desligado). Respostas 429 que ainda
+aparecerem são contadas à parte (``rate_limited``) e ficam fora das latências,
+da vazão e da taxa de erro; telas com alguma chamada 429 também.
+
+Requer ``aiohttp`` (pip install aiohttp).
+
+Exemplo:
+    python teste_carga.py --usuarios 40 --rampa 30 --duracao 120 --cenarios cin=3,home=2,slideshow=1 --saida carga.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from route_metrics import percentile
+
+try:
+    import aiohttp
+except ImportError:  # dependência opcional
+    aiohttp = None
+
+Call = Tuple[str, Dict[str, Any]]
+Stage = List[Call]  # chamadas disparadas juntas (Promise.all)
+Query = List[Stage]  # estágios em sequência (awaits encadeados)
+
+VISITED = ("/amplo-geral/visited-cities", {})
+VISITA_BREAKDOWN = ("/amplo-geral/status-visita-breakdown", {})
+PUBLICACAO_BREAKDOWN = ("/amplo-geral/status-publicacao-breakdown", {})
+INSTALACAO_BREAKDOWN = ("/amplo-geral/status-instalacao-breakdown", {})
+SUMMARY = ("/dashboard/summary", {})
+GERAL_MENSAL = ("/produtividade/geral-mensal", {})
+MAPA = ("/dashboard/mapa", {"metrica": "status"})
+
+# Cada tela é um conjunto de queries disparadas ao montar o componente
+SCENARIOS: Dict[str, List[Query]] = {
+    # CinDashboardScreen (modo interativo) + MainSection + PieChartSection + HeatMapSection
+    "cin": [
+        [[SUMMARY]],  # cardData, listsData e metricData (useDashboardSummary)
+        [[("/produtividade/top-cities", {"ano": 2025, "limit": 10}), GERAL_MENSAL]],  # MainSection
+        [[VISITA_BREAKDOWN, PUBLICACAO_BREAKDOWN, INSTALACAO_BREAKDOWN]],  # PieChartSection
+        [[MAPA]],  # HeatMapSection
+    ],
+    # HomeScreen: metricData
+    "home": [
+        [[SUMMARY]],
+    ],
+    # HeatMapSection isolada: troca de métrica/período e clique em um município abrindo os detalhes
+    "heatmap": [
+        [[MAPA], [("/dashboard/mapa", {"metrica": "faixa", "ano": 2025, "mes": 3})], [("/amplo-geral/nome-municipio", {
+            "nome_municipio": "Salvador",
+            "fields": "nome_municipio,status_visita,status_publicacao,status_instalacao,data_visita,data_instalacao",
+        })]],
+    ],
+    # Slideshow -> CINTab
+    "slideshow": [
+        [[GERAL_MENSAL, ("/produtividade/top-and-least-cities", {"ano": 2025, "limit": 6}),
+          VISITA_BREAKDOWN, PUBLICACAO_BREAKDOWN, VISITED]],
+    ],
+}
+
+HISTOGRAM_BOUNDS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+RATE_LIMITED = 429
+
+
+@dataclass
+class Series:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    rate_limited: int = 0  # rejeições do rate limit: respostas rápidas que distorceriam as latências
+    status: Counter = field(default_factory=Counter)
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        count = len(self.latencies)
+        histogram: Dict[str, int] = {}
+        remaining = sorted(self.latencies)
+        for bound in HISTOGRAM_BOUNDS_MS:
+            inside = sum(1 for v in remaining if v <= bound)
+            histogram[f"<={bound}"] = inside
+            remaining = remaining[inside:]
+        histogram[f">{HISTOGRAM_BOUNDS_MS[-1]}"] = len(remaining)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / duration, 2) if duration else 0.0,
+            "latency_ms": {
+                "min": round(min(self.latencies), 2) if count else 0.0,
+                "mean": round(sum(self.latencies) / count, 2) if count else 0.0,
+                "p50": round(percentile(self.latencies, 50), 2),
+                "p90": round(percentile(self.latencies, 90), 2),
+                "p95": round(percentile(self.latencies, 95), 2),
+                "p99": round(percentile(self.latencies, 99), 2),
+                "max": round(max(self.latencies), 2) if count else 0.0,
+            },
+            "histogram_ms": histogram,
+            "status": {str(k): v for k, v in sorted(self.status.items(), key=lambda kv: str(kv[0]))},
+        }
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace, weights: Dict[str, int]) -> None:
+        self.args = args
+        self.base_url = args.api.rstrip("/")
+        self.weights = weights
+        self.routes: Dict[str, Series] = defaultdict(Series)
+        self.screens: Dict[str, Series] = defaultdict(Series)
+        self.deadline = 0.0
+
+    async def call(self, session: "aiohttp.ClientSession", call: Call) -> Any:
+        path, params = call
+        started = time.perf_counter()
+        status: Any
+        try:
+            async with session.get(f"{self.base_url}{path}", params=params or None) as response:
+                await response.read()
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = type(e).__name__
+        series = self.routes[path]
+        series.status[status] += 1
+        if status == RATE_LIMITED:
+            series.rate_limited += 1
+            return status
+        series.latencies.append((time.perf_counter() - started) * 1000)
+        if not (isinstance(status, int) and status < 400):
+            series.errors += 1
+        return status
+
+    async def run_query(self, session: "aiohttp.ClientSession", query: Query) -> List[Any]:
+        statuses: List[Any] = []
+        for stage in query:
+            statuses.extend(await asyncio.gather(*(self.call(session, c) for c in stage)))
+        return statuses
+
+    async def open_screen(self, session: "aiohttp.ClientSession", name: str) -> None:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(self.run_query(session, q) for q in SCENARIOS[name]))
+        statuses = [status for query in results for status in query]
+        series = self.screens[name]
+        if RATE_LIMITED in statuses:
+            series.status["rate_limited"] += 1
+            series.rate_limited += 1
+            return
+        series.latencies.append((time.perf_counter() - started) * 1000)
+        ok = all(isinstance(status, int) and status < 400 for status in statuses)
+        series.status["ok" if ok else "erro"] += 1
+        if not ok:
+            series.errors += 1
+
+    async def virtual_user(self, index: int) -> None:
+        if self.args.usuarios > 1:
+            await asyncio.sleep(self.args.rampa * index / (self.args.usuarios - 1))
+        # Um pool por usuário, com o limite de 6 conexões por host dos navegadores
+        connector = aiohttp.TCPConnector(limit_per_host=6)
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        names, weights = zip(*self.weights.items())
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            while time.monotonic() < self.deadline:
+                await self.open_screen(session, random.choices(names, weights)[0])
+                think = random.uniform(0.5, 1.5) * self.args.pensar
+                await asyncio.sleep(min(think, max(0.0, self.deadline - time.monotonic())))
+
+    async def run(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        self.deadline = started + self.args.duracao
+        await asyncio.gather(*(self.virtual_user(i) for i in range(self.args.usuarios)))
+        duration = time.monotonic() - started
+        all_routes = Series()
+        for series in self.routes.values():
+            all_routes.latencies.extend(series.latencies)
+            all_routes.errors += series.errors
+            all_routes.rate_limited += series.rate_limited
+            all_routes.status.update(series.status)
+        return {
+            "config": {
+                "api": self.base_url,
+                "usuarios": self.args.usuarios,
+                "rampa_s": self.args.rampa,
+                "pensar_s": self.args.pensar,
+                "duracao_s": self.args.duracao,
+                "cenarios": self.weights,
+            },
+            "duration_s": round(duration, 2),
+            "total": all_routes.summary(duration),
+            "routes": {path: s.summary(duration) for path, s in sorted(self.routes.items())},
+            "screens": {name: s.summary(duration) for name, s in sorted(self.screens.items())},
+        }
+
+
+def parse_weights(value: str) -> Dict[str, int]:
+    weights: Dict[str, int] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"cenário desconhecido: {name} (opções: {', '.join(SCENARIOS)})")
+        weights[name] = int(weight or 1)
+    return weights
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga com o fan-out de requisições das telas da dashboard")
+    parser.add_argument("--api", default=os.getenv("API_BASE_URL", "http://localhost:3000/v1"))
+    parser.add_argument("--usuarios", type=int, default=10, help="Usuários virtuais (dashboards abertas)")
+    parser.add_argument("--rampa", type=float, default=10.0, help="Segundos para todos os usuários entrarem")
+    parser.add_argument("--pensar", type=float, default=5.0, help="Tempo médio entre aberturas de tela (s)")
+    parser.add_argument("--duracao", type=float, default=60.0, help="Duração total do teste (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout por requisição (s)")
+    parser.add_argument("--cenarios", type=parse_weights, default=parse_weights("cin=2,home=1,heatmap=1,slideshow=1"),
+                        help=f"Pesos por cenário, ex.: cin=3,home=1 (opções: {', '.join(SCENARIOS)})")
+    parser.add_argument("--saida", help="Arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    if aiohttp is None:
+        sys.exit("teste_carga.py requer aiohttp (pip install aiohttp)")
+
+    report = asyncio.run(LoadTest(args, args.cenarios).run())
+    if report["total"]["rate_limited"]:
+        print(
+            f"aviso: {report['total']['rate_limited']} respostas 429 do rate limit ficaram fora das latências; "
+            "rode contra uma instância da api_cin com RATE_LIMIT_MAX=0",
+            file=sys.stderr,
+        )
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(output)
+        total = report["total"]
+        print(
+            f"{total['count']} requisições em {report['duration_s']}s · {total['throughput_rps']} req/s · "
+            f"p95 {total['latency_ms']['p95']} ms · erros {total['error_rate']:.2%} -> {args.saida}"
+        )
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()